@@ -1,6 +1,21 @@
+import contextlib
+import heapq
+import io
+import os
+import tempfile
 import textwrap
 import unittest
 from collections import Counter
+from itertools import groupby
+
+from common.profiling import run_parts
+from common.streaming import iter_records
+
+# Number of location IDs per column sorted in memory by the external sort, before they are written to a run file
+DEFAULT_RUN_SIZE = 1_000_000
+
+# Maximum number of run files merged at once, which bounds the number of open files and read buffers
+MAX_MERGE_FAN_IN = 64
 
 
 def solve_part_one(puzzle_input):
@@ -10,8 +25,18 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    first_list, second_list = parse_puzzle_input(puzzle_input)
-    return sum(abs(a - b) for a, b in zip(first_list, second_list))
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the input line by line.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    first_list, second_list = parse_lines(lines)
+    return get_total_distance(first_list, second_list)
 
 
 def solve_part_two(puzzle_input):
@@ -21,7 +46,87 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    first_list, second_list = parse_puzzle_input(puzzle_input)
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the input line by line.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    first_list, second_list = parse_lines(lines)
+    return get_similarity_score(first_list, second_list)
+
+
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, parsing and sorting the lists only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    first_list, second_list = parse_lines(puzzle_input)
+    return (
+        get_total_distance(first_list, second_list),
+        get_similarity_score(first_list, second_list),
+    )
+
+
+def solve_part_one_vectorized(puzzle_input):
+    """
+    Solve part one of the Advent of Code puzzle with NumPy, which is much faster for inputs with millions of lines.
+
+    :param puzzle_input: The input data as string
+    :return: Solution for part one
+    """
+    first_array, second_array = parse_puzzle_input_as_arrays(puzzle_input)
+    return get_total_distance_vectorized(first_array, second_array)
+
+
+def solve_part_two_vectorized(puzzle_input):
+    """
+    Solve part two of the Advent of Code puzzle with NumPy, which is much faster for inputs with millions of lines.
+
+    :param puzzle_input: The input data as string
+    :return: Solution for part two
+    """
+    first_array, second_array = parse_puzzle_input_as_arrays(puzzle_input)
+    return get_similarity_score_vectorized(first_array, second_array)
+
+
+def solve_part_one_external(lines, run_size=DEFAULT_RUN_SIZE):
+    """
+    Solve part one of the Advent of Code puzzle with an external merge sort, for inputs that don't fit in memory.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :param run_size: Number of location IDs per column kept in memory at once
+    :return: Solution for part one
+    """
+    with ExternalColumnSorter(run_size) as sorter:
+        sorter.add_lines(lines)
+        return get_total_distance(*sorter.iter_sorted_columns())
+
+
+def solve_part_two_external(lines, run_size=DEFAULT_RUN_SIZE):
+    """
+    Solve part two of the Advent of Code puzzle with an external merge sort, for inputs that don't fit in memory.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :param run_size: Number of location IDs per column kept in memory at once
+    :return: Solution for part two
+    """
+    with ExternalColumnSorter(run_size) as sorter:
+        sorter.add_lines(lines)
+        return get_similarity_score_merge_join(*sorter.iter_sorted_columns())
+
+
+def get_total_distance(first_list, second_list):
+    return sum(abs(a - b) for a, b in zip(first_list, second_list))
+
+
+def get_similarity_score(first_list, second_list):
     second_list_counter = Counter(second_list)
 
     similarity_score = 0
@@ -31,13 +136,66 @@ def solve_part_two(puzzle_input):
     return similarity_score
 
 
-def parse_puzzle_input(puzzle_input):
-    lines = puzzle_input.split("\n")
+def get_similarity_score_merge_join(sorted_first_ids, sorted_second_ids):
+    """
+    Same as get_similarity_score for sorted iterables, which are walked side by side instead of counted in memory.
+    """
+    second_id_counts = (
+        (location_id, sum(1 for _ in group)) for location_id, group in groupby(sorted_second_ids)
+    )
+    second_id, second_count = next(second_id_counts, (None, 0))
+
+    similarity_score = 0
+    for location_id, group in groupby(sorted_first_ids):
+        first_count = sum(1 for _ in group)
+        while second_id is not None and second_id < location_id:
+            second_id, second_count = next(second_id_counts, (None, 0))
+        if second_id == location_id:
+            similarity_score += location_id * first_count * second_count
+
+    return similarity_score
+
+
+def get_total_distance_vectorized(first_array, second_array):
+    import numpy as np
+
+    return int(np.abs(first_array - second_array).sum())
+
+
+def get_similarity_score_vectorized(first_array, second_array):
+    import numpy as np
+
+    # The occurrences of a number in the sorted second list are the range between its left and right insertion points
+    counts = np.searchsorted(second_array, first_array, side="right") - np.searchsorted(
+        second_array, first_array, side="left"
+    )
+    return int((first_array * counts).sum())
+
 
+def parse_puzzle_input_as_arrays(puzzle_input):
+    """
+    Parse both lists into sorted int64 arrays, with a single pass of NumPy over the whole string.
+    """
+    import numpy as np
+
+    location_ids = np.fromstring(puzzle_input, dtype=np.int64, sep=" ")
+    if location_ids.size % 2 != 0:
+        raise ValueError("Every line must consist of exactly two location IDs")
+
+    pairs = location_ids.reshape(-1, 2)
+    return np.sort(pairs[:, 0]), np.sort(pairs[:, 1])
+
+
+def parse_lines(lines):
+    """
+    Parse both lists without keeping the lines, so that only the location IDs themselves take up memory.
+
+    :param lines: The input data as string, or an iterable of lines
+    """
     first_list = []
     second_list = []
 
-    for line in lines:
+    for line in iter_records(lines):
         first_location_id, second_location_id = map(int, line.split())
 
         first_list.append(first_location_id)
@@ -49,15 +207,92 @@ def parse_puzzle_input(puzzle_input):
     return first_list, second_list
 
 
+class ExternalColumnSorter:
+    """
+    Sorts both columns of location IDs with an external merge sort.
+
+    The columns are read in runs of a fixed size, and every run is sorted in memory and written to a temporary file.
+    The sorted columns are then streamed by merging their run files, in several passes if there are too many of them.
+    Meant to be used as context manager, which removes the temporary files on exit.
+    """
+
+    def __init__(self, run_size=DEFAULT_RUN_SIZE, max_fan_in=MAX_MERGE_FAN_IN):
+        self._run_size = run_size
+        self._max_fan_in = max_fan_in
+        self._directory = tempfile.TemporaryDirectory()
+        self._run_paths = ([], [])
+        self._num_written_runs = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self._directory.cleanup()
+
+    def add_lines(self, lines):
+        columns = ([], [])
+
+        for line in iter_records(lines):
+            first_location_id, second_location_id = map(int, line.split())
+            columns[0].append(first_location_id)
+            columns[1].append(second_location_id)
+
+            if len(columns[0]) >= self._run_size:
+                self._spill_runs(columns)
+
+        if columns[0]:
+            self._spill_runs(columns)
+
+    def iter_sorted_columns(self):
+        """
+        Merge the runs of each column down to a number that can be merged at once, and stream that final merge.
+
+        :return: Tuple of two iterators over the sorted location IDs of each column
+        """
+        for run_paths in self._run_paths:
+            self._merge_runs_down(run_paths)
+
+        return tuple(self._iter_merged_runs(list(run_paths)) for run_paths in self._run_paths)
+
+    def _spill_runs(self, columns):
+        for column, run_paths in zip(columns, self._run_paths):
+            column.sort()
+            run_paths.append(self._write_run(column))
+            column.clear()
+
+    def _merge_runs_down(self, run_paths):
+        # Merging too many runs at once would need a file and a read buffer per run, so groups of runs are merged
+        # into longer runs first. The list of runs is updated in place, so that it never lists removed files.
+        while len(run_paths) > self._max_fan_in:
+            merged_run_paths = []
+            for i in range(0, len(run_paths), self._max_fan_in):
+                group = run_paths[i: i + self._max_fan_in]
+                merged_run_paths.append(self._write_run(self._iter_merged_runs(group)))
+                for path in group:
+                    os.remove(path)
+            run_paths[:] = merged_run_paths
+
+    def _write_run(self, location_ids):
+        path = os.path.join(self._directory.name, f"run_{self._num_written_runs}.txt")
+        self._num_written_runs += 1
+
+        with open(path, "w") as f:
+            f.writelines(f"{location_id}\n" for location_id in location_ids)
+
+        return path
+
+    @staticmethod
+    def _iter_merged_runs(run_paths):
+        with contextlib.ExitStack() as stack:
+            run_files = [stack.enter_context(open(path)) for path in run_paths]
+            yield from heapq.merge(*(map(int, run_file) for run_file in run_files))
+
+
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -80,6 +315,35 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 31
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (11, 31)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
+    def test_vectorized(self):
+        self.assertEqual(11, solve_part_one_vectorized(self.PUZZLE_INPUT))
+        self.assertEqual(31, solve_part_two_vectorized(self.PUZZLE_INPUT))
+
+    def test_external(self):
+        # Runs of two location IDs merged two at a time, so that there are several merge passes
+        with ExternalColumnSorter(run_size=2, max_fan_in=2) as sorter:
+            sorter.add_lines(io.StringIO(self.PUZZLE_INPUT))
+            first_column, second_column = sorter.iter_sorted_columns()
+            self.assertEqual([1, 2, 3, 3, 3, 4], list(first_column))
+            self.assertEqual([3, 3, 3, 4, 5, 9], list(second_column))
+
+            # The runs left after merging can be merged again
+            sorter.add_lines(["0 10"])
+            first_column, second_column = sorter.iter_sorted_columns()
+            self.assertEqual([0, 1, 2, 3, 3, 3, 4], list(first_column))
+            self.assertEqual([3, 3, 3, 4, 5, 9, 10], list(second_column))
+
+        self.assertEqual(11, solve_part_one_external(io.StringIO(self.PUZZLE_INPUT), run_size=4))
+        self.assertEqual(31, solve_part_two_external(io.StringIO(self.PUZZLE_INPUT), run_size=4))
+
+    def test_from_lines(self):
+        self.assertEqual(11, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(31, solve_part_two_from_lines(self.PUZZLE_INPUT.splitlines()))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,50 @@
+import random
+import unittest
+from collections import Counter
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 1000
+MIN_LOCATION_ID = 10000
+MAX_LOCATION_ID = 99999
+
+# Fraction of the second list that is taken from the first list, so that the similarity score is not zero
+SHARED_LOCATION_ID_RATIO = 0.3
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate two lists of location IDs, one pair per line.
+
+    Both answers are known, because the generator has the sorted lists at hand.
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+
+    first_list = [rng.randint(MIN_LOCATION_ID, MAX_LOCATION_ID) for _ in range(line_count)]
+    second_list = [
+        rng.choice(first_list)
+        if rng.random() < SHARED_LOCATION_ID_RATIO
+        else rng.randint(MIN_LOCATION_ID, MAX_LOCATION_ID)
+        for _ in range(line_count)
+    ]
+
+    first_list.sort()
+    second_list.sort()
+    total_distance = sum(abs(a - b) for a, b in zip(first_list, second_list))
+    second_list_counter = Counter(second_list)
+    similarity_score = sum(n * second_list_counter[n] for n in first_list)
+
+    rng.shuffle(first_list)
+    rng.shuffle(second_list)
+    puzzle_input = "\n".join(f"{a}   {b}" for a, b in zip(first_list, second_list))
+
+    return GeneratedInput(puzzle_input, total_distance, similarity_score)
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 1, generate_input(0.5, seed=1))
+
+    def test_reproducible(self):
+        self.assertEqual(generate_input(0.1, seed=2), generate_input(0.1, seed=2))
@@ -1,6 +1,10 @@
+import io
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+from common.streaming import iter_records
+
 
 def solve_part_one(puzzle_input):
     """
@@ -9,8 +13,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    reports = parse_puzzle_input(puzzle_input)
-    return len([report for report in reports if is_safe(report)])
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the reports one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    return sum(1 for report in parse_reports(lines) if is_safe(report))
 
 
 def solve_part_two(puzzle_input):
@@ -20,12 +33,64 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    reports = parse_puzzle_input(puzzle_input)
-    return len([report for report in reports if is_safe_with_problem_dampener(report)])
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the reports one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    return sum(1 for report in parse_reports(lines) if is_safe_with_problem_dampener(report))
+
+
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, parsing the reports only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    num_safe_reports = 0
+    num_safe_reports_with_problem_dampener = 0
 
+    for report in parse_reports(puzzle_input):
+        num_safe_reports += is_safe(report)
+        num_safe_reports_with_problem_dampener += is_safe_with_problem_dampener(report)
 
-def parse_puzzle_input(puzzle_input):
-    return [list(map(int, line.split())) for line in puzzle_input.split("\n")]
+    return num_safe_reports, num_safe_reports_with_problem_dampener
+
+
+def solve_part_one_vectorized(puzzle_input):
+    """
+    Solve part one of the Advent of Code puzzle with NumPy, checking all reports at once.
+
+    :param puzzle_input: The input data as string
+    :return: Solution for part one
+    """
+    levels, lengths = parse_puzzle_input_as_array(puzzle_input)
+    return int(get_safe_reports_vectorized(levels, lengths, False).sum())
+
+
+def solve_part_two_vectorized(puzzle_input):
+    """
+    Solve part two of the Advent of Code puzzle with NumPy, checking all reports at once.
+
+    :param puzzle_input: The input data as string
+    :return: Solution for part two
+    """
+    levels, lengths = parse_puzzle_input_as_array(puzzle_input)
+    return int(get_safe_reports_vectorized(levels, lengths, True).sum())
+
+
+def parse_reports(lines):
+    """
+    :param lines: The input data as string, or an iterable of lines
+    :return: Generator of the reports, parsed one at a time
+    """
+    return (list(map(int, line.split())) for line in iter_records(lines))
 
 
 def is_safe(report):
@@ -35,22 +100,131 @@ def is_safe(report):
     )
 
 
-def is_safe_with_problem_dampener(report):
-    reports_with_one_element_removed = [
-        report[:i] + report[i + 1:] for i in range(len(report))
-    ]
-    return any(is_safe(report) for report in reports_with_one_element_removed)
+def is_safe_with_problem_dampener(report, max_removed_levels=1):
+    """
+    Check whether the report is safe after removing at most the given number of levels.
+
+    Takes a single pass over the report per direction, in O(len(report) * max_removed_levels) time.
+    """
+    return any(
+        _can_be_made_monotonic(report, direction, max_removed_levels) for direction in (1, -1)
+    )
+
+
+def _can_be_made_monotonic(report, direction, max_removed_levels):
+    # min_removals[i] is the fewest levels to remove before level i, so that the levels kept up to and including level
+    # i change by 1 to 3 in the given direction. Kept neighbors are at most max_removed_levels + 1 apart, so only
+    # that many predecessors need to be checked.
+    min_removals = []
+
+    for i, level in enumerate(report):
+        # Removing all levels before this one is always possible
+        min_removals_for_level = i
+        for j in range(max(0, i - max_removed_levels - 1), i):
+            if 1 <= (level - report[j]) * direction <= 3:
+                min_removals_for_level = min(
+                    min_removals_for_level, min_removals[j] + i - j - 1
+                )
+        min_removals.append(min_removals_for_level)
+
+        # Without a level in the window that can still be kept, no later level can be reached in time
+        window = min_removals[-max_removed_levels - 1:]
+        if i > max_removed_levels and min(window) > max_removed_levels:
+            return False
+
+    # The levels after the last kept one are removed as well
+    num_levels = len(report)
+    return any(
+        min_removals[i] + num_levels - 1 - i <= max_removed_levels
+        for i in range(max(0, num_levels - max_removed_levels - 1), num_levels)
+    )
+
+
+def parse_puzzle_input_as_array(puzzle_input):
+    """
+    Parse all reports into a 2D array with one report per row, padded with zeros to the length of the longest one.
+
+    :return: Tuple of the padded levels and the number of levels of every report
+    """
+    import numpy as np
+
+    levels = np.fromstring(puzzle_input, dtype=np.int64, sep=" ")
+
+    # A level starts at every printable character that follows whitespace, so the length of a report is the number of
+    # level starts between two line breaks
+    characters = np.frombuffer(puzzle_input.encode("ascii"), dtype=np.uint8)
+    is_printable = characters > ord(" ")
+    level_starts = np.flatnonzero(is_printable & ~np.concatenate(([False], is_printable[:-1])))
+    line_breaks = np.flatnonzero(characters == ord("\n"))
+    num_level_starts_before_line_breaks = np.searchsorted(level_starts, line_breaks)
+    lengths = np.diff(
+        num_level_starts_before_line_breaks, prepend=0, append=len(level_starts)
+    )
+    lengths = lengths[lengths > 0]
+
+    padded_levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int64)
+    padded_levels[np.arange(padded_levels.shape[1]) < lengths[:, None]] = levels
+    return padded_levels, lengths
+
+
+def get_safe_reports_vectorized(levels, lengths, with_problem_dampener):
+    """
+    :param levels: Padded levels, one report per row, see parse_puzzle_input_as_array
+    :param lengths: Number of levels of every report
+    :param with_problem_dampener: Whether a report may be made safe by removing a single level
+    :return: Boolean array telling for every report whether it is safe
+    """
+    import numpy as np
+
+    num_reports, width = levels.shape
+    is_safe_report = np.zeros(num_reports, dtype=bool)
+    if width == 0:
+        return is_safe_report
+
+    # Difference j is between level j and j + 1, and doesn't exist past the end of the report
+    differences = np.diff(levels, axis=1)
+    is_existing_difference = np.arange(width - 1) < (lengths - 1)[:, None]
+
+    # Removing level r drops differences r - 1 and r, and bridges levels r - 1 and r + 1 with a new difference
+    removal_indices = np.arange(width)
+    is_existing_level = removal_indices < lengths[:, None]
+    bridges = np.zeros((num_reports, width), dtype=np.int64)
+    bridges[:, 1:-1] = levels[:, 2:] - levels[:, :-2]
+    needs_bridge = (removal_indices > 0) & (removal_indices < (lengths - 1)[:, None])
+
+    for direction in (1, -1):
+        steps = differences * direction
+        is_bad_difference = is_existing_difference & ((steps < 1) | (steps > 3))
+        is_safe_report |= ~is_bad_difference.any(axis=1)
+        if not with_problem_dampener:
+            continue
+
+        # Whether any of the differences up to, respectively from, difference j is bad
+        is_bad_up_to = np.logical_or.accumulate(is_bad_difference, axis=1)
+        is_bad_from = np.logical_or.accumulate(is_bad_difference[:, ::-1], axis=1)[:, ::-1]
+
+        # The differences kept when removing level r are the ones up to r - 2 and from r + 1
+        is_bad_before_removal = np.zeros((num_reports, width), dtype=bool)
+        is_bad_before_removal[:, 2:] = is_bad_up_to[:, :-1]
+        is_bad_after_removal = np.zeros((num_reports, width), dtype=bool)
+        is_bad_after_removal[:, :-2] = is_bad_from[:, 1:]
+
+        bridge_steps = bridges * direction
+        is_bad_bridge = needs_bridge & ((bridge_steps < 1) | (bridge_steps > 3))
+
+        is_safe_removal = is_existing_level & ~(
+                is_bad_before_removal | is_bad_after_removal | is_bad_bridge
+        )
+        is_safe_report |= is_safe_removal.any(axis=1)
+
+    return is_safe_report
 
 
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -73,6 +247,26 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 4
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (2, 4)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
+    def test_vectorized(self):
+        self.assertEqual(2, solve_part_one_vectorized(self.PUZZLE_INPUT))
+        self.assertEqual(4, solve_part_two_vectorized(self.PUZZLE_INPUT))
+
+    def test_problem_dampener_tolerance(self):
+        report = [1, 2, 9, 9, 3, 4]
+        self.assertFalse(is_safe_with_problem_dampener(report))
+        self.assertTrue(is_safe_with_problem_dampener(report, max_removed_levels=2))
+        self.assertTrue(is_safe_with_problem_dampener([9, 1, 2, 3, 4, 5]))
+        self.assertTrue(is_safe_with_problem_dampener([9, 8, 2, 3, 4, 5], max_removed_levels=2))
+        self.assertFalse(is_safe_with_problem_dampener([5, 1, 9], max_removed_levels=0))
+
+    def test_from_lines(self):
+        self.assertEqual(2, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(4, solve_part_two_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,72 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 1000
+MIN_LEVEL_COUNT = 5
+MAX_LEVEL_COUNT = 8
+
+
+def generate_input(scale, seed=0, level_count=None):
+    """
+    Generate reports that are either safe, safe after removing a single level, or unsafe.
+
+    Both answers are known, because the kind of every report is decided upfront.
+
+    :param level_count: Number of levels in every report, random between 5 and 8 (like the real input) if not given
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+
+    reports = []
+    safe_count = 0
+    dampened_safe_count = 0
+
+    for _ in range(line_count):
+        report_level_count = level_count or rng.randint(MIN_LEVEL_COUNT, MAX_LEVEL_COUNT)
+        report = _generate_safe_report(rng, report_level_count)
+        kind = rng.randrange(3)
+
+        if kind == 1:
+            # Repeating a level makes a single unsafe difference, which the Problem Dampener can remove
+            _repeat_level(report, rng.randrange(len(report)))
+            dampened_safe_count += 1
+        elif kind == 2 and len(report) >= 3:
+            # Two repeated levels that don't share a level can't both be removed by the Problem Dampener
+            first_index = rng.randrange(len(report) - 2)
+            second_index = rng.randrange(first_index + 2, len(report))
+            _repeat_level(report, second_index)
+            _repeat_level(report, first_index)
+        else:
+            safe_count += 1
+
+        reports.append(report)
+
+    puzzle_input = "\n".join(" ".join(map(str, report)) for report in reports)
+    return GeneratedInput(puzzle_input, safe_count, safe_count + dampened_safe_count)
+
+
+def _generate_safe_report(rng, level_count):
+    direction = rng.choice([-1, 1])
+    # Start far enough from zero that a decreasing report stays positive
+    level = rng.randint(1, 20) + (3 * level_count if direction == -1 else 0)
+    report = [level]
+
+    for _ in range(level_count - 1):
+        level += direction * rng.randint(1, 3)
+        report.append(level)
+
+    return report
+
+
+def _repeat_level(report, index):
+    report.insert(index, report[index])
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 2, generate_input(0.5, seed=1))
+
+    def test_known_answers_with_long_reports(self):
+        check_known_answers(self, 2024, 2, generate_input(0.05, seed=2, level_count=100))
@@ -1,6 +1,29 @@
+import mmap
+import os
+import tempfile
 import textwrap
 import unittest
 import re
+from collections import namedtuple
+from itertools import repeat
+
+from common.profiling import run_parts
+
+INSTRUCTION_PATTERN = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+# Proper prefix of an instruction at the end of a chunk, which might be completed by the next chunk
+PARTIAL_INSTRUCTION_PATTERN = re.compile(
+    rb"(?:m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:\(|n(?:'(?:t\(?)?)?)?)?)\Z"
+)
+
+# Number of bytes of the memory dump scanned at a time
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Result of scanning a byte range of the memory dump, for both states summing can be in at the start of the range.
+# The final state is None if the range doesn't contain a conditional instruction, as it is then the initial one.
+RangeSummary = namedtuple(
+    "RangeSummary", ["sum_if_enabled", "sum_if_disabled", "final_state", "num_carried_bytes"]
+)
 
 
 def solve_part_one(puzzle_input):
@@ -11,9 +34,9 @@ def solve_part_one(puzzle_input):
     :return: Solution for part one
     """
     instructions = parse_puzzle_input(puzzle_input)
-    filtered_instructions = [
+    filtered_instructions = (
         instruction for instruction in instructions if instruction[0] == "mul"
-    ]
+    )
     return create_sum_from_instructions(filtered_instructions)
 
 
@@ -28,17 +51,59 @@ def solve_part_two(puzzle_input):
     return create_sum_from_instructions(instructions)
 
 
-def parse_puzzle_input(puzzle_input):
-    pattern = r"mul\((\d+),(\d+)\)|do\(\)|don\'t\(\)"
-    instructions = []
+def solve_part_one_from_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Solve part one of the Advent of Code puzzle, scanning the memory dump in chunks.
+
+    :param path: Path of the memory dump
+    :param chunk_size: Number of bytes scanned at a time
+    :return: Solution for part one
+    """
+    return scan_file(path, False, chunk_size)
+
+
+def solve_part_two_from_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Solve part two of the Advent of Code puzzle, scanning the memory dump in chunks.
+
+    :param path: Path of the memory dump
+    :param chunk_size: Number of bytes scanned at a time
+    :return: Solution for part two
+    """
+    return scan_file(path, True, chunk_size)
+
+
+def solve_part_one_in_parallel(path, num_workers=None):
+    """
+    Solve part one of the Advent of Code puzzle, scanning ranges of the memory dump in parallel.
+
+    :param path: Path of the memory dump
+    :param num_workers: Number of worker processes, defaults to the number of cores
+    :return: Solution for part one
+    """
+    return scan_file_in_parallel(path, False, num_workers)
+
+
+def solve_part_two_in_parallel(path, num_workers=None):
+    """
+    Solve part two of the Advent of Code puzzle, scanning ranges of the memory dump in parallel.
+
+    :param path: Path of the memory dump
+    :param num_workers: Number of worker processes, defaults to the number of cores
+    :return: Solution for part two
+    """
+    return scan_file_in_parallel(path, True, num_workers)
+
 
-    for match in re.finditer(pattern, puzzle_input):
+def parse_puzzle_input(puzzle_input):
+    """
+    :return: Generator of the instructions, as ("mul", a, b), ("do()",) or ("don't()",)
+    """
+    for match in INSTRUCTION_PATTERN.finditer(puzzle_input.encode()):
         if match.group(1) is not None and match.group(2) is not None:
-            instructions.append(("mul", int(match.group(1)), int(match.group(2))))
+            yield "mul", int(match.group(1)), int(match.group(2))
         else:
-            instructions.append((match.group(0),))
-
-    return instructions
+            yield (match.group(0).decode(),)
 
 
 def create_sum_from_instructions(instructions):
@@ -56,15 +121,142 @@ def create_sum_from_instructions(instructions):
     return total_sum
 
 
+def scan_file(path, with_conditionals, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Sum up the multiplications of a memory dump, which is memory-mapped and scanned one chunk at a time.
+    """
+    with open(path, "rb") as f:
+        # Empty files can't be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+
+        scanner = MemoryScanner(with_conditionals)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+            for start in range(0, len(memory), chunk_size):
+                scanner.feed(memory[start: start + chunk_size])
+
+        return scanner.total_sum
+
+
+def scan_file_in_parallel(path, with_conditionals, num_workers=None, num_ranges=None):
+    """
+    Sum up the multiplications of a memory dump, which is split into ranges that are scanned in worker processes.
+
+    Whether summing is enabled only depends on the last conditional instruction, so every range is summarized for
+    both states at its start. The summaries are then combined from left to right, once the actual state at the start
+    of every range is known.
+
+    :param num_ranges: Number of ranges, defaults to one per worker
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0
+
+    num_workers = num_workers or os.cpu_count()
+    num_ranges = min(num_ranges or num_workers, size)
+    boundaries = [size * i // num_ranges for i in range(num_ranges + 1)]
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        summaries = list(
+            executor.map(
+                summarize_range,
+                repeat(path),
+                boundaries[:-1],
+                boundaries[1:],
+                repeat(with_conditionals),
+            )
+        )
+
+    scanner = MemoryScanner(with_conditionals)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        for summary, end in zip(summaries, boundaries[1:]):
+            if scanner.is_summing_enabled:
+                scanner.total_sum += summary.sum_if_enabled
+            else:
+                scanner.total_sum += summary.sum_if_disabled
+            if summary.final_state is not None:
+                scanner.is_summing_enabled = summary.final_state
+
+            # An instruction straddling the end of the range was left out by both ranges. The tail of an instruction
+            # never contains another instruction, so the next ranges didn't pick up anything from it either.
+            if summary.num_carried_bytes and end < size:
+                match = INSTRUCTION_PATTERN.match(memory, end - summary.num_carried_bytes)
+                if match:
+                    scanner.execute(match)
+
+    return scanner.total_sum
+
+
+def summarize_range(path, start, end, with_conditionals, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Scan a byte range of the memory dump, as if summing was enabled at its start.
+
+    Meant to be executed in a worker process, so everything returned is picklable.
+    """
+    scanner = MemoryScanner(with_conditionals)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as memory:
+        for chunk_start in range(start, end, chunk_size):
+            scanner.feed(memory[chunk_start: min(chunk_start + chunk_size, end)])
+
+    # Had summing been disabled at the start, the products before the first conditional wouldn't have been summed
+    return RangeSummary(
+        scanner.total_sum,
+        scanner.total_sum - scanner.sum_before_first_conditional,
+        scanner.is_summing_enabled if scanner.has_seen_conditional else None,
+        len(scanner.carry),
+    )
+
+
+class MemoryScanner:
+    """
+    Sums up the multiplications of corrupted memory that is fed to it in chunks of bytes.
+
+    An instruction may straddle two chunks, so the end of a chunk that could be the start of an instruction is carried
+    over to the next chunk. Instructions can't contain each other, so every instruction found in a chunk is complete.
+    """
+
+    def __init__(self, with_conditionals):
+        self._with_conditionals = with_conditionals
+        self.carry = b""
+        self.total_sum = 0
+        self.is_summing_enabled = True
+        # Products before the first conditional instruction, which are only summed if summing was enabled initially
+        self.sum_before_first_conditional = 0
+        self.has_seen_conditional = False
+
+    def feed(self, chunk):
+        memory = self.carry + chunk
+        last_end = 0
+
+        for match in INSTRUCTION_PATTERN.finditer(memory):
+            self.execute(match)
+            last_end = match.end()
+
+        partial_instruction = PARTIAL_INSTRUCTION_PATTERN.search(memory, last_end)
+        self.carry = partial_instruction.group(0) if partial_instruction else b""
+
+    def execute(self, match):
+        """
+        :param match: Match of INSTRUCTION_PATTERN
+        """
+        if match.group(1) is not None:
+            product = int(match.group(1)) * int(match.group(2))
+            if self.is_summing_enabled:
+                self.total_sum += product
+            if not self.has_seen_conditional:
+                self.sum_before_first_conditional += product
+        elif self._with_conditionals:
+            self.is_summing_enabled = match.group(0) == b"do()"
+            self.has_seen_conditional = True
+
+
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -86,6 +278,38 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 48
         self.assertEqual(expected_output, solve_part_two(puzzle_input))
 
+    def test_memory_scanner(self):
+        memory = b"xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+        # Every chunk size splits some instruction at every possible position
+        for chunk_size in range(1, len(memory) + 1):
+            for with_conditionals, expected_output in ((False, 161), (True, 48)):
+                scanner = MemoryScanner(with_conditionals)
+                for start in range(0, len(memory), chunk_size):
+                    scanner.feed(memory[start: start + chunk_size])
+                self.assertEqual(expected_output, scanner.total_sum)
+
+    def test_from_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "memory.txt")
+            with open(path, "w") as f:
+                f.write("mul(2,4)don't()mul(5,5)do()mul(11,8)\nmul(8,5)")
+            self.assertEqual(161, solve_part_one_from_file(path, chunk_size=3))
+            self.assertEqual(136, solve_part_two_from_file(path, chunk_size=3))
+
+    def test_in_parallel(self):
+        memory = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "memory.txt")
+            with open(path, "w") as f:
+                f.write(memory)
+            self.assertEqual(48, solve_part_two_in_parallel(path, num_workers=2))
+            # A range per byte, so that instructions straddle several ranges
+            for with_conditionals, expected_output in ((False, 161), (True, 48)):
+                self.assertEqual(
+                    expected_output,
+                    scan_file_in_parallel(path, with_conditionals, 2, len(memory)),
+                )
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
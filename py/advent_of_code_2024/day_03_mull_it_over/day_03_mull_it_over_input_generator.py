@@ -0,0 +1,70 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_CHARACTER_COUNT = 18443
+REAL_INPUT_LINE_COUNT = 6
+
+# Filler characters can't be part of any instruction, so they never combine with their neighbors into one
+FILLER_CHARACTERS = "!@#$%^&*[]{}<>?/+-_;:~ xyzwhy"
+
+# Almost-instructions that must not be picked up
+DECOYS = [
+    "mul[3,7]",
+    "mul(32,64]",
+    "mul ( 2 , 4 )",
+    "mul(4*",
+    "do_not_mul",
+    "don't_",
+    "do(x)",
+    "mul(6,9!",
+]
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate corrupted memory with valid instructions and decoys separated by filler characters.
+
+    Both answers are known, because the instructions are summed up as they are generated.
+    """
+    rng = random.Random(seed)
+    character_count = get_scaled_count(REAL_INPUT_CHARACTER_COUNT, scale)
+    newline_probability = REAL_INPUT_LINE_COUNT / REAL_INPUT_CHARACTER_COUNT
+
+    chunks = []
+    length = 0
+    sum_of_all_products = 0
+    sum_of_enabled_products = 0
+    is_enabled = True
+
+    while length < character_count:
+        choice = rng.random()
+        if choice < 0.5:
+            a, b = rng.randint(1, 999), rng.randint(1, 999)
+            chunk = f"mul({a},{b})"
+            sum_of_all_products += a * b
+            if is_enabled:
+                sum_of_enabled_products += a * b
+        elif choice < 0.6:
+            chunk = "do()"
+            is_enabled = True
+        elif choice < 0.7:
+            chunk = "don't()"
+            is_enabled = False
+        else:
+            chunk = rng.choice(DECOYS)
+
+        filler = "".join(rng.choices(FILLER_CHARACTERS, k=rng.randint(1, 12)))
+        if rng.random() < newline_probability * len(filler):
+            filler += "\n"
+
+        chunks.append(chunk + filler)
+        length += len(chunk) + len(filler)
+
+    return GeneratedInput("".join(chunks), sum_of_all_products, sum_of_enabled_products)
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 3, generate_input(0.5, seed=1))
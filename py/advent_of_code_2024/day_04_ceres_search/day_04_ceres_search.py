@@ -1,6 +1,10 @@
+import re
 import textwrap
 import unittest
-from pygame.math import Vector2 as Vector
+from collections import deque
+
+from common.grid import Grid
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -10,7 +14,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = puzzle_input.splitlines()
+    grid = Grid(puzzle_input.splitlines())
     word_search = WordSearch(grid, "XMAS")
     return word_search.get_count()
 
@@ -22,81 +26,158 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = puzzle_input.splitlines()
+    grid = Grid(puzzle_input.splitlines())
     word_search = XShapeWordSearch(grid, "MAS")
     return word_search.get_count()
 
 
 class WordSearch:
-    # List of direction vectors (delta x, delta y)
-    DIRECTIONS = [
-        Vector(0, -1),  # Up (vertical)
-        Vector(-1, 0),  # Left (horizontal)
-        Vector(1, 0),  # Right (horizontal)
-        Vector(0, 1),  # Down (vertical)
-        Vector(-1, -1),  # Top-Left Diagonal
-        Vector(-1, 1),  # Top-Right Diagonal
-        Vector(1, -1),  # Bottom-Left Diagonal
-        Vector(1, 1),  # Bottom-Right Diagonal
-    ]
-
     def __init__(self, grid, target_word):
         self._grid = grid
-        self._target_word = target_word
-
-        self._height = len(grid)
-        self._width = len(grid[0])
+        self._target_word = target_word.encode()
 
     def get_count(self):
-        start_positions = [
-            (x, y) for y in range(self._height) for x in range(self._width)
-        ]
-        count = 0
+        # Searching every line forwards and backwards covers all eight directions
+        reversed_word = self._target_word[::-1]
+        return sum(
+            count_occurrences(line, self._target_word) + count_occurrences(line, reversed_word)
+            for line in get_grid_lines(self._grid)
+        )
 
-        for x, y in start_positions:
-            for direction_delta in self.DIRECTIONS:
-                word_in_direction = self._get_word_in_direction(
-                    Vector(x, y), direction_delta
-                )
-                if word_in_direction == self._target_word:
-                    count += 1
 
-        return count
+class MultiWordSearch:
+    """
+    Counts many words at once, scanning every line of the grid a single time for all of them.
+    """
 
-    def _get_word_in_direction(self, start_position, direction_delta):
-        position = start_position
-        word = []
+    def __init__(self, grid, target_words):
+        self._grid = grid
+        self._target_words = list(target_words)
+
+        # Every word is searched forwards and backwards, which covers all eight directions. A palindrome is added
+        # twice, so that it is counted in both directions like by WordSearch.
+        self._automaton = AhoCorasickAutomaton()
+        for word_index, word in enumerate(self._target_words):
+            encoded_word = word.encode()
+            self._automaton.add_pattern(encoded_word, word_index)
+            self._automaton.add_pattern(encoded_word[::-1], word_index)
+        self._automaton.build()
+
+    def get_counts(self):
+        """
+        :return: Dict of every target word to its number of occurrences
+        """
+        counts = [0] * len(self._target_words)
+        for line in get_grid_lines(self._grid):
+            self._automaton.count_matches(line, counts)
+
+        return dict(zip(self._target_words, counts))
 
-        for i in range(len(self._target_word)):
-            if not (0 <= position.x < self._width and 0 <= position.y < self._height):
-                return ""
-            word.append(self._grid[int(position.y)][int(position.x)])
-            position += direction_delta
 
-        return "".join(word)
+class AhoCorasickAutomaton:
+    """
+    Finds all occurrences of many byte patterns in a single pass over a text.
+
+    The patterns form a trie. Every node has a failure link to the node of its longest proper suffix that is also in
+    the trie, which is followed when the next byte doesn't continue any pattern. Every node also lists the values of
+    the patterns ending at it or at any node of its failure chain.
+    """
+
+    def __init__(self):
+        self._transitions = [{}]
+        self._failure_links = [0]
+        self._outputs = [[]]
+
+    def add_pattern(self, pattern, value):
+        node = 0
+        for byte in pattern:
+            next_node = self._transitions[node].get(byte)
+            if next_node is None:
+                next_node = len(self._transitions)
+                self._transitions[node][byte] = next_node
+                self._transitions.append({})
+                self._failure_links.append(0)
+                self._outputs.append([])
+            node = next_node
+
+        self._outputs[node].append(value)
+
+    def build(self):
+        """
+        Compute the failure links, once all patterns are added.
+        """
+        # Breadth first, so that the failure link of a node is known before the ones of its children
+        nodes_to_visit = deque(self._transitions[0].values())
+        while nodes_to_visit:
+            node = nodes_to_visit.popleft()
+            for byte, child in self._transitions[node].items():
+                failure_link = self._failure_links[node]
+                while failure_link and byte not in self._transitions[failure_link]:
+                    failure_link = self._failure_links[failure_link]
+                self._failure_links[child] = self._transitions[failure_link].get(byte, 0)
+                self._outputs[child] = self._outputs[child] + self._outputs[self._failure_links[child]]
+                nodes_to_visit.append(child)
+
+    def count_matches(self, text, counts):
+        """
+        Add the number of matches per value to the counts, e.g. a list indexed by value.
+        """
+        transitions = self._transitions
+        failure_links = self._failure_links
+        outputs = self._outputs
+        node = 0
+
+        for byte in text:
+            while node and byte not in transitions[node]:
+                node = failure_links[node]
+            node = transitions[node].get(byte, 0)
+            for value in outputs[node]:
+                counts[value] += 1
+
+
+def get_grid_lines(grid):
+    """
+    Extract the lines of the grid in the four orientations: rows, columns, and both diagonals.
+
+    Taking every n-th cell of the flat cells, where n is the offset of a step in one orientation, follows a line of
+    that orientation. A step past the end of a line lands in the sentinel border, from where the slice continues with
+    the next line. So every slice contains many lines separated by sentinels, which no word can contain.
+
+    :return: List of byte strings, which together contain every line of every orientation once
+    """
+    cells = bytes(grid.cells)
+    steps = [grid.right, grid.down, grid.down + grid.right, grid.down + grid.left]
+    return [cells[start::step] for step in steps for start in range(step)]
+
+
+def count_occurrences(line, word):
+    """
+    Count the occurrences of the word in the line, including overlapping ones.
+    """
+    # Occurrences of a word can only overlap if a proper prefix of the word is also its suffix, e.g. "ABA"
+    can_overlap = any(word[:length] == word[-length:] for length in range(1, len(word)))
+    if not can_overlap:
+        return line.count(word)
+
+    return sum(1 for _ in re.finditer(b"(?=" + re.escape(word) + b")", line))
 
 
 class XShapeWordSearch(WordSearch):
     def get_count(self):
-        center_positions = [
-            (x, y)
-            for y in range(1, self._height - 1)
-            for x in range(1, self._width - 1)
-        ]
         assert len(self._target_word) == 3
-        start_char = self._target_word[0]
-        center_char = self._target_word[1]
-        end_char = self._target_word[2]
+        start_char, center_char, end_char = self._target_word
+        grid = self._grid
+        cells = grid.cells
         count = 0
 
-        for x, y in center_positions:
-            if self._grid[y][x] != center_char:
+        for index in grid.indices():
+            if cells[index] != center_char:
                 continue
 
-            top_left = self._grid[y - 1][x - 1]
-            top_right = self._grid[y - 1][x + 1]
-            bottom_left = self._grid[y + 1][x - 1]
-            bottom_right = self._grid[y + 1][x + 1]
+            top_left = cells[index + grid.up + grid.left]
+            top_right = cells[index + grid.up + grid.right]
+            bottom_left = cells[index + grid.down + grid.left]
+            bottom_right = cells[index + grid.down + grid.right]
             corner_characters = [top_left, top_right, bottom_left, bottom_right]
 
             if (
@@ -113,11 +194,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -144,6 +221,21 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 9
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_multi_word_search(self):
+        grid = Grid(self.PUZZLE_INPUT.splitlines())
+        # Including a word and its reverse, a palindrome, overlapping words and a word that isn't in the grid
+        words = ["XMAS", "SAMX", "MAS", "AMA", "MM", "A", "QUIZ"]
+        self.assertEqual(
+            {word: WordSearch(grid, word).get_count() for word in words},
+            MultiWordSearch(grid, words).get_counts(),
+        )
+
+    def test_overlapping_words(self):
+        grid = Grid(["AAA", "AAA"])
+        # Forwards and backwards: 4 horizontal, 3 vertical and 4 diagonal occurrences
+        self.assertEqual(22, WordSearch(grid, "AA").get_count())
+        self.assertEqual(4, WordSearch(grid, "AAA").get_count())
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,25 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_side
+
+REAL_INPUT_SIDE = 140
+LETTERS = "XMAS"
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate a square word search made up of the letters of XMAS.
+    """
+    rng = random.Random(seed)
+    side = get_scaled_side(REAL_INPUT_SIDE, scale)
+
+    rows = ["".join(rng.choices(LETTERS, k=side)) for _ in range(side)]
+    return GeneratedInput("\n".join(rows))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        rows = generate_input(4).puzzle_input.splitlines()
+        self.assertEqual(2 * REAL_INPUT_SIDE, len(rows))
+        self.assertTrue(all(len(row) == 2 * REAL_INPUT_SIDE for row in rows))
@@ -1,6 +1,21 @@
+import os
 import textwrap
 import unittest
-from collections import defaultdict, deque
+from collections import defaultdict, deque, namedtuple
+from functools import cmp_to_key
+
+from common.profiling import run_parts
+
+# Number of updates a worker process classifies per task
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Middle pages of the updates that are already ordered and of the other updates once reordered, in input order
+UpdateClassification = namedtuple(
+    "UpdateClassification", ["ordered_middle_pages", "reordered_middle_pages"]
+)
+
+# Rule index of the worker process, set once per worker by the initializer of the pool
+_worker_rule_index = None
 
 
 def solve_part_one(puzzle_input):
@@ -27,6 +42,40 @@ def solve_part_two(puzzle_input):
     return updates_checker.get_sum_of_reordered_updates()
 
 
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, parsing the rules and updates only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    rules, updates = parse_input(puzzle_input)
+    classification = UpdatesChecker(rules, updates).classify_updates()
+    return (
+        sum(classification.ordered_middle_pages),
+        sum(classification.reordered_middle_pages),
+    )
+
+
+def solve_both_in_parallel(puzzle_input, num_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Solve both parts of the Advent of Code puzzle, classifying chunks of the updates in worker processes.
+
+    :param puzzle_input: The input data as string
+    :param num_workers: Number of worker processes, defaults to the number of cores
+    :param chunk_size: Number of updates per task of a worker
+    :return: Tuple of the solutions for part one and part two
+    """
+    rules, updates = parse_input(puzzle_input)
+    classification = UpdatesChecker(rules, updates).classify_updates_in_parallel(
+        num_workers, chunk_size
+    )
+    return (
+        sum(classification.ordered_middle_pages),
+        sum(classification.reordered_middle_pages),
+    )
+
+
 def parse_input(puzzle_input):
     rules_section, updates_section = puzzle_input.split("\n\n")
 
@@ -42,24 +91,63 @@ def parse_input(puzzle_input):
     return rules, updates
 
 
-class UpdatesChecker:
-    def __init__(self, rules, updates):
-        self._rules = rules
-        self._updates = updates
+class RuleIndex:
+    """
+    Index of the page ordering rules, built once and shared by the checks of all updates.
 
-    def _is_ordered(self, update):
-        update_page_to_index = {page: index for index, page in enumerate(update)}
-        return all(
-            update_page_to_index[x] <= update_page_to_index[y]
-            for x, y in self._rules
-            if x in update_page_to_index and y in update_page_to_index
-        )
+    Holds the pages that must follow each page, as a set and as a bitset in which every page of a rule has a bit of
+    its own. It is all that worker processes need to classify updates.
+    """
+
+    def __init__(self, rules):
+        self._page_to_following_pages = defaultdict(set)
+        for x, y in rules:
+            self._page_to_following_pages[x].add(y)
+
+        pages = {page for rule in rules for page in rule}
+        self._page_to_bit = {page: 1 << index for index, page in enumerate(sorted(pages))}
+        self._page_to_following_pages_mask = {
+            page: sum(self._page_to_bit[following_page] for following_page in following_pages)
+            for page, following_pages in self._page_to_following_pages.items()
+        }
+
+    def is_ordered(self, update):
+        # An update is out of order if a page comes after a page that must follow it
+        preceding_pages_mask = 0
+        for page in update:
+            if self._page_to_following_pages_mask.get(page, 0) & preceding_pages_mask:
+                return False
+            preceding_pages_mask |= self._page_to_bit.get(page, 0)
+
+        return True
+
+    def get_reordered_update(self, update):
+        # Sorting with a comparator is only correct if there is a rule for every pair of pages of the update, which
+        # the puzzle input guarantees. Otherwise the order of the rules has to be completed by a topological sort.
+        sorted_update = sorted(update, key=cmp_to_key(self._compare_pages))
+        if self.is_ordered(sorted_update):
+            return sorted_update
+
+        return self._get_topological_sorted_update(update)
+
+    def _compare_pages(self, first_page, second_page):
+        if second_page in self._page_to_following_pages.get(first_page, ()):
+            return -1
+        if first_page in self._page_to_following_pages.get(second_page, ()):
+            return 1
+        return 0
 
     def _get_topological_sorted_update(self, update):
         page_to_following_pages = defaultdict(list)
         page_to_preceding_page_count = defaultdict(int)
 
-        relevant_rules = [(x, y) for x, y in self._rules if x in update and y in update]
+        pages = set(update)
+        relevant_rules = [
+            (x, y)
+            for x in pages
+            for y in self._page_to_following_pages.get(x, ())
+            if y in pages
+        ]
 
         for x, y in relevant_rules:
             page_to_following_pages[x].append(y)
@@ -82,34 +170,103 @@ class UpdatesChecker:
 
         return sorted_update
 
-    @staticmethod
-    def _get_middle_page(update):
-        return update[len(update) // 2]
+    def classify(self, updates):
+        """
+        Check every update once, and reorder the updates that are out of order.
+
+        :return: UpdateClassification of the updates
+        """
+        ordered_middle_pages = []
+        reordered_middle_pages = []
+        for update in updates:
+            if self.is_ordered(update):
+                ordered_middle_pages.append(get_middle_page(update))
+            else:
+                reordered_middle_pages.append(get_middle_page(self.get_reordered_update(update)))
+
+        return UpdateClassification(ordered_middle_pages, reordered_middle_pages)
+
+
+class UpdatesChecker:
+    def __init__(self, rules, updates):
+        self._updates = updates
+        self._rule_index = RuleIndex(rules)
 
     def get_sum_of_ordered_updates(self):
         ordered_updates = [
-            update for update in self._updates if self._is_ordered(update)
+            update for update in self._updates if self._rule_index.is_ordered(update)
         ]
-        return sum(self._get_middle_page(update) for update in ordered_updates)
+        return sum(get_middle_page(update) for update in ordered_updates)
 
     def get_sum_of_reordered_updates(self):
         reordered_updates = [
-            self._get_topological_sorted_update(update)
+            self._rule_index.get_reordered_update(update)
             for update in self._updates
-            if not self._is_ordered(update)
+            if not self._rule_index.is_ordered(update)
         ]
-        return sum(self._get_middle_page(update) for update in reordered_updates)
+        return sum(get_middle_page(update) for update in reordered_updates)
+
+    def classify_updates(self):
+        """
+        Check every update once, and reorder the updates that are out of order.
+
+        :return: UpdateClassification of the updates
+        """
+        return self._rule_index.classify(self._updates)
+
+    def classify_updates_in_parallel(self, num_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Classify the updates like classify_updates, with chunks of them classified in worker processes.
+
+        The rule index is built once, here, and sent to every worker once when the worker starts, rather than with
+        every chunk.
+
+        :param num_workers: Number of worker processes, defaults to the number of cores
+        :param chunk_size: Number of updates per task of a worker
+        :return: UpdateClassification of the updates, in the same order as classify_updates
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = (
+            self._updates[start: start + chunk_size]
+            for start in range(0, len(self._updates), chunk_size)
+        )
+
+        ordered_middle_pages = []
+        reordered_middle_pages = []
+        with ProcessPoolExecutor(
+                max_workers=num_workers or os.cpu_count(),
+                initializer=initialize_worker,
+                initargs=(self._rule_index,),
+        ) as executor:
+            for classification in executor.map(classify_chunk, chunks):
+                ordered_middle_pages.extend(classification.ordered_middle_pages)
+                reordered_middle_pages.extend(classification.reordered_middle_pages)
+
+        return UpdateClassification(ordered_middle_pages, reordered_middle_pages)
+
+
+def get_middle_page(update):
+    return update[len(update) // 2]
+
+
+def initialize_worker(rule_index):
+    global _worker_rule_index
+    _worker_rule_index = rule_index
+
+
+def classify_chunk(updates):
+    """
+    Classify a chunk of updates with the rule index of the worker process.
+    """
+    return _worker_rule_index.classify(updates)
 
 
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -154,6 +311,32 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 123
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_partial_rules(self):
+        # Without a rule between 2 and the other pages, only the rules themselves decide the order
+        rules = [(1, 3), (3, 4)]
+        updates_checker = UpdatesChecker(rules, [[4, 2, 3], [1, 2, 3], [4, 2, 1]])
+        self.assertEqual(4, updates_checker.get_sum_of_ordered_updates())
+        rule_index = RuleIndex(rules)
+        self.assertEqual([1, 3, 4], rule_index.get_reordered_update([4, 3, 1]))
+        self.assertTrue(rule_index.is_ordered(rule_index.get_reordered_update([4, 2, 3])))
+
+    def test_solve_both(self):
+        expected_output = (143, 123)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
+    def test_classify_updates(self):
+        rules, updates = parse_input(self.PUZZLE_INPUT)
+        expected_output = UpdateClassification([61, 53, 29], [47, 29, 47])
+        updates_checker = UpdatesChecker(rules, updates)
+        self.assertEqual(expected_output, updates_checker.classify_updates())
+        self.assertEqual(
+            expected_output,
+            updates_checker.classify_updates_in_parallel(num_workers=2, chunk_size=4),
+        )
+        self.assertEqual(
+            (143, 123), solve_both_in_parallel(self.PUZZLE_INPUT, num_workers=2, chunk_size=1)
+        )
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,60 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_UPDATE_COUNT = 175
+PAGE_COUNT = 49
+MIN_UPDATE_LENGTH = 5
+MAX_UPDATE_LENGTH = 23
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate ordering rules for every pair of pages (like the real input) and updates using these pages.
+
+    Both answers are known, because the generator knows the total order of the pages.
+    """
+    rng = random.Random(seed)
+    update_count = get_scaled_count(REAL_INPUT_UPDATE_COUNT, scale)
+
+    # The position of a page in this list is its rank in the total order
+    pages = rng.sample(range(10, 100), PAGE_COUNT)
+    page_to_rank = {page: rank for rank, page in enumerate(pages)}
+
+    rules = [(x, y) for i, x in enumerate(pages) for y in pages[i + 1:]]
+    rng.shuffle(rules)
+
+    updates = []
+    sum_of_ordered_middle_pages = 0
+    sum_of_reordered_middle_pages = 0
+
+    for _ in range(update_count):
+        # Updates have an odd number of pages, so they have a middle page
+        update_length = rng.randrange(MIN_UPDATE_LENGTH, MAX_UPDATE_LENGTH + 1, 2)
+        update = rng.sample(pages, update_length)
+        sorted_update = sorted(update, key=page_to_rank.get)
+
+        if rng.random() < 0.5:
+            update = sorted_update
+        middle_page = sorted_update[len(sorted_update) // 2]
+
+        if update == sorted_update:
+            sum_of_ordered_middle_pages += middle_page
+        else:
+            sum_of_reordered_middle_pages += middle_page
+
+        updates.append(update)
+
+    rules_section = "\n".join(f"{x}|{y}" for x, y in rules)
+    updates_section = "\n".join(",".join(map(str, update)) for update in updates)
+    return GeneratedInput(
+        f"{rules_section}\n\n{updates_section}",
+        sum_of_ordered_middle_pages,
+        sum_of_reordered_middle_pages,
+    )
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 5, generate_input(0.5, seed=1))
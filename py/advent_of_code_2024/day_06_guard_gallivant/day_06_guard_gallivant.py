@@ -1,8 +1,16 @@
+import os
+import random
 import textwrap
 import unittest
-from copy import deepcopy
 
-from pygame.math import Vector2 as Vector
+from common.grid import Grid
+from common.profiling import run_parts
+
+# Number of candidate obstacles a worker process checks per task
+DEFAULT_CHUNK_SIZE = 256
+
+# Loop finder of the worker process, set once per worker by the initializer of the pool
+_worker_loop_finder = None
 
 
 def solve_part_one(puzzle_input):
@@ -12,7 +20,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = [list(line) for line in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     simulator = GuardPatrolSimulator(grid)
     simulator.simulate()
     return simulator.get_visited_positions_count()
@@ -25,122 +33,354 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = [list(line) for line in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     loop_finder = GuardPatrolLoopFinder(grid)
     return loop_finder.get_loop_count()
 
 
-class GuardPatrolSimulator:
-    # Order of directions (up, right, down, left)
-    DIRECTIONS = ["^", ">", "v", "<"]
+def solve_part_two_in_parallel(puzzle_input, num_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Solve part two of the Advent of Code puzzle, checking chunks of the candidate obstacles in worker processes.
 
-    # Movement deltas for directions: up, right, down, left
-    DELTAS = {
-        "^": Vector(0, -1),  # Move up
-        ">": Vector(1, 0),  # Move right
-        "v": Vector(0, 1),  # Move down
-        "<": Vector(-1, 0),  # Move left
-    }
+    :param puzzle_input: The input data as string
+    :param num_workers: Number of worker processes, defaults to the number of cores
+    :param chunk_size: Number of candidate obstacles per task of a worker
+    :return: Solution for part two
+    """
+    grid = Grid(puzzle_input.splitlines())
+    loop_finder = GuardPatrolLoopFinder(grid)
+    return loop_finder.get_loop_count_in_parallel(num_workers, chunk_size)
+
+
+class GuardPatrolSimulator:
+    OBSTACLE = ord("#")
 
     def __init__(self, grid):
         self._grid = grid
-        self._height = len(grid)
-        self._width = len(grid[0])
+
+        # Offsets of the grid are ordered clockwise starting upwards, same as turning right
+        self._deltas = grid.orthogonal_offsets
 
         self._current_position = self.find_start_position()
         self._current_direction_index = 0  # Start by facing up ('^')
 
-        self._visited = set()
+        # Visited states (position, direction index) as flags at position * 4 + direction index
+        self._visited = bytearray(len(grid.cells) * 4)
         self._has_terminated_due_to_loop = False
 
     def find_start_position(self):
-        return next(
-            Vector(x, y)
-            for y in range(self._height)
-            for x in range(self._width)
-            if self._get_element_at(Vector(x, y)) == "^"
-        )
+        return self._grid.find("^")
 
     def simulate(self):
-        while self._is_within_bounds(self._current_position):
-            current_state = (
-                self._current_position.x,
-                self._current_position.y,
-                self._current_direction_index,
-            )
-            if current_state in self._visited:
+        cells = self._grid.cells
+        outside = ord(self._grid.sentinel)
+        visited = self._visited
+
+        while cells[self._current_position] != outside:
+            current_state = self._current_position * 4 + self._current_direction_index
+            if visited[current_state]:
                 self._has_terminated_due_to_loop = True
                 break
 
-            self._visited.add(current_state)
+            visited[current_state] = 1
 
-            next_position = self._get_next_position()
-            if (
-                    self._is_within_bounds(next_position)
-                    and self._get_element_at(next_position) == "#"
-            ):
+            next_position = (
+                    self._current_position + self._deltas[self._current_direction_index]
+            )
+            if cells[next_position] == self.OBSTACLE:
                 self._turn_right()
             else:
                 self._current_position = next_position
 
     def get_visited_positions_count(self):
-        distinct_positions = set((x, y) for x, y, _ in self._visited)
-        return len(distinct_positions)
+        return sum(
+            1
+            for position in self._grid.indices()
+            if any(self._visited[position * 4: position * 4 + 4])
+        )
 
     def has_terminated_due_to_loop(self):
         return self._has_terminated_due_to_loop
 
-    def _is_within_bounds(self, position):
-        return 0 <= position.x < self._width and 0 <= position.y < self._height
-
-    def _get_next_position(self):
-        direction = self.DIRECTIONS[self._current_direction_index]
-        return self._current_position + self.DELTAS[direction]
-
     def _turn_right(self):
         self._current_direction_index = (self._current_direction_index + 1) % 4
 
-    def _get_element_at(self, position):
-        return self._grid[int(position.y)][int(position.x)]
+
+class PatrolIndex:
+    """
+    Patrol of the guard on a lab map where obstacles can be placed and removed, answering loop queries without
+    simulating the patrol again.
+
+    The transitions between the states of the guard are kept as a table per direction, mapping every cell to the
+    first obstacle (or border cell) the guard runs into when walking from it in that direction. The guard jumps from
+    obstacle to obstacle with it, so a patrol takes one step per turn. Placing or removing an obstacle only updates
+    the cells that lead to it, i.e. part of its row and its column.
+
+    The path of the current patrol, with the step at which the guard first enters every cell, is cached until the
+    map changes. A new obstacle can only change the patrol from the step at which the guard first reaches it, so
+    what-if queries resume from there.
+    """
+
+    def __init__(self, grid):
+        """
+        :param grid: Lab map, which is copied so that placing obstacles doesn't change it
+        """
+        self._grid = grid.copy()
+        self._cells = self._grid.cells
+        self._deltas = grid.orthogonal_offsets
+        self._outside = ord(grid.sentinel)
+        self._start_position = self._grid.find("^")
+        self._next_obstacles = self._get_next_obstacles()
+
+        self._path = None
+        self._has_loop = None
+
+    def place_obstacle(self, position):
+        self._check_can_change(position)
+        if self._is_blocked(position):
+            return
+
+        self._cells[position] = GuardPatrolSimulator.OBSTACLE
+        for direction_index in range(len(self._deltas)):
+            self._update_cells_leading_to(position, direction_index, position)
+
+    def remove_obstacle(self, position):
+        self._check_can_change(position)
+        if self._cells[position] != GuardPatrolSimulator.OBSTACLE:
+            return
+
+        self._cells[position] = ord(".")
+        for direction_index, delta in enumerate(self._deltas):
+            next_position = position + delta
+            if self._is_blocked(next_position):
+                next_obstacle = next_position
+            else:
+                next_obstacle = self._next_obstacles[direction_index][next_position]
+            self._next_obstacles[direction_index][position] = next_obstacle
+            self._update_cells_leading_to(position, direction_index, next_obstacle)
+
+    def has_loop(self):
+        """
+        :return: Whether the guard patrols in a loop on the current map
+        """
+        if self._has_loop is None:
+            self._has_loop = self.has_loop_from(None, self._start_position, 0)
+        return self._has_loop
+
+    def has_loop_with_obstacle_at(self, obstacle_position):
+        """
+        :return: Whether the guard would patrol in a loop with an additional obstacle, without placing it
+        """
+        self._check_can_change(obstacle_position)
+        entry_state = self.get_path().get(obstacle_position)
+        if entry_state is None or self._is_blocked(obstacle_position):
+            # The guard never runs into the obstacle, so the patrol doesn't change
+            return self.has_loop()
+
+        _, position, direction_index = entry_state
+        return self.has_loop_from(obstacle_position, position, direction_index)
+
+    def get_path(self):
+        """
+        :return: Dict mapping every position of the current patrol, except the start position, to a tuple of the
+            step at which the guard first enters it and the state (position, direction index) right before it
+        """
+        if self._path is None:
+            self._path = dict(self._walk_path())
+        return self._path
+
+    def get_step(self, position):
+        """
+        :return: Step at which the guard first enters the position, or None if the patrol doesn't reach it
+        """
+        if position == self._start_position:
+            return 0
+
+        entry_state = self.get_path().get(position)
+        return entry_state[0] if entry_state is not None else None
+
+    def has_loop_from(self, obstacle_position, position, direction_index):
+        """
+        :param obstacle_position: Position of an additional obstacle, or None
+        :return: Whether the guard patrols in a loop when starting at the position in the given direction
+        """
+        cells = self._cells
+        visited_states = set()
+
+        while True:
+            delta = self._deltas[direction_index]
+            hit_position = self._next_obstacles[direction_index][position]
+
+            # The new obstacle is in the way if it lies between the guard and the next obstacle. Moving sideways
+            # never leaves the row, as the border cell at its end is hit first.
+            if obstacle_position is None:
+                is_blocked = False
+            elif delta > 0:
+                is_blocked = position < obstacle_position < hit_position
+            else:
+                is_blocked = hit_position < obstacle_position < position
+            if is_blocked and (obstacle_position - position) % delta == 0:
+                hit_position = obstacle_position
+            elif cells[hit_position] == self._outside:
+                return False
+
+            position = hit_position - delta
+            direction_index = (direction_index + 1) % 4
+
+            state = position * 4 + direction_index
+            if state in visited_states:
+                return True
+            visited_states.add(state)
+
+    def _get_next_obstacles(self):
+        next_obstacles = []
+
+        for delta in self._deltas:
+            next_obstacle = [0] * len(self._cells)
+            # Cells are visited so that the next cell in the direction is always known already
+            positions = list(self._grid.indices())
+            if delta > 0:
+                positions.reverse()
+
+            for position in positions:
+                next_position = position + delta
+                if self._is_blocked(next_position):
+                    next_obstacle[position] = next_position
+                else:
+                    next_obstacle[position] = next_obstacle[next_position]
+
+            next_obstacles.append(next_obstacle)
+
+        return next_obstacles
+
+    def _update_cells_leading_to(self, position, direction_index, next_obstacle):
+        # The cells behind the position, up to the previous obstacle, run into the same obstacle as the position
+        delta = self._deltas[direction_index]
+        previous_position = position - delta
+        while not self._is_blocked(previous_position):
+            self._next_obstacles[direction_index][previous_position] = next_obstacle
+            previous_position -= delta
+
+        self._path = None
+        self._has_loop = None
+
+    def _walk_path(self):
+        """
+        :return: Generator of the positions of the path, except the start position, each with the step at which the
+            guard first enters it and the state right before it
+        """
+        cells = self._cells
+        position = self._start_position
+        direction_index = 0
+        step = 0
+        seen_positions = {position}
+        visited_states = set()
+
+        while True:
+            # On a map with a loop, the path ends once the guard is in a state again
+            state = position * 4 + direction_index
+            if state in visited_states:
+                return
+            visited_states.add(state)
+
+            next_position = position + self._deltas[direction_index]
+            if cells[next_position] == self._outside:
+                return
+            if cells[next_position] == GuardPatrolSimulator.OBSTACLE:
+                direction_index = (direction_index + 1) % 4
+                continue
+
+            step += 1
+            if next_position not in seen_positions:
+                seen_positions.add(next_position)
+                yield next_position, (step, position, direction_index)
+            position = next_position
+
+    def _is_blocked(self, position):
+        return self._cells[position] in (GuardPatrolSimulator.OBSTACLE, self._outside)
+
+    def _check_can_change(self, position):
+        if position == self._start_position or not self._grid.is_inside(position):
+            raise ValueError(f"Can't place an obstacle at {self._grid.position(position)}")
 
 
 class GuardPatrolLoopFinder:
+    """
+    Counts the positions where a new obstacle makes the guard patrol in a loop.
+
+    Only positions on the original patrol path can change the patrol, and each of them is checked with a what-if
+    query of the patrol index.
+    """
+
     def __init__(self, grid):
-        self._grid = grid
-        self._height = len(grid)
-        self._width = len(grid[0])
+        self._patrol_index = PatrolIndex(grid)
 
     def get_loop_count(self):
-        simulator = GuardPatrolSimulator(self._grid)
-        start_position = simulator.find_start_position()
-
-        return len(
-            [
-                (x, y)
-                for y in range(self._height)
-                for x in range(self._width)
-                if Vector(x, y) != start_position
-                   and self._has_loop_with_obstacle_at(x, y)
-            ]
+        return sum(
+            1
+            for candidate in self._get_candidates()
+            if self.has_loop_with_candidate(candidate)
+        )
+
+    def get_loop_count_in_parallel(self, num_workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Count the loops like get_loop_count, with chunks of the candidate obstacles checked in worker processes.
+
+        The grid and the jump tables are handed to every worker once, when it starts: inherited by forked workers,
+        and pickled once per worker otherwise. Tasks only carry the candidates and return their loop count.
+
+        :param num_workers: Number of worker processes, defaults to the number of cores
+        :param chunk_size: Number of candidate obstacles per task of a worker
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        candidates = self._get_candidates()
+        chunks = (
+            candidates[start: start + chunk_size]
+            for start in range(0, len(candidates), chunk_size)
         )
 
-    def _has_loop_with_obstacle_at(self, x, y):
-        new_grid = deepcopy(self._grid)
-        new_grid[y][x] = "#"
-        simulator = GuardPatrolSimulator(new_grid)
-        simulator.simulate()
-        return simulator.has_terminated_due_to_loop()
+        with ProcessPoolExecutor(
+                max_workers=num_workers or os.cpu_count(),
+                initializer=initialize_worker,
+                initargs=(self,),
+        ) as executor:
+            return sum(executor.map(count_loops, chunks))
+
+    def has_loop_with_candidate(self, candidate):
+        """
+        :param candidate: Tuple of the obstacle position and the state (position, direction index) of the guard
+            right before it
+        """
+        obstacle_position, position, direction_index = candidate
+        return self._patrol_index.has_loop_from(obstacle_position, position, direction_index)
+
+    def _get_candidates(self):
+        return [
+            (obstacle_position, position, direction_index)
+            for obstacle_position, (_, position, direction_index) in self._patrol_index.get_path().items()
+        ]
+
+
+def initialize_worker(loop_finder):
+    global _worker_loop_finder
+    _worker_loop_finder = loop_finder
+
+
+def count_loops(candidates):
+    """
+    Count the candidate obstacles that cause a loop, with the loop finder of the worker process.
+
+    :param candidates: List of candidate obstacle positions, each with the state right before it
+    """
+    return sum(1 for candidate in candidates if _worker_loop_finder.has_loop_with_candidate(candidate))
 
 
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -167,6 +407,76 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 6
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_part_two_in_parallel(self):
+        expected_output = 6
+        self.assertEqual(
+            expected_output,
+            solve_part_two_in_parallel(self.PUZZLE_INPUT, num_workers=2, chunk_size=2),
+        )
+
+    def test_loop_finder_matches_simulation(self):
+        randomizer = random.Random(6)
+        for _ in range(20):
+            rows = [
+                "".join(randomizer.choice("#......") for _ in range(12)) for _ in range(12)
+            ]
+            rows[6] = rows[6][:6] + "^" + rows[6][7:]
+            grid = Grid(rows)
+
+            # Simulate the whole patrol with every possible new obstacle
+            expected_output = 0
+            for position in grid.indices():
+                if grid[position] == ".":
+                    new_grid = grid.copy()
+                    new_grid[position] = "#"
+                    simulator = GuardPatrolSimulator(new_grid)
+                    simulator.simulate()
+                    expected_output += simulator.has_terminated_due_to_loop()
+
+            self.assertEqual(expected_output, GuardPatrolLoopFinder(grid).get_loop_count())
+
+    def test_patrol_index(self):
+        grid = Grid(self.PUZZLE_INPUT.splitlines())
+        patrol_index = PatrolIndex(grid)
+        obstacle_position = grid.index(3, 6)
+        self.assertFalse(patrol_index.has_loop())
+        self.assertEqual(1, patrol_index.get_step(grid.index(4, 5)))
+        self.assertIsNone(patrol_index.get_step(grid.index(0, 0)))
+        self.assertTrue(patrol_index.has_loop_with_obstacle_at(obstacle_position))
+        self.assertFalse(patrol_index.has_loop_with_obstacle_at(grid.index(0, 0)))
+
+        patrol_index.place_obstacle(obstacle_position)
+        self.assertTrue(patrol_index.has_loop())
+        self.assertIsNone(patrol_index.get_step(grid.index(7, 9)))
+        patrol_index.remove_obstacle(obstacle_position)
+        self.assertFalse(patrol_index.has_loop())
+        self.assertEqual(44, patrol_index.get_step(grid.index(7, 9)))
+        self.assertEqual(".", grid[obstacle_position])
+
+        with self.assertRaises(ValueError):
+            patrol_index.place_obstacle(grid.find("^"))
+
+    def test_patrol_index_updates(self):
+        randomizer = random.Random(23)
+        grid = Grid(["." * 10] * 10)
+        grid[grid.index(5, 5)] = "^"
+        patrol_index = PatrolIndex(grid)
+
+        for _ in range(200):
+            position = grid.index(randomizer.randrange(10), randomizer.randrange(10))
+            if grid[position] == "^":
+                continue
+            grid[position] = "." if grid[position] == "#" else "#"
+            if grid[position] == "#":
+                patrol_index.place_obstacle(position)
+            else:
+                patrol_index.remove_obstacle(position)
+
+            simulator = GuardPatrolSimulator(grid)
+            simulator.simulate()
+            self.assertEqual(simulator.has_terminated_due_to_loop(), patrol_index.has_loop())
+            self.assertEqual(PatrolIndex(grid).get_path(), patrol_index.get_path())
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
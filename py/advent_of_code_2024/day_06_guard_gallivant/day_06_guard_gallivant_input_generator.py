@@ -0,0 +1,151 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_side
+
+REAL_INPUT_SIDE = 130
+OBSTACLE_DENSITY = 0.05
+MAX_ATTEMPTS = 100
+
+# The guard visits about a third of the cells of the real input before leaving, turning every 34 steps on average
+MIN_VISITED_FRACTION = 0.3
+MAX_SEGMENT_LENGTH_FRACTION = 0.5
+MAX_TURN_ATTEMPTS = 10
+
+# Up, right, down, left
+DELTAS = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate a lab map with randomly placed obstructions where the guard patrols a large part of the map before
+    leaving it, like in the real input.
+
+    On a random map, the guard mostly leaves after a few steps, so the patrol is laid out first, and the random
+    obstructions are only placed on cells the guard never enters. As the guard only ever looks at the cell in front of
+    it, they don't change the patrol. The answer for part one is known, because the generator lays out the patrol.
+    """
+    rng = random.Random(seed)
+    side = get_scaled_side(REAL_INPUT_SIDE, scale)
+
+    for _ in range(MAX_ATTEMPTS):
+        patrol = _lay_out_patrol(rng, side)
+        if patrol is not None:
+            break
+    else:
+        raise RuntimeError(f"Could not lay out a patrol in {MAX_ATTEMPTS} attempts")
+
+    start, visited_positions, obstacles = patrol
+    rows = []
+    for y in range(side):
+        row = []
+        for x in range(side):
+            position = y * side + x
+            if position == start:
+                row.append("^")
+            elif position in obstacles or (
+                    position not in visited_positions and rng.random() < OBSTACLE_DENSITY
+            ):
+                row.append("#")
+            else:
+                row.append(".")
+        rows.append("".join(row))
+
+    return GeneratedInput("\n".join(rows), len(visited_positions))
+
+
+def _lay_out_patrol(rng, side):
+    """
+    Walk the guard straight for a random number of steps and place an obstruction in front of it, until it has
+    visited enough cells to walk off the map. Cells are never entered in a direction they were already entered in, as
+    the guard would then patrol in a loop, and the guard only turns where it can turn again after its next walk.
+
+    :return: Tuple of the start position, the set of visited positions and the set of obstructions, with positions
+        as y * side + x, or None if the guard got stuck
+    """
+    x = rng.randrange(side // 4, side - side // 4)
+    y = rng.randrange(side // 4, side - side // 4)
+    start = y * side + x
+    direction_index = 0
+    visited_positions = {start}
+    visited_states = {start * 4}
+    obstacles = set()
+    min_visited_count = MIN_VISITED_FRACTION * side * side
+    max_segment_length = max(1, round(MAX_SEGMENT_LENGTH_FRACTION * side))
+
+    while True:
+        segment, leaves_map = _get_segment(x, y, direction_index, side, obstacles, visited_states)
+        if leaves_map and len(visited_positions) + len(segment) >= min_visited_count:
+            exit_positions = visited_positions.union(position for position, _, _ in segment)
+            if len(exit_positions) >= min_visited_count:
+                return start, exit_positions, obstacles
+
+        turned_direction_index = (direction_index + 1) % 4
+        lengths = _get_turn_lengths(
+            segment, turned_direction_index, max_segment_length, visited_positions, visited_states
+        )
+        if not lengths:
+            return None
+
+        rng.shuffle(lengths)
+        length = lengths[0]
+        for candidate_length in lengths[:MAX_TURN_ATTEMPTS]:
+            obstacle = segment[candidate_length][0]
+            _, turn_x, turn_y = segment[candidate_length - 1]
+            obstacles.add(obstacle)
+            next_segment, _ = _get_segment(turn_x, turn_y, turned_direction_index, side, obstacles, visited_states)
+            obstacles.remove(obstacle)
+            if _get_turn_lengths(
+                    next_segment, (turned_direction_index + 1) % 4, max_segment_length, visited_positions,
+                    visited_states
+            ):
+                length = candidate_length
+                break
+
+        for position, _, _ in segment[:length]:
+            visited_positions.add(position)
+            visited_states.add(position * 4 + direction_index)
+        obstacles.add(segment[length][0])
+        _, x, y = segment[length - 1]
+        direction_index = turned_direction_index
+        visited_states.add((y * side + x) * 4 + direction_index)
+
+
+def _get_turn_lengths(segment, turned_direction_index, max_segment_length, visited_positions, visited_states):
+    """
+    :return: List of the numbers of steps after which the guard can turn on the given segment, that is where the cell
+        in front of it was never visited, so an obstruction can be placed there, and it never turned there before
+    """
+    return [
+        length
+        for length in range(1, min(len(segment), max_segment_length + 1))
+        if segment[length][0] not in visited_positions
+        and segment[length - 1][0] * 4 + turned_direction_index not in visited_states
+    ]
+
+
+def _get_segment(x, y, direction_index, side, obstacles, visited_states):
+    """
+    :return: Tuple of the list of (position, x, y) of the cells in front of the guard that it can walk through in a
+        straight line, and whether it can walk off the map that way
+    """
+    delta_x, delta_y = DELTAS[direction_index]
+    segment = []
+    while True:
+        x, y = x + delta_x, y + delta_y
+        if not (0 <= x < side and 0 <= y < side):
+            return segment, True
+        position = y * side + x
+        if position in obstacles or position * 4 + direction_index in visited_states:
+            return segment, False
+        segment.append((position, x, y))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 6, generate_input(0.5, seed=1))
+
+    def test_patrol_grows_with_scale(self):
+        for scale in (1, 4):
+            side = get_scaled_side(REAL_INPUT_SIDE, scale)
+            self.assertGreaterEqual(generate_input(scale).part_one, MIN_VISITED_FRACTION * side * side)
@@ -1,6 +1,29 @@
+import io
+import itertools
+import math
+import random
 import textwrap
 import unittest
-import itertools
+from collections import namedtuple
+
+from common.profiling import run_parts
+from common.streaming import iter_records
+
+# Operator of the equations:
+# - apply(value, number) returns the value of the numbers so far combined with the next number
+# - undo(value, number) returns the value the numbers so far must have had for apply to return the given value, None
+#   if apply can't return it, or ANY_VALUE if it returns it for any value. Operators without an inverse have no undo.
+# - is_monotonic tells whether apply never returns a smaller value than the given one, for positive numbers
+Operator = namedtuple("Operator", ["symbol", "apply", "undo", "is_monotonic"])
+
+# Returned by the inverse of an operator when the numbers so far may have any value, e.g. when multiplying by zero
+ANY_VALUE = object()
+
+# Operators that equations can use, by symbol
+OPERATORS = {}
+
+# Number of values the numbers before an operator without an inverse may evaluate to, per index of an equation
+DEFAULT_MAX_PREFIX_VALUES = 1_000_000
 
 
 def solve_part_one(puzzle_input):
@@ -10,7 +33,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    equations = parse_input(puzzle_input)
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the equations one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    equations = parse_input(lines)
     solver = CalibrationEquationSolver(equations, ["+", "*"])
     return solver.get_sum_of_valid_test_values()
 
@@ -22,76 +55,260 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    equations = parse_input(puzzle_input)
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the equations one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    equations = parse_input(lines)
     solver = CalibrationEquationSolver(equations, ["+", "*", "||"])
     return solver.get_sum_of_valid_test_values()
 
 
-def parse_input(puzzle_input):
-    equations = []
+def register_operator(symbol, apply, undo=None, is_monotonic=False):
+    """
+    Make an operator available to the solver under its symbol.
 
-    for line in puzzle_input.strip().splitlines():
+    :param apply: Function of the value so far and the next number, returning the combined value
+    :param undo: Inverse of apply, see Operator, or None to check the operator by searching forwards
+    :param is_monotonic: Whether apply never returns a smaller value when the number is positive, which lets the
+        solver skip values larger than the test value or smaller than the first number
+    """
+    OPERATORS[symbol] = Operator(symbol, apply, undo, is_monotonic)
+
+
+def undo_addition(value, number):
+    return value - number
+
+
+def undo_multiplication(value, number):
+    if number == 0:
+        return ANY_VALUE if value == 0 else None
+    return value // number if value % number == 0 else None
+
+
+def concatenate(value, number):
+    return value * get_power_of_ten_above(number) + number
+
+
+def undo_concatenation(value, number):
+    # Concatenating a number multiplies the value before it by the power of ten just above the number
+    power = get_power_of_ten_above(number)
+    return value // power if value % power == number else None
+
+
+def get_power_of_ten_above(number):
+    power = 10
+    while power <= number:
+        power *= 10
+    return power
+
+
+register_operator("+", lambda value, number: value + number, undo_addition, is_monotonic=True)
+register_operator("*", lambda value, number: value * number, undo_multiplication, is_monotonic=True)
+register_operator("||", concatenate, undo_concatenation, is_monotonic=True)
+
+
+def parse_input(lines):
+    """
+    :param lines: The input data as string, or an iterable of lines
+    :return: Generator of the equations, parsed one at a time
+    """
+    for line in iter_records(lines):
         test_value_str, numbers_str = line.split(": ")
         test_value = int(test_value_str)
         numbers = list(map(int, numbers_str.split(" ")))
-        equations.append((test_value, numbers))
-
-    return equations
+        yield test_value, numbers
 
 
 class CalibrationEquationSolver:
-    def __init__(self, equations, operators):
+    """
+    Checks which equations can be made true, by working backwards from the test value.
+
+    The last operator of a true equation turns the value of all numbers but the last one into the test value, so
+    that value can be recovered by undoing the operator, e.g. subtracting the last number or dividing by it. Most
+    operators can only be undone for some values, which prunes most branches right away.
+
+    Operators without an inverse are checked against the values the numbers before them can evaluate to, which are
+    searched forwards once per equation and remembered per index.
+
+    If every operator is monotonic and every number of an equation is positive, the values of the numbers so far only
+    grow, so they lie between the first number and the test value, and all other values are pruned. Otherwise, e.g.
+    when multiplying by zero or subtracting, nothing bounds them, so the number of values searched forwards is capped.
+    """
+
+    def __init__(self, equations, operators, max_prefix_values=DEFAULT_MAX_PREFIX_VALUES):
+        """
+        :param max_prefix_values: Maximum number of values the numbers before an operator without an inverse may
+            evaluate to, beyond which the forward search gives up with a ValueError
+        """
         self._equations = (
-            equations  # List of tuples, each containing (test_value, numbers)
+            equations  # Iterable of tuples, each containing (test_value, numbers)
         )
-        self._operators = operators  # List of operators (e.g., ['+', '*', '||'])
+        self._operators = operators  # List of registered operators (e.g., ['+', '*', '||'])
+
+        unknown_operators = set(operators) - set(OPERATORS)
+        if unknown_operators:
+            raise ValueError(f"Unknown operators: {', '.join(sorted(unknown_operators))}")
+
+        operators = [OPERATORS[symbol] for symbol in operators]
+        self._inverses = [operator.undo for operator in operators if operator.undo is not None]
+        self._forward_operators = [operator for operator in operators if operator.undo is None]
+        self._all_operators = operators
+        self._max_prefix_values = max_prefix_values
+
+        # The inverses of the built-in operators are inlined when searching backwards, as calling them is most of
+        # the time spent
+        self._can_add = undo_addition in self._inverses
+        self._can_multiply = undo_multiplication in self._inverses
+        self._can_concatenate = undo_concatenation in self._inverses
+        self._custom_inverses = [
+            undo
+            for undo in self._inverses
+            if undo not in (undo_addition, undo_multiplication, undo_concatenation)
+        ]
+        self._are_monotonic = all(operator.is_monotonic for operator in operators)
 
     def get_sum_of_valid_test_values(self):
-        sum_of_valid_test_values = 0
+        return sum(
+            test_value
+            for test_value, numbers in self._equations
+            if self.is_valid(test_value, numbers)
+        )
 
-        for test_value, numbers in self._equations:
-            num_operators = len(numbers) - 1
-            operator_combinations = itertools.product(
-                self._operators, repeat=num_operators
-            )
+    def is_valid(self, test_value, numbers):
+        """
+        :return: Whether the numbers can be combined with the operators, evaluated from left to right, into the test
+            value
+        """
+        minimum_value = self._get_minimum_value(numbers)
+        if self._forward_operators:
+            return self._is_valid_with_forward_operators(test_value, numbers, minimum_value)
+
+        can_add = self._can_add
+        can_multiply = self._can_multiply
+        can_concatenate = self._can_concatenate
+        custom_inverses = self._custom_inverses
+        # Concatenating a number multiplies the value before it by the power of ten just above the number
+        powers = [get_power_of_ten_above(number) for number in numbers] if can_concatenate else None
+
+        # Values the numbers up to the index must evaluate to, starting with the last number
+        stack = [(len(numbers) - 1, test_value)]
+        while stack:
+            index, value = stack.pop()
+            number = numbers[index]
+            if index == 0:
+                if value == number:
+                    return True
+                continue
+            if value < minimum_value:
+                continue
+
+            if can_add and value - number >= minimum_value:
+                stack.append((index - 1, value - number))
+            if can_multiply:
+                if number == 0:
+                    if value == 0:
+                        return True
+                elif value % number == 0:
+                    stack.append((index - 1, value // number))
+            if can_concatenate and value % powers[index] == number:
+                stack.append((index - 1, value // powers[index]))
+
+            for undo in custom_inverses:
+                previous_value = undo(value, number)
+                if previous_value is ANY_VALUE:
+                    return True
+                if previous_value is not None:
+                    stack.append((index - 1, previous_value))
+
+        return False
 
+    def _is_valid_with_forward_operators(self, test_value, numbers, minimum_value):
+        # Values the numbers before every index can evaluate to, only searched once an operator needs them
+        index_to_prefix_values = {}
+
+        stack = [(len(numbers) - 1, test_value)]
+        seen_states = set()
+        while stack:
+            state = stack.pop()
+            if state in seen_states:
+                continue
+            seen_states.add(state)
+
+            index, value = state
+            number = numbers[index]
+            if index == 0:
+                if value == number:
+                    return True
+                continue
+            if value < minimum_value:
+                continue
+
+            for undo in self._inverses:
+                previous_value = undo(value, number)
+                if previous_value is ANY_VALUE:
+                    return True
+                if previous_value is not None:
+                    stack.append((index - 1, previous_value))
+
+            prefix_values = self._get_prefix_values(
+                numbers, index, test_value, minimum_value, index_to_prefix_values
+            )
             if any(
-                    CalibrationEquationSolver._evaluate_expression(
-                        numbers, operator_combination
-                    )
-                    == test_value
-                    for operator_combination in operator_combinations
+                    operator.apply(previous_value, number) == value
+                    for operator in self._forward_operators
+                    for previous_value in prefix_values
             ):
-                sum_of_valid_test_values += test_value
+                return True
 
-        return sum_of_valid_test_values
+        return False
 
-    @staticmethod
-    def _evaluate_expression(numbers, operators):
-        result = numbers[0]
+    def _get_minimum_value(self, numbers):
+        """
+        :return: Smallest value the numbers before any operator can evaluate to in a true equation, which is the first
+            number if values only grow, and unbounded otherwise
+        """
+        if self._are_monotonic and all(number > 0 for number in numbers):
+            return numbers[0]
+        return -math.inf
 
-        for i in range(1, len(numbers)):
-            operator = operators[i - 1]
+    def _get_prefix_values(self, numbers, index, test_value, minimum_value, index_to_prefix_values):
+        """
+        :return: Set of the values the numbers before the index can evaluate to
+        """
+        # Built from the shortest prefix not known yet, so that long equations don't recurse deeply
+        known_index = max((i for i in index_to_prefix_values if i <= index), default=1)
+        values = index_to_prefix_values.get(known_index, {numbers[0]})
 
-            if operator == "+":
-                result += numbers[i]
-            elif operator == "*":
-                result *= numbers[i]
-            elif operator == "||":
-                result = int(str(result) + str(numbers[i]))
+        for next_index in range(known_index + 1, index + 1):
+            number = numbers[next_index - 1]
+            values = {
+                operator.apply(previous_value, number)
+                for operator in self._all_operators
+                for previous_value in values
+            }
+            if minimum_value != -math.inf:
+                values = {value for value in values if value <= test_value}
+            if len(values) > self._max_prefix_values:
+                raise ValueError(
+                    f"The numbers before index {next_index} evaluate to more than {self._max_prefix_values} values"
+                )
+            index_to_prefix_values[next_index] = values
 
-        return result
+        return values
 
 
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -117,6 +334,74 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 11387
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(3749, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(11387, solve_part_two_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
+    def test_matches_all_operator_combinations(self):
+        randomizer = random.Random(7)
+        solver = CalibrationEquationSolver([], ["+", "*", "||"])
+        for _ in range(300):
+            numbers = [randomizer.choice([0, 1, 2, 5, 10, 12, 99]) for _ in range(randomizer.randint(1, 5))]
+            values = {numbers[0]}
+            for number in numbers[1:]:
+                values = {
+                    result
+                    for value in values
+                    for result in (value + number, value * number, int(f"{value}{number}"))
+                }
+            test_value = randomizer.choice([*values, randomizer.randrange(1000)])
+            self.assertEqual(test_value in values, solver.is_valid(test_value, numbers), (test_value, numbers))
+
+    def test_long_equation(self):
+        numbers = [7, 3, 12, 5, 9, 1, 8, 2, 6, 4, 11, 3, 7, 9, 2, 5, 8, 1, 6, 3, 4, 2, 9, 7, 5]
+        test_value = numbers[0]
+        for operator, number in zip(itertools.cycle(["*", "||", "+"]), numbers[1:]):
+            test_value = {
+                "+": test_value + number,
+                "*": test_value * number,
+                "||": int(f"{test_value}{number}"),
+            }[operator]
+
+        solver = CalibrationEquationSolver([], ["+", "*", "||"])
+        self.assertTrue(solver.is_valid(test_value, numbers))
+        self.assertFalse(solver.is_valid(test_value + 1, numbers))
+
+    def test_custom_operators(self):
+        # Subtraction can be undone, but may make values smaller. The maximum can't be undone, but never makes values
+        # smaller.
+        register_operator("-", lambda value, number: value - number, lambda value, number: value + number)
+        register_operator("max", max, is_monotonic=True)
+        self.addCleanup(OPERATORS.pop, "-")
+        self.addCleanup(OPERATORS.pop, "max")
+
+        randomizer = random.Random(25)
+        for symbols in (["max"], ["+", "max"], ["*", "max"], ["+", "-"], ["-", "*", "max"], ["-", "||"]):
+            solver = CalibrationEquationSolver([], symbols)
+            for _ in range(100):
+                numbers = [randomizer.randrange(10) for _ in range(randomizer.randint(1, 5))]
+                values = {numbers[0]}
+                for number in numbers[1:]:
+                    values = {
+                        OPERATORS[symbol].apply(value, number)
+                        for value in values
+                        for symbol in symbols
+                    }
+                test_value = randomizer.choice([*values, randomizer.randrange(-20, 100)])
+                self.assertEqual(test_value in values, solver.is_valid(test_value, numbers), (symbols, numbers))
+
+        # Multiplying by zero makes the value smaller, and subtracting makes it negative
+        self.assertTrue(CalibrationEquationSolver([], ["*", "max"]).is_valid(3, [100, 5, 0, 3]))
+        self.assertTrue(CalibrationEquationSolver([], ["+", "-"]).is_valid(-1, [1, 5, 3]))
+
+        with self.assertRaises(ValueError):
+            CalibrationEquationSolver([], ["/"])
+
+        # The values of twenty numbers combined with subtraction and the maximum aren't bounded by the test value
+        solver = CalibrationEquationSolver([], ["-", "max", "*"], max_prefix_values=1000)
+        with self.assertRaises(ValueError):
+            solver.is_valid(-1, list(range(2, 22)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
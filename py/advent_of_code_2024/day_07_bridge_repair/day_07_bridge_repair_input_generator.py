@@ -0,0 +1,62 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 850
+MIN_NUMBER_COUNT = 2
+MAX_NUMBER_COUNT = 12
+OPERATORS = ["+", "*", "||"]
+
+
+def generate_input(scale, seed=0, number_count=None):
+    """
+    Generate calibration equations, about half of which can be made true.
+
+    The answer for part two is known: true equations are generated from random operators, and the test value of the
+    other equations is larger than the concatenation of all their numbers, which is the largest value any operators
+    can produce. Part one is unknown, because an equation using concatenation might also be solvable without it.
+
+    :param number_count: Number of numbers in every equation, random between 2 and 12 (like the real input) if not given
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+
+    lines = []
+    sum_of_valid_test_values = 0
+
+    for _ in range(line_count):
+        equation_number_count = number_count or rng.randint(MIN_NUMBER_COUNT, MAX_NUMBER_COUNT)
+        numbers = [_generate_number(rng) for _ in range(equation_number_count)]
+
+        if rng.random() < 0.5:
+            test_value = numbers[0]
+            for number in numbers[1:]:
+                test_value = _apply_operator(rng.choice(OPERATORS), test_value, number)
+            sum_of_valid_test_values += test_value
+        else:
+            concatenation = int("".join(map(str, numbers)))
+            test_value = rng.randint(concatenation + 1, 2 * concatenation)
+
+        lines.append(f"{test_value}: {' '.join(map(str, numbers))}")
+
+    return GeneratedInput("\n".join(lines), part_two=sum_of_valid_test_values)
+
+
+def _generate_number(rng):
+    # Mostly single digits, like the real input, which keeps the products from growing too quickly
+    return rng.randint(1, 9) if rng.random() < 0.7 else rng.randint(10, 999)
+
+
+def _apply_operator(operator, a, b):
+    if operator == "+":
+        return a + b
+    elif operator == "*":
+        return a * b
+    else:
+        return int(f"{a}{b}")
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2024, 7, generate_input(0.1, seed=1, number_count=5))
@@ -3,7 +3,8 @@ import unittest
 import itertools
 from collections import defaultdict
 
-from pygame.math import Vector2 as Vector
+from common.grid import Grid
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -13,7 +14,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = puzzle_input.splitlines()
+    grid = Grid(puzzle_input.splitlines())
     antenna_map = AntennaMap(grid)
     antenna_map.calculate_antinode_positions()
     return antenna_map.get_unique_antinode_count()
@@ -26,17 +27,17 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = puzzle_input.splitlines()
+    grid = Grid(puzzle_input.splitlines())
     antenna_map = ResonantAntennaMap(grid)
     antenna_map.calculate_antinode_positions()
     return antenna_map.get_unique_antinode_count()
 
 
 class AntennaMap:
+    # Antinodes can be arbitrarily far apart, so they are kept as (x, y) positions and checked
+    # against the bounds of the grid rather than its sentinel border
     def __init__(self, grid):
         self._grid = grid
-        self._height = len(grid)
-        self._width = len(grid[0])
         self._antenna_positions = self._parse_antenna_positions()
         self._antinode_positions = set()
 
@@ -49,45 +50,33 @@ class AntennaMap:
 
     def _parse_antenna_positions(self):
         positions = defaultdict(list)
-        [
-            positions[cell].append(Vector(x, y))
-            for y, row in enumerate(self._grid)
-            for x, cell in enumerate(row)
-            if cell.isalnum()
-        ]
+        for index in self._grid.indices():
+            cell = self._grid[index]
+            if cell.isalnum():
+                positions[cell].append(self._grid.position(index))
         return positions
 
     def _process_antenna_pairs(self, positions):
-        [
+        for antenna1_position, antenna2_position in itertools.combinations(positions, 2):
             self._antinode_positions.update(
-                [
-                    (antinode_position.x, antinode_position.y)
-                    for antinode_position in self._calculate_antinode_positions(
-                    antenna1_position, antenna2_position
-                )
-                ]
+                self._calculate_antinode_positions(antenna1_position, antenna2_position)
             )
-            for antenna1_position, antenna2_position in itertools.combinations(
-            positions, 2
-        )
-        ]
 
     def _calculate_antinode_positions(self, antenna1_position, antenna2_position):
-        delta = antenna1_position - antenna2_position
-        antinode_positions = [antenna1_position + delta, antenna2_position - delta]
+        (x1, y1), (x2, y2) = antenna1_position, antenna2_position
+        dx, dy = x1 - x2, y1 - y2
+        antinode_positions = [(x1 + dx, y1 + dy), (x2 - dx, y2 - dy)]
         return [
-            antinode
-            for antinode in antinode_positions
-            if self._is_within_bounds(antinode)
+            (x, y)
+            for x, y in antinode_positions
+            if self._grid.contains(x, y)
         ]
 
-    def _is_within_bounds(self, position):
-        return 0 <= position.x < self._width and 0 <= position.y < self._height
-
 
 class ResonantAntennaMap(AntennaMap):
     def _calculate_antinode_positions(self, antenna1_position, antenna2_position):
-        delta = antenna1_position - antenna2_position
+        (x1, y1), (x2, y2) = antenna1_position, antenna2_position
+        delta = (x1 - x2, y1 - y2)
         antinode_positions = []
 
         antinode_positions.extend(
@@ -100,14 +89,13 @@ class ResonantAntennaMap(AntennaMap):
         return antinode_positions
 
     def _get_antinode_positions_in_direction(self, start_position, delta, direction):
+        (x, y), (dx, dy) = start_position, delta
         antinode_positions = []
-        delta_multiplier = 0
 
-        while self._is_within_bounds(
-                position := start_position + delta * direction * delta_multiplier
-        ):
-            antinode_positions.append(position)
-            delta_multiplier += 1
+        while self._grid.contains(x, y):
+            antinode_positions.append((x, y))
+            x += dx * direction
+            y += dy * direction
 
         return antinode_positions
 
@@ -116,11 +104,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
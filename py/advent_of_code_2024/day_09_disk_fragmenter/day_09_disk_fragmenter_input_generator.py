@@ -0,0 +1,31 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_count
+
+REAL_INPUT_LENGTH = 19999
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate a disk map alternating between file sizes (1 to 9) and free space sizes (0 to 9), starting and ending
+    with a file.
+    """
+    rng = random.Random(seed)
+    file_count = get_scaled_count(REAL_INPUT_LENGTH // 2 + 1, scale)
+
+    digits = []
+    for i in range(file_count):
+        digits.append(rng.randint(1, 9))
+        if i < file_count - 1:
+            digits.append(rng.randint(0, 9))
+
+    return GeneratedInput("".join(map(str, digits)))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        disk_map = generate_input(1).puzzle_input
+        self.assertEqual(REAL_INPUT_LENGTH, len(disk_map))
+        self.assertNotEqual("0", disk_map[0])
+        self.assertNotEqual("0", disk_map[-1])
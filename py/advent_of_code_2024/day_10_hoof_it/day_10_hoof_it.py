@@ -2,6 +2,8 @@ import textwrap
 import unittest
 from collections import deque
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input):
     """
@@ -29,6 +31,19 @@ def solve_part_two(puzzle_input):
     return topographic_map.get_total_rating()
 
 
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, exploring the map only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    grid = parse_input(puzzle_input)
+    topographic_map = TopographicMap(grid)
+    topographic_map.explore()
+    return topographic_map.get_total_score(), topographic_map.get_total_rating()
+
+
 def parse_input(puzzle_input):
     return [[int(c) for c in line.strip()] for line in puzzle_input.splitlines()]
 
@@ -99,11 +114,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -128,6 +139,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 81
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (36, 81)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_side
+
+REAL_INPUT_SIDE = 55
+
+# Number of hiking trails carved into the map per cell
+TRAIL_DENSITY = 0.05
+
+DELTAS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate a topographic map of random heights, with hiking trails (0 to 9 in single steps) carved into it.
+    """
+    rng = random.Random(seed)
+    side = get_scaled_side(REAL_INPUT_SIDE, scale)
+    grid = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+
+    for _ in range(round(side * side * TRAIL_DENSITY)):
+        x, y = rng.randrange(side), rng.randrange(side)
+        for height in range(10):
+            grid[y][x] = height
+            delta_x, delta_y = rng.choice(DELTAS)
+            x = min(max(x + delta_x, 0), side - 1)
+            y = min(max(y + delta_y, 0), side - 1)
+
+    return GeneratedInput("\n".join("".join(map(str, row)) for row in grid))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        rows = generate_input(4).puzzle_input.splitlines()
+        self.assertEqual(2 * REAL_INPUT_SIDE, len(rows))
+        self.assertTrue(all(len(row) == 2 * REAL_INPUT_SIDE for row in rows))
@@ -2,6 +2,12 @@ import textwrap
 import unittest
 from collections import defaultdict
 
+from common.profiling import run_parts
+
+
+NUM_BLINKS_PART_ONE = 25
+NUM_BLINKS_PART_TWO = 75
+
 
 def solve_part_one(puzzle_input):
     """
@@ -10,7 +16,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    return get_num_stones_after_repeated_blinks(puzzle_input, 25)
+    return get_num_stones_after_repeated_blinks(puzzle_input, NUM_BLINKS_PART_ONE)
 
 
 def solve_part_two(puzzle_input):
@@ -20,7 +26,24 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    return get_num_stones_after_repeated_blinks(puzzle_input, 75)
+    return get_num_stones_after_repeated_blinks(puzzle_input, NUM_BLINKS_PART_TWO)
+
+
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, continuing to blink from where part one stopped.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    stones = list(map(int, puzzle_input.split(" ")))
+    simulator = StoneBlinkSimulator(stones)
+
+    simulator.blink_repeatedly(NUM_BLINKS_PART_ONE)
+    part_one_result = simulator.get_num_stones()
+
+    simulator.blink_repeatedly(NUM_BLINKS_PART_TWO - NUM_BLINKS_PART_ONE)
+    return part_one_result, simulator.get_num_stones()
 
 
 def get_num_stones_after_repeated_blinks(puzzle_input, num_blinks):
@@ -67,11 +90,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -89,6 +108,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 65601038650482
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (55312, 65601038650482)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -1,20 +1,9 @@
 import textwrap
 import unittest
 from collections import deque
-from pygame.math import Vector2
 
-
-class HashableVector(Vector2):
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, HashableVector):
-            return self.x == other.x and self.y == other.y
-        return False
-
-
-Vector = HashableVector
+from common.grid import Grid
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -24,7 +13,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = [list(row) for row in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     planner = GardenPlotPlanner(grid)
     planner.identify_regions()
     return planner.get_total_price()
@@ -37,33 +26,22 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = [list(row) for row in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     planner = GardenPlotPlannerWithDiscount(grid)
     planner.identify_regions()
     return planner.get_total_price()
 
 
 class GardenPlotPlanner:
-    DIRECTIONS = [
-        Vector(0, -1),
-        Vector(0, 1),
-        Vector(-1, 0),
-        Vector(1, 0),
-    ]  # Up, Down, Left, Right
-
     def __init__(self, grid):
         self._grid = grid
-        self._height = len(self._grid)
-        self._width = len(self._grid[0])
+        self._cells = grid.cells
+        self._directions = grid.orthogonal_offsets
         self._visited = set()
         self._regions = []
 
     def identify_regions(self):
-        positions = [
-            Vector(x, y) for y in range(self._height) for x in range(self._width)
-        ]
-
-        for position in positions:
+        for position in self._grid.indices():
             if position not in self._visited:
                 region = self._get_region_at(position)
                 self._regions.append(region)
@@ -83,18 +61,18 @@ class GardenPlotPlanner:
         queue.append(start)
         region = []
         self._visited.add(start)
-        plant_type = self._get_plant_at(start)
+        plant_type = self._cells[start]
 
         while queue:
             position = queue.popleft()
             region.append(position)
 
+            # Cells of the sentinel border never match a plant type
             valid_neighbor_positions = [
                 neighbor_position
                 for neighbor_position in self._get_neighbor_positions(position)
-                if self._is_in_bounds(neighbor_position)
-                   and neighbor_position not in self._visited
-                   and self._get_plant_at(neighbor_position) == plant_type
+                if neighbor_position not in self._visited
+                   and self._cells[neighbor_position] == plant_type
             ]
 
             for neighbor_position in valid_neighbor_positions:
@@ -103,22 +81,16 @@ class GardenPlotPlanner:
 
         return region
 
-    def _get_plant_at(self, position):
-        return self._grid[int(position.y)][int(position.x)]
-
     def _get_neighbor_positions(self, position):
-        return [position + direction for direction in self.DIRECTIONS]
-
-    def _is_in_bounds(self, position):
-        return 0 <= position.x < self._width and 0 <= position.y < self._height
+        return [position + direction for direction in self._directions]
 
     def _get_perimeter(self, region):
+        plant_type = self._cells[region[0]]
         return sum(
             1
             for position in region
             for neighbor_position in self._get_neighbor_positions(position)
-            if not self._is_in_bounds(neighbor_position)
-            or neighbor_position not in region
+            if self._cells[neighbor_position] != plant_type
         )
 
 
@@ -136,7 +108,7 @@ class GardenPlotPlannerWithDiscount(GardenPlotPlanner):
     def _get_num_sides(self, region):
         num_sides = 0
 
-        for direction in self.DIRECTIONS:
+        for direction in self._directions:
             edge_positions = self._get_edge_positions_in_direction(region, direction)
             num_sides += self._get_num_islands(edge_positions)
 
@@ -147,9 +119,7 @@ class GardenPlotPlannerWithDiscount(GardenPlotPlanner):
 
         for position in region:
             neighbor_position = position + direction
-            if not self._is_in_bounds(neighbor_position) or self._get_plant_at(
-                    neighbor_position
-            ) != self._get_plant_at(position):
+            if self._cells[neighbor_position] != self._cells[position]:
                 edge_positions.add(neighbor_position)
 
         return edge_positions
@@ -187,11 +157,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
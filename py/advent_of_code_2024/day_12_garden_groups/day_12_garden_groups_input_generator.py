@@ -0,0 +1,44 @@
+import random
+import string
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_side
+
+REAL_INPUT_SIDE = 140
+MIN_REGION_SIZE = 3
+MAX_REGION_SIZE = 15
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate a garden of irregular regions, by sampling a coarse grid of random plant types through per-row and
+    per-column offsets that make the region boundaries ragged.
+    """
+    rng = random.Random(seed)
+    side = get_scaled_side(REAL_INPUT_SIDE, scale)
+    region_size = rng.randint(MIN_REGION_SIZE, MAX_REGION_SIZE)
+    coarse_side = side // region_size + 2
+
+    coarse_grid = [
+        rng.choices(string.ascii_uppercase, k=coarse_side) for _ in range(coarse_side)
+    ]
+    column_offsets = [rng.randrange(region_size) for _ in range(side)]
+    row_offsets = [rng.randrange(region_size) for _ in range(side)]
+
+    rows = []
+    for y in range(side):
+        coarse_row = coarse_grid[(y + row_offsets[y]) // region_size]
+        rows.append(
+            "".join(
+                coarse_row[(x + column_offsets[x]) // region_size] for x in range(side)
+            )
+        )
+
+    return GeneratedInput("\n".join(rows))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        rows = generate_input(4).puzzle_input.splitlines()
+        self.assertEqual(2 * REAL_INPUT_SIDE, len(rows))
+        self.assertTrue(all(len(row) == 2 * REAL_INPUT_SIDE for row in rows))
@@ -1,7 +1,10 @@
+import io
 import textwrap
 import unittest
 import re
-import sympy as sp
+
+from common.profiling import run_parts
+from common.streaming import iter_blocks
 
 
 def solve_part_one(puzzle_input):
@@ -11,7 +14,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    machines = parse_input(puzzle_input)
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the machines one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    machines = parse_input(lines)
     return get_num_tokens_spent_to_win_all_prizes(machines)
 
 
@@ -22,11 +35,17 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    machines = parse_input(puzzle_input)
+    return solve_part_two_from_lines(puzzle_input)
 
-    for machine in machines:
-        machine.apply_prize_offset(10000000000000)
 
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the machines one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    machines = parse_input(lines, prize_offset=10000000000000)
     return get_num_tokens_spent_to_win_all_prizes(machines)
 
 
@@ -56,6 +75,8 @@ class ClawMachine:
         self.p_y += offset
 
     def solve_equation(self):
+        import sympy as sp
+
         # Define symbols for the button presses A and B
         A, B = sp.symbols("A B")
 
@@ -74,23 +95,25 @@ class ClawMachine:
         return None
 
 
-def parse_input(puzzle_input):
-    input_lines = puzzle_input.splitlines()
-    machines = []
-
+def parse_input(lines, prize_offset=0):
+    """
+    :param lines: The input data as string, or an iterable of lines
+    :param prize_offset: Offset applied to both coordinates of every prize
+    :return: Generator of the machines, parsed one at a time
+    """
     # Regex pattern to capture the values for a_x, a_y, b_x, b_y, p_x, p_y
     pattern = re.compile(
         r"Button A: X\+(\d+), Y\+(\d+)\s*Button B: X\+(\d+), Y\+(\d+)\s*Prize: X=(\d+), Y=(\d+)"
     )
 
-    # Parse each line set (3 lines per machine configuration, plus an empty line after each machine)
-    for i in range(0, len(input_lines), 4):
-        match = pattern.match(input_lines[i] + input_lines[i + 1] + input_lines[i + 2])
+    # Parse each block of lines (3 lines per machine configuration, separated by empty lines)
+    for block in iter_blocks(lines):
+        match = pattern.match("".join(block))
         if match:
             a_x, a_y, b_x, b_y, p_x, p_y = map(int, match.groups())
-            machines.append(ClawMachine(a_x, a_y, b_x, b_y, p_x, p_y))
-
-    return machines
+            machine = ClawMachine(a_x, a_y, b_x, b_y, p_x, p_y)
+            machine.apply_prize_offset(prize_offset)
+            yield machine
 
 
 def get_num_tokens_spent_to_win_all_prizes(machines):
@@ -106,11 +129,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -142,6 +161,9 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 875318608908
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(480, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
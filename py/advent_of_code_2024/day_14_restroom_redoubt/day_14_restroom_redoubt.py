@@ -2,11 +2,11 @@ import textwrap
 import unittest
 import re
 import operator
-import numpy as np
-from pygame.math import Vector2 as Vector
 from collections import namedtuple
 from functools import reduce
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input, width=101, height=103):
     """
@@ -48,7 +48,7 @@ def parse_input(puzzle_input):
     lines = puzzle_input.splitlines()
     for line in lines:
         x, y, vx, vy = map(int, re.match(pattern, line).groups())
-        robot = Robot(pos=Vector(x, y), vel=Vector(vx, vy))
+        robot = Robot(pos=(x, y), vel=(vx, vy))
         robots.append(robot)
 
     return robots
@@ -86,15 +86,15 @@ class RobotSimulation:
 
     def _simulate_step(self):
         # Move the robots and apply edge wrapping
-        self._robots = [
-            Robot(pos=robot.pos + robot.vel, vel=robot.vel) for robot in self._robots
-        ]
         self._robots = [
             Robot(
-                pos=Vector(robot.pos.x % self._width, robot.pos.y % self._height),
-                vel=robot.vel,
+                pos=(
+                    (x + vx) % self._width,
+                    (y + vy) % self._height,
+                ),
+                vel=(vx, vy),
             )
-            for robot in self._robots
+            for (x, y), (vx, vy) in self._robots
         ]
 
     def _count_robots_in_quadrants(self):
@@ -120,9 +120,11 @@ class RobotSimulation:
         return quadrants
 
     def _calculate_variance(self):
+        import numpy as np
+
         # Calculate the variance of the x and y positions of all robots
-        x_coords = [robot.pos.x for robot in self._robots]
-        y_coords = [robot.pos.y for robot in self._robots]
+        x_coords = [x for (x, _), _ in self._robots]
+        y_coords = [y for (_, y), _ in self._robots]
 
         variance_x = np.var(x_coords)
         variance_y = np.var(y_coords)
@@ -134,11 +136,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -1,23 +1,9 @@
 import textwrap
 import unittest
-import itertools
 from collections import deque
 
-from pygame.math import Vector2
-from copy import deepcopy
-
-
-class HashableVector(Vector2):
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, HashableVector):
-            return self.x == other.x and self.y == other.y
-        return False
-
-
-Vector = HashableVector
+from common.grid import Grid
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -54,44 +40,33 @@ def parse_input(input_data):
 
 
 class WarehouseRobot:
-    LEFT = Vector(-1, 0)
-    RIGHT = Vector(1, 0)
-    UP = Vector(0, -1)
-    DOWN = Vector(0, 1)
+    WALL = ord("#")
 
     def __init__(self, grid, moves):
-        self._robot_position = None
-        self._wall_positions = set()
-        self._box_positions = set()
-
-        # Generate all coordinate pairs (x, y) based on grid dimensions
-        height, width = len(grid), len(grid[0])
-        coordinates = itertools.product(range(width), range(height))
-
-        for x, y in coordinates:
-            cell = grid[y][x]
-
-            position = Vector(x, y)
-            if cell == "@":
-                self._robot_position = position
-            elif cell == "#":
-                self._wall_positions.add(position)
-            elif cell == "O" or cell == "[":
-                self._box_positions.add(position)
+        self._grid = Grid(grid)
+        self._cells = self._grid.cells
+        self._directions = {
+            ">": self._grid.right,
+            "<": self._grid.left,
+            "^": self._grid.up,
+            "v": self._grid.down,
+        }
+
+        # Walls never move, so they are looked up in the grid, while boxes are tracked by their (left) position
+        self._robot_position = self._grid.find("@")
+        self._box_positions = set(self._grid.find_all("O") + self._grid.find_all("["))
 
         self._moves = moves
 
     def run_simulation(self):
         for move in self._moves:
-            direction = self._get_direction(move)
+            direction = self._directions[move]
             self._move_robot(direction)
 
     def compute_gps_sum(self):
-        return int(
-            sum(
-                100 * box_position.y + box_position.x
-                for box_position in self._box_positions
-            )
+        return sum(
+            100 * y + x
+            for x, y in map(self._grid.position, self._box_positions)
         )
 
     def _move_robot(self, direction):
@@ -106,21 +81,21 @@ class WarehouseRobot:
         boxes_pushed = []
 
         while (
-                potential_box_position not in self._wall_positions
+                self._cells[potential_box_position] != self.WALL
                 and potential_box_position in self._box_positions
         ):
-            boxes_pushed.append(deepcopy(potential_box_position))
+            boxes_pushed.append(potential_box_position)
             potential_box_position += direction
 
         return boxes_pushed
 
     def _can_push_boxes(self, boxes, direction):
         if not boxes:
-            return self._robot_position + direction not in self._wall_positions
+            return self._cells[self._robot_position + direction] != self.WALL
 
         # Check if there is space to push the boxes
         last_box_position = boxes[-1] + direction
-        return last_box_position not in self._wall_positions
+        return self._cells[last_box_position] != self.WALL
 
     def _push_boxes(self, boxes_pushed, direction):
         # Reverse the order to prevent boxes from temporarily overlapping when moved.
@@ -130,16 +105,6 @@ class WarehouseRobot:
             new_pos = box + direction
             self._box_positions.add(new_pos)
 
-    def _get_direction(self, move):
-        if move == ">":
-            return self.RIGHT
-        elif move == "<":
-            return self.LEFT
-        elif move == "^":
-            return self.UP
-        elif move == "v":
-            return self.DOWN
-
 
 class WideWareHouseRobot(WarehouseRobot):
     def __init__(self, grid, moves):
@@ -176,9 +141,7 @@ class WideWareHouseRobot(WarehouseRobot):
             0,
             1,
         ]:  # 0 for the left side of the box, 1 for the right side of the box
-            potential_pushed_box_position = (
-                    self._robot_position + direction - Vector(offset, 0)
-            )
+            potential_pushed_box_position = self._robot_position + direction - offset
             if potential_pushed_box_position in self._box_positions:
                 boxes_to_process_queue.append(potential_pushed_box_position)
 
@@ -196,15 +159,15 @@ class WideWareHouseRobot(WarehouseRobot):
 
     def _can_push_boxes(self, boxes, direction):
         if not boxes:
-            return self._robot_position + direction not in self._wall_positions
+            return self._cells[self._robot_position + direction] != self.WALL
 
         return all(self._can_push_box(box, direction) for box in boxes)
 
     def _get_neighbor_boxes(self, box_to_process, direction):
         potential_neighbor_box_positions = [
             box_to_process + direction,
-            box_to_process + direction + Vector(-1, 0),
-            box_to_process + direction + Vector(1, 0),
+            box_to_process + direction + self._grid.left,
+            box_to_process + direction + self._grid.right,
         ]
 
         actual_neighbor_boxes = [
@@ -216,8 +179,8 @@ class WideWareHouseRobot(WarehouseRobot):
 
     def _can_push_box(self, box, direction):
         return all(
-            (box + direction + offset) not in self._wall_positions
-            for offset in [Vector(0, 0), Vector(1, 0)]
+            self._cells[box + direction + offset] != self.WALL
+            for offset in [0, self._grid.right]
         )
 
 
@@ -225,11 +188,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
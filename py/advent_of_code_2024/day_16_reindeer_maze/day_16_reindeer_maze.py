@@ -1,25 +1,9 @@
 import textwrap
 import unittest
 from heapq import heappop, heappush
-from pygame.math import Vector2
 
-
-class HashableComparableVector(Vector2):
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, HashableComparableVector):
-            return self.x == other.x and self.y == other.y
-        return False
-
-    def __lt__(self, other):
-        if isinstance(other, HashableComparableVector):
-            return (self.x, self.y) < (other.x, other.y)
-        return False
-
-
-Vector = HashableComparableVector
+from common.grid import Grid
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -29,7 +13,7 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = [list(row) for row in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     reindeer_maze = ReindeerMaze(grid)
     reindeer_maze.traverse()
     return reindeer_maze.get_best_score()
@@ -42,31 +26,42 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = [list(row) for row in puzzle_input.splitlines()]
+    grid = Grid(puzzle_input.splitlines())
     reindeer_maze = ReindeerMaze(grid)
     reindeer_maze.traverse()
     return reindeer_maze.get_num_tiles_part_of_at_least_one_best_path()
 
 
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, traversing the maze only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    grid = Grid(puzzle_input.splitlines())
+    reindeer_maze = ReindeerMaze(grid)
+    reindeer_maze.traverse()
+    return (
+        reindeer_maze.get_best_score(),
+        reindeer_maze.get_num_tiles_part_of_at_least_one_best_path(),
+    )
+
+
 class ReindeerMaze:
-    # Directions are in the order of East, North, West, South (counterclockwise)
-    DIRECTIONS = [Vector(1, 0), Vector(0, -1), Vector(-1, 0), Vector(0, 1)]
     EAST_DIRECTION_INDEX = 0
+    WALL = ord("#")
 
     def __init__(self, grid):
         self._grid = grid
-        self._start_position = self._find_position("S")
-        self._end_position = self._find_position("E")
+        # Directions are in the order of East, North, West, South (counterclockwise)
+        self._directions = [grid.right, grid.up, grid.left, grid.down]
+        self._start_position = grid.find("S")
+        self._end_position = grid.find("E")
 
         self._best_score = float("inf")
         self._best_path_tiles = set()
 
-    def _find_position(self, char):
-        for y, row in enumerate(self._grid):
-            for x, cell in enumerate(row):
-                if cell == char:
-                    return Vector(x, y)
-
     def traverse(self):
         # Priority queue will store tuples of (score, path, direction)
         priority_queue = []
@@ -102,10 +97,8 @@ class ReindeerMaze:
                     self._best_path_tiles.update(current_path)
 
             # Move forward
-            forward_position = (
-                    current_position + self.DIRECTIONS[current_direction_index]
-            )
-            if self._grid[int(forward_position.y)][int(forward_position.x)] != "#":
+            forward_position = current_position + self._directions[current_direction_index]
+            if self._grid.cells[forward_position] != self.WALL:
                 heappush(
                     priority_queue,
                     (
@@ -148,11 +141,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -214,6 +203,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 64
         self.assertEqual(expected_output, solve_part_two(self.SECOND_EXAMPLE))
 
+    def test_solve_both(self):
+        self.assertEqual((7036, 45), solve_both(self.FIRST_EXAMPLE))
+        self.assertEqual((11048, 64), solve_both(self.SECOND_EXAMPLE))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -2,6 +2,8 @@ import textwrap
 import unittest
 import re
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input):
     """
@@ -206,11 +208,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -1,25 +1,14 @@
 import textwrap
 import unittest
 from collections import deque
-from pygame.math import Vector2
+
+from common.grid import Grid
+from common.profiling import run_parts
 
 REAL_INPUT_GRID_SIZE = 71
 REAL_INPUT_NUM_BYTE_FALLS_TO_SIMULATE = 71
 
 
-class HashableVector(Vector2):
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, HashableVector):
-            return self.x == other.x and self.y == other.y
-        return False
-
-
-Vector = HashableVector
-
-
 def solve_part_one(
         puzzle_input,
         grid_size=REAL_INPUT_GRID_SIZE,
@@ -57,22 +46,15 @@ def solve_part_two(puzzle_input, grid_size=REAL_INPUT_GRID_SIZE):
 
 
 class MemoryGridTraverser:
-    DIRECTIONS = [
-        Vector(0, -1),
-        Vector(0, 1),
-        Vector(-1, 0),
-        Vector(1, 0),
-    ]  # Up, Down, Left, Right
+    CORRUPTED = "#"
 
     def __init__(self, byte_falls, grid_size, num_byte_falls_to_simulate):
         self._byte_falls = byte_falls
-        self._grid_size = grid_size
-        self._corrupted_positions = set()
-        self._start = Vector(0, 0)
-        self._end = Vector(grid_size - 1, grid_size - 1)
-        self._corrupted_positions.update(
-            [Vector(x, y) for x, y in self._byte_falls[:num_byte_falls_to_simulate]]
-        )
+        self._grid = Grid.filled(grid_size, grid_size)
+        self._start = self._grid.index(0, 0)
+        self._end = self._grid.index(grid_size - 1, grid_size - 1)
+        for x, y in self._byte_falls[:num_byte_falls_to_simulate]:
+            self._grid[self._grid.index(x, y)] = self.CORRUPTED
 
         self._shortest_path_length = float("inf")
 
@@ -102,22 +84,18 @@ class MemoryGridTraverser:
         return self._shortest_path_length
 
     def _get_valid_neighbor_positions(self, current_position):
-        potential_neighbors = [
-            current_position + direction for direction in self.DIRECTIONS
-        ]
+        # Both the sentinel border and corrupted bytes block the way
+        empty = ord(".")
+        cells = self._grid.cells
         return [
             neighbor
-            for neighbor in potential_neighbors
-            if self._is_valid_position(neighbor)
+            for neighbor in (
+                current_position + direction
+                for direction in self._grid.orthogonal_offsets
+            )
+            if cells[neighbor] == empty
         ]
 
-    def _is_valid_position(self, position):
-        return (
-                0 <= position.x < self._grid_size
-                and 0 <= position.y < self._grid_size
-                and position not in self._corrupted_positions
-        )
-
 
 def parse_input(input_data):
     # Parse input as a list of tuples (x, y)
@@ -128,11 +106,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -1,6 +1,10 @@
+import io
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+from common.streaming import iter_records
+
 
 def solve_part_one(puzzle_input):
     """
@@ -9,7 +13,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    available_patterns, desired_designs = parse_input(puzzle_input)
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the designs one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    available_patterns, desired_designs = parse_input(lines)
     designer = TowelDesigner(available_patterns, desired_designs)
     return designer.count_possible_designs()
 
@@ -21,16 +35,45 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    available_patterns, desired_designs = parse_input(puzzle_input)
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the designs one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    available_patterns, desired_designs = parse_input(lines)
     designer = TowelDesigner(available_patterns, desired_designs)
     return designer.count_total_ways_to_form_all_designs()
 
 
-def parse_input(input_data):
-    parts = input_data.split("\n\n")
-    available_patterns = parts[0].split(", ")
-    desired_designs = parts[1].splitlines()
-    return available_patterns, desired_designs
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, counting the ways to form each design only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    available_patterns, desired_designs = parse_input(puzzle_input)
+    designer = TowelDesigner(available_patterns, desired_designs)
+    ways_to_form_designs = designer.get_ways_to_form_designs()
+    return (
+        sum(1 for ways in ways_to_form_designs if ways > 0),
+        sum(ways_to_form_designs),
+    )
+
+
+def parse_input(lines):
+    """
+    :param lines: The input data as string, or an iterable of lines
+    :return: Tuple of the available patterns and a generator of the desired designs, read one at a time
+    """
+    records = iter_records(lines)
+    available_patterns = next(records).split(", ")
+    return available_patterns, records
 
 
 class TowelDesigner:
@@ -50,6 +93,11 @@ class TowelDesigner:
             self._count_ways_to_form_design(design) for design in self._desired_designs
         )
 
+    def get_ways_to_form_designs(self):
+        return [
+            self._count_ways_to_form_design(design) for design in self._desired_designs
+        ]
+
     def _count_ways_to_form_design(self, design):
         # Dynamic Programming approach to count how many ways the design can be formed
         design_length = len(design)
@@ -74,11 +122,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -105,6 +149,14 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 16
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (6, 16)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
+    def test_from_lines(self):
+        self.assertEqual(6, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(16, solve_part_two_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
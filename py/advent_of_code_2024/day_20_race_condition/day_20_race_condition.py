@@ -1,26 +1,15 @@
 import textwrap
 import unittest
-from pygame.math import Vector2
 from collections import deque
 
+from common.grid import Grid
+from common.profiling import run_parts
+
 REAL_INPUT_REQUIRED_IMPROVEMENT_VIA_CHEATING = 100
 ALLOWED_CHEAT_LENGTH_PART_ONE = 2
 ALLOWED_CHEAT_LENGTH_PART_TWO = 20
 
 
-class HashableVector(Vector2):
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        if isinstance(other, HashableVector):
-            return self.x == other.x and self.y == other.y
-        return False
-
-
-Vector = HashableVector
-
-
 def solve_part_one(
         puzzle_input,
         required_improvement_via_cheating=REAL_INPUT_REQUIRED_IMPROVEMENT_VIA_CHEATING,
@@ -31,11 +20,9 @@ def solve_part_one(
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    grid = puzzle_input.splitlines()
-    race_track = RaceTrack(
-        grid, required_improvement_via_cheating, ALLOWED_CHEAT_LENGTH_PART_ONE
-    )
-    return race_track.calculate_num_total_valid_cheats()
+    grid = Grid(puzzle_input.splitlines(), border=ALLOWED_CHEAT_LENGTH_PART_TWO)
+    race_track = RaceTrack(grid, required_improvement_via_cheating)
+    return race_track.calculate_num_total_valid_cheats(ALLOWED_CHEAT_LENGTH_PART_ONE)
 
 
 def solve_part_two(
@@ -48,22 +35,36 @@ def solve_part_two(
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    grid = puzzle_input.splitlines()
-    race_track = RaceTrack(
-        grid, required_improvement_via_cheating, ALLOWED_CHEAT_LENGTH_PART_TWO
+    grid = Grid(puzzle_input.splitlines(), border=ALLOWED_CHEAT_LENGTH_PART_TWO)
+    race_track = RaceTrack(grid, required_improvement_via_cheating)
+    return race_track.calculate_num_total_valid_cheats(ALLOWED_CHEAT_LENGTH_PART_TWO)
+
+
+def solve_both(
+        puzzle_input,
+        required_improvement_via_cheating=REAL_INPUT_REQUIRED_IMPROVEMENT_VIA_CHEATING,
+):
+    """
+    Solve both parts of the Advent of Code puzzle, measuring the distances along the track only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    grid = Grid(puzzle_input.splitlines(), border=ALLOWED_CHEAT_LENGTH_PART_TWO)
+    race_track = RaceTrack(grid, required_improvement_via_cheating)
+    return (
+        race_track.calculate_num_total_valid_cheats(ALLOWED_CHEAT_LENGTH_PART_ONE),
+        race_track.calculate_num_total_valid_cheats(ALLOWED_CHEAT_LENGTH_PART_TWO),
     )
-    return race_track.calculate_num_total_valid_cheats()
 
 
 class RaceTrack:
-    DIRECTIONS = [Vector(0, -1), Vector(0, 1), Vector(-1, 0), Vector(1, 0)]
-
-    def __init__(self, grid, required_improvement_via_cheating, allowed_cheat_length):
+    def __init__(self, grid, required_improvement_via_cheating):
+        # The border of the grid must be at least as wide as the allowed cheat length
         self._grid = grid
         self._required_improvement_via_cheating = required_improvement_via_cheating
-        self._allowed_cheat_length = allowed_cheat_length
-        self._start_position = self._find_position("S")
-        self._end_position = self._find_position("E")
+        self._start_position = grid.find("S")
+        self._end_position = grid.find("E")
         self._distances_from_start = self._get_distances_from_position(
             self._start_position
         )
@@ -72,7 +73,7 @@ class RaceTrack:
             self._end_position
         ]
 
-    def calculate_num_total_valid_cheats(self):
+    def calculate_num_total_valid_cheats(self, allowed_cheat_length):
         # Prefilter valid cheat start position to those that are within min_distance_without_cheating
         cheat_start_positions = [
             cheat_start_position
@@ -80,24 +81,16 @@ class RaceTrack:
             if distance_from_start < self._min_distance_without_cheating
         ]
 
+        cheat_offsets = self._get_cheat_offsets(allowed_cheat_length)
         return sum(
-            self._count_num_valid_cheats_from_position(cheat_start_position)
+            self._count_num_valid_cheats_from_position(
+                cheat_start_position, cheat_offsets
+            )
             for cheat_start_position in cheat_start_positions
         )
 
-    def _find_position(self, char):
-        for y, row in enumerate(self._grid):
-            for x, cell in enumerate(row):
-                if cell == char:
-                    return Vector(x, y)
-
     def _is_valid_position(self, position):
-        x, y = int(position.x), int(position.y)
-        return (
-                0 <= x < len(self._grid[0])
-                and 0 <= y < len(self._grid)
-                and self._grid[y][x] != "#"
-        )
+        return self._grid.is_inside(position) and self._grid[position] != "#"
 
     def _get_distances_from_position(self, start_position):
         queue = deque([(start_position, 0)])  # (position, time_taken)
@@ -108,7 +101,7 @@ class RaceTrack:
 
             valid_neighbor_positions = [
                 current_position + direction
-                for direction in self.DIRECTIONS
+                for direction in self._grid.orthogonal_offsets
                 if self._is_valid_position(current_position + direction)
                 and (current_position + direction) not in position_to_distance
             ]
@@ -119,63 +112,50 @@ class RaceTrack:
 
         return position_to_distance
 
-    def _count_num_valid_cheats_from_position(self, cheat_start_position):
+    def _count_num_valid_cheats_from_position(self, cheat_start_position, cheat_offsets):
         return sum(
             1
-            for cheat_end_position in self._get_valid_cheat_end_positions(
-                cheat_start_position
+            for cheat_end_position, cheat_distance in self._get_valid_cheat_ends(
+                cheat_start_position, cheat_offsets
             )
             if self._is_cheat_saving_enough_time(
-                cheat_start_position, cheat_end_position
+                cheat_start_position, cheat_end_position, cheat_distance
             )
         )
 
-    def _get_valid_cheat_end_positions(self, cheat_start_position):
+    def _get_valid_cheat_ends(self, cheat_start_position, cheat_offsets):
         return [
-            Vector(cheat_start_position.x + dx, cheat_start_position.y + dy)
-            for dx, dy in self._get_cheat_offsets()
-            if self._is_valid_position(
-                Vector(cheat_start_position.x + dx, cheat_start_position.y + dy)
-            )
+            (cheat_start_position + offset, cheat_distance)
+            for offset, cheat_distance in cheat_offsets
+            if self._is_valid_position(cheat_start_position + offset)
         ]
 
-    def _get_cheat_offsets(self):
+    def _get_cheat_offsets(self, allowed_cheat_length):
+        # Pairs of (index offset, cheat distance), as the distance is not derivable from an index offset
         return [
-            (dx, dy)
-            for dx in range(-self._allowed_cheat_length, self._allowed_cheat_length + 1)
-            for dy in range(-self._allowed_cheat_length, self._allowed_cheat_length + 1)
-            if abs(dx) + abs(dy) <= self._allowed_cheat_length
+            (self._grid.offset(dx, dy), abs(dx) + abs(dy))
+            for dx in range(-allowed_cheat_length, allowed_cheat_length + 1)
+            for dy in range(-allowed_cheat_length, allowed_cheat_length + 1)
+            if abs(dx) + abs(dy) <= allowed_cheat_length
         ]
 
-    def _is_cheat_saving_enough_time(self, cheat_start_position, cheat_end_position):
-        distance_after_cheating = self._calculate_distance_after_cheating(
-            cheat_start_position, cheat_end_position
-        )
-        improvement = self._min_distance_without_cheating - distance_after_cheating
-        return improvement >= self._required_improvement_via_cheating
-
-    def _calculate_distance_after_cheating(
-            self, cheat_start_position, cheat_end_position
+    def _is_cheat_saving_enough_time(
+            self, cheat_start_position, cheat_end_position, cheat_distance
     ):
-        cheat_distance = abs(cheat_end_position.x - cheat_start_position.x) + abs(
-            cheat_end_position.y - cheat_start_position.y
-        )
-        return (
+        distance_after_cheating = (
                 self._distances_from_start[cheat_start_position]
                 + cheat_distance
                 + self._distances_from_end[cheat_end_position]
         )
+        improvement = self._min_distance_without_cheating - distance_after_cheating
+        return improvement >= self._required_improvement_via_cheating
 
 
 def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -207,6 +187,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 285
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT, 50))
 
+    def test_solve_both(self):
+        expected_output = (1, 285)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT, 50))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -1,7 +1,10 @@
+import io
 import textwrap
 import unittest
 from functools import cache
-from pygame.math import Vector2 as Vector
+
+from common.profiling import run_parts
+from common.streaming import iter_records
 
 NUM_ROBOTS_PART_ONE = 2
 NUM_ROBOTS_PART_TWO = 25
@@ -14,7 +17,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    return solve_for_number_of_robots(puzzle_input, NUM_ROBOTS_PART_ONE)
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the codes one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    return solve_for_number_of_robots(lines, NUM_ROBOTS_PART_ONE)
 
 
 def solve_part_two(puzzle_input):
@@ -24,14 +37,23 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    return solve_for_number_of_robots(puzzle_input, NUM_ROBOTS_PART_TWO)
+    return solve_part_two_from_lines(puzzle_input)
 
 
-def solve_for_number_of_robots(puzzle_input, num_robots):
-    codes = puzzle_input.splitlines()
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the codes one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    return solve_for_number_of_robots(lines, NUM_ROBOTS_PART_TWO)
+
+
+def solve_for_number_of_robots(lines, num_robots):
     return sum(
         KeypadSolver(code, num_robots).calculate_min_length() * int(code[:3])
-        for code in codes
+        for code in iter_records(lines)
     )
 
 
@@ -52,17 +74,17 @@ class KeypadSolver:
             +---+---+
         """
         self.NUMERIC_PAD_POSITIONS = {
-            "7": Vector(0, 0),
-            "8": Vector(0, 1),
-            "9": Vector(0, 2),
-            "4": Vector(1, 0),
-            "5": Vector(1, 1),
-            "6": Vector(1, 2),
-            "1": Vector(2, 0),
-            "2": Vector(2, 1),
-            "3": Vector(2, 2),
-            "0": Vector(3, 1),
-            "A": Vector(3, 2),
+            "7": (0, 0),
+            "8": (0, 1),
+            "9": (0, 2),
+            "4": (1, 0),
+            "5": (1, 1),
+            "6": (1, 2),
+            "1": (2, 0),
+            "2": (2, 1),
+            "3": (2, 2),
+            "0": (3, 1),
+            "A": (3, 2),
         }
 
         """
@@ -73,18 +95,18 @@ class KeypadSolver:
         +---+---+---+
         """
         self.DIRECTIONAL_PAD_POSITIONS = {
-            "^": Vector(0, 1),
-            "A": Vector(0, 2),
-            "<": Vector(1, 0),
-            "v": Vector(1, 1),
-            ">": Vector(1, 2),
+            "^": (0, 1),
+            "A": (0, 2),
+            "<": (1, 0),
+            "v": (1, 1),
+            ">": (1, 2),
         }
 
         self.DIRECTIONS = {
-            "^": Vector(-1, 0),
-            "v": Vector(1, 0),
-            "<": Vector(0, -1),
-            ">": Vector(0, 1),
+            "^": (-1, 0),
+            "v": (1, 0),
+            "<": (0, -1),
+            ">": (0, 1),
         }
 
     def calculate_min_length(self):
@@ -123,8 +145,7 @@ class KeypadSolver:
         return self.DIRECTIONAL_PAD_POSITIONS
 
     def _get_valid_paths(self, start, end, char_to_position):
-        delta = end - start
-        delta_x, delta_y = int(delta.x), int(delta.y)
+        delta_x, delta_y = end[0] - start[0], end[1] - start[1]
 
         horizontal_component = "^" * abs(delta_x) if delta_x < 0 else "v" * delta_x
         vertical_component = "<" * abs(delta_y) if delta_y < 0 else ">" * delta_y
@@ -132,11 +153,11 @@ class KeypadSolver:
         paths = []
 
         # Check moving horizontally and then vertically
-        if start + Vector(delta_x, 0) in char_to_position.values():
+        if (start[0] + delta_x, start[1]) in char_to_position.values():
             paths.append(horizontal_component + vertical_component)
 
         # Check moving vertically and then horizontally
-        if start + Vector(0, delta_y) in char_to_position.values():
+        if (start[0], start[1] + delta_y) in char_to_position.values():
             paths.append(vertical_component + horizontal_component)
 
         # Return the paths with the 'A' appended
@@ -147,11 +168,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -173,6 +190,9 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 154115708116294
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(126384, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
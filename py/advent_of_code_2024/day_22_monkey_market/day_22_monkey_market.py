@@ -1,5 +1,10 @@
+import io
 import textwrap
 import unittest
+from collections import Counter
+
+from common.profiling import run_parts
+from common.streaming import iter_records
 
 
 def solve_part_one(puzzle_input):
@@ -9,14 +14,19 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    input_secret_numbers = parse_input(puzzle_input)
+    return solve_part_one_from_lines(puzzle_input)
 
-    total_sum = 0
-    for secret_number in input_secret_numbers:
-        buyer = MonkeyBuyer(secret_number)
-        buyer.generate_secret_numbers(2000)
-        total_sum += buyer.get_most_recent_secret_number()
-    return total_sum
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the buyers one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    input_secret_numbers = parse_input(lines)
+    buyers = iter_buyers_with_generated_secret_numbers(input_secret_numbers)
+    return get_sum_of_most_recent_secret_numbers(buyers)
 
 
 def solve_part_two(puzzle_input):
@@ -26,45 +36,77 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    input_secret_numbers = parse_input(puzzle_input)
-    buyers = [MonkeyBuyer(secret_number) for secret_number in input_secret_numbers]
-    delta_sequence_to_final_price_dicts = get_delta_sequence_to_final_price_dicts(
-        buyers
-    )
-
-    # Create a set to store all unique 4-number sequences encountered across all buyers
-    all_delta_sequences_union = set()
-    for delta_sequence_to_final_price_dict in delta_sequence_to_final_price_dicts:
-        all_delta_sequences_union.update(delta_sequence_to_final_price_dict.keys())
-
-    return max(
-        sum(
-            seq_dict.get(sequence, 0)
-            for seq_dict in delta_sequence_to_final_price_dicts
-        )
-        for sequence in all_delta_sequences_union
-    )
+    return solve_part_two_from_lines(puzzle_input)
 
 
-def parse_input(input_string):
-    return [int(line.strip()) for line in input_string.strip().splitlines()]
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the buyers one by one.
 
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    input_secret_numbers = parse_input(lines)
+    buyers = iter_buyers_with_generated_secret_numbers(input_secret_numbers)
+    return get_most_bananas(buyers)
 
-def get_delta_sequence_to_final_price_dicts(buyers):
-    delta_sequence_to_final_price_dicts = []
 
-    for buyer in buyers:
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, generating the secret numbers of every buyer only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    input_secret_numbers = parse_input(puzzle_input)
+    buyers = get_buyers_with_generated_secret_numbers(input_secret_numbers)
+    return get_sum_of_most_recent_secret_numbers(buyers), get_most_bananas(buyers)
+
+
+def get_buyers_with_generated_secret_numbers(input_secret_numbers):
+    return list(iter_buyers_with_generated_secret_numbers(input_secret_numbers))
+
+
+def iter_buyers_with_generated_secret_numbers(input_secret_numbers):
+    """
+    Generate the secret numbers of one buyer at a time, so that only the buyers still in use are kept in memory.
+    """
+    for secret_number in input_secret_numbers:
+        buyer = MonkeyBuyer(secret_number)
         buyer.generate_secret_numbers(2000)
-        secret_numbers = buyer.get_secret_numbers()
-        prices = [num % 10 for num in secret_numbers]
+        yield buyer
+
+
+def get_sum_of_most_recent_secret_numbers(buyers):
+    return sum(buyer.get_most_recent_secret_number() for buyer in buyers)
 
-        price_delta_calculator = PriceDeltaCalculator(prices)
-        delta_sequence_to_final_price_dict = (
-            price_delta_calculator.get_delta_sequence_to_final_price_dict()
+
+def get_most_bananas(buyers):
+    # Total bananas per 4-number sequence across the buyers seen so far, which is all that needs to be kept per buyer
+    delta_sequence_to_total_bananas = Counter()
+
+    for buyer in buyers:
+        delta_sequence_to_total_bananas.update(
+            get_delta_sequence_to_final_price_dict(buyer)
         )
-        delta_sequence_to_final_price_dicts.append(delta_sequence_to_final_price_dict)
 
-    return delta_sequence_to_final_price_dicts
+    return max(delta_sequence_to_total_bananas.values())
+
+
+def parse_input(lines):
+    """
+    :param lines: The input data as string, or an iterable of lines
+    :return: Generator of the initial secret numbers, parsed one at a time
+    """
+    return (int(line.strip()) for line in iter_records(lines))
+
+
+def get_delta_sequence_to_final_price_dict(buyer):
+    secret_numbers = buyer.get_secret_numbers()
+    prices = [num % 10 for num in secret_numbers]
+
+    price_delta_calculator = PriceDeltaCalculator(prices)
+    return price_delta_calculator.get_delta_sequence_to_final_price_dict()
 
 
 class PriceDeltaCalculator:
@@ -126,11 +168,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -158,6 +196,24 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 23
         self.assertEqual(expected_output, solve_part_two(puzzle_input))
 
+    def test_solve_both(self):
+        puzzle_input = textwrap.dedent(
+            """
+            1
+            2
+            3
+            2024
+            """
+        ).strip()
+        self.assertEqual(
+            (solve_part_one(puzzle_input), solve_part_two(puzzle_input)),
+            solve_both(puzzle_input),
+        )
+
+    def test_from_lines(self):
+        lines = io.StringIO("1\n2\n3\n2024\n")
+        self.assertEqual(23, solve_part_two_from_lines(lines))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
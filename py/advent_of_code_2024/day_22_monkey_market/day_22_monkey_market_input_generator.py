@@ -0,0 +1,24 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 1557
+MAX_INITIAL_SECRET_NUMBER = 16777215
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate the initial secret number of every buyer.
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+    secret_numbers = [rng.randint(1, MAX_INITIAL_SECRET_NUMBER) for _ in range(line_count)]
+    return GeneratedInput("\n".join(map(str, secret_numbers)))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        self.assertEqual(
+            REAL_INPUT_LINE_COUNT, len(generate_input(1).puzzle_input.splitlines())
+        )
@@ -2,11 +2,11 @@ import textwrap
 import unittest
 from abc import ABC, abstractmethod
 from copy import deepcopy
-
-from graphviz import Digraph
 import os
 
-os.environ["PATH"] += os.pathsep + r"C:\Program Files\Graphviz\bin"
+from common.profiling import run_parts
+
+GRAPHVIZ_BIN_PATH = r"C:\Program Files\Graphviz\bin"
 
 
 def solve_part_one(puzzle_input):
@@ -141,6 +141,12 @@ class CircuitVisualizer:
         self._output_id_to_element = output_id_to_element
         self._name = name
 
+        # The graphviz package runs the "dot" executable, which has to be on the PATH
+        from graphviz import Digraph
+
+        if GRAPHVIZ_BIN_PATH not in os.environ["PATH"].split(os.pathsep):
+            os.environ["PATH"] += os.pathsep + GRAPHVIZ_BIN_PATH
+
         self._graph = Digraph(comment=f"Circuit Diagram: {name}")
 
     def visualize_elements(self):
@@ -202,11 +208,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -1,6 +1,10 @@
+import io
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+from common.streaming import iter_records
+
 STARTING_POSITION = 50
 
 
@@ -11,10 +15,20 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the rotations one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
     position = STARTING_POSITION
     zero_count = 0
 
-    for line in puzzle_input.splitlines():
+    for line in iter_records(lines):
         direction = line[0]
         distance = int(line[1:])
         if direction == "L":
@@ -34,10 +48,20 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the rotations one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
     position = STARTING_POSITION
     zero_count = 0
 
-    for line in puzzle_input.splitlines():
+    for line in iter_records(lines):
         direction = line[0]
         distance = int(line[1:])
         step = -1 if direction == "L" else 1
@@ -54,11 +78,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -85,6 +105,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 6
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(3, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(6, solve_part_two_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -0,0 +1,49 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, check_known_answers, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 4177
+MAX_DISTANCE = 999
+DIAL_SIZE = 100
+STARTING_POSITION = 50
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate dial rotations.
+
+    Both answers are known, because the generator tracks the dial arithmetically while generating.
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+
+    lines = []
+    position = STARTING_POSITION
+    stops_at_zero_count = 0
+    passes_zero_count = 0
+
+    for _ in range(line_count):
+        direction = rng.choice("LR")
+        distance = rng.randint(1, MAX_DISTANCE)
+        lines.append(f"{direction}{distance}")
+
+        if direction == "R":
+            passes_zero_count += (position + distance) // DIAL_SIZE
+            position = (position + distance) % DIAL_SIZE
+        else:
+            # Clicks needed until the dial first points at zero when turning left
+            clicks_to_zero = position if position != 0 else DIAL_SIZE
+            if distance >= clicks_to_zero:
+                passes_zero_count += (distance - clicks_to_zero) // DIAL_SIZE + 1
+            position = (position - distance) % DIAL_SIZE
+
+        if position == 0:
+            stops_at_zero_count += 1
+
+    return GeneratedInput("\n".join(lines), stops_at_zero_count, passes_zero_count)
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_known_answers(self):
+        check_known_answers(self, 2025, 1, generate_input(0.5, seed=1))
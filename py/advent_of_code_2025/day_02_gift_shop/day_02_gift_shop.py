@@ -1,6 +1,10 @@
+import io
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+from common.streaming import iter_fields
+
 
 def solve_part_one(puzzle_input):
     """
@@ -9,7 +13,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    return sum_invalid_ids(puzzle_input, is_sequence_repeated_twice)
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the ranges one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    return sum_invalid_ids(lines, is_sequence_repeated_twice)
 
 
 def solve_part_two(puzzle_input):
@@ -19,14 +33,24 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    return sum_invalid_ids(puzzle_input, is_sequence_repeated_n_times)
+    return solve_part_two_from_lines(puzzle_input)
 
 
-def sum_invalid_ids(puzzle_input, invalid_id_checker_func):
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the ranges one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    return sum_invalid_ids(lines, is_sequence_repeated_n_times)
+
+
+def sum_invalid_ids(lines, invalid_id_checker_func):
     sum_of_invalid_ids = 0
-    ranges = puzzle_input.split(",")
 
-    for r in ranges:
+    # The ranges are read one at a time, even though the whole input is a single line
+    for r in iter_fields(lines, ","):
         start_str, end_str = r.split("-")
         start = int(start_str)
         end = int(end_str)
@@ -66,11 +90,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -88,6 +108,12 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 4174379265
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(1227775554, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        # Ranges wrapped onto several lines, without line endings
+        lines = self.PUZZLE_INPUT.replace(",", "\n", 3).splitlines()
+        self.assertEqual(1227775554, solve_part_one_from_lines(lines))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -1,6 +1,10 @@
+import io
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+from common.streaming import iter_records
+
 
 def solve_part_one(puzzle_input):
     """
@@ -9,7 +13,17 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
-    return sum(get_max_joltage_from_bank(line, 2) for line in puzzle_input.splitlines())
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the banks one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
+    return sum(get_max_joltage_from_bank(line, 2) for line in iter_records(lines))
 
 
 def solve_part_two(puzzle_input):
@@ -19,7 +33,17 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
-    return sum(get_max_joltage_from_bank(line, 12) for line in puzzle_input.splitlines())
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the banks one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
+    return sum(get_max_joltage_from_bank(line, 12) for line in iter_records(lines))
 
 
 def get_max_joltage_from_bank(digits, count):
@@ -45,11 +69,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -70,6 +90,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 3121910778619
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(357, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+        self.assertEqual(3121910778619, solve_part_two_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
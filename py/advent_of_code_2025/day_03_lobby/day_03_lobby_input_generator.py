@@ -0,0 +1,27 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_count
+
+REAL_INPUT_LINE_COUNT = 200
+REAL_INPUT_BANK_LENGTH = 100
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate banks of batteries with joltages from 1 to 9.
+    """
+    rng = random.Random(seed)
+    line_count = get_scaled_count(REAL_INPUT_LINE_COUNT, scale)
+    banks = [
+        "".join(rng.choices("123456789", k=REAL_INPUT_BANK_LENGTH))
+        for _ in range(line_count)
+    ]
+    return GeneratedInput("\n".join(banks))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        self.assertEqual(
+            REAL_INPUT_LINE_COUNT, len(generate_input(1).puzzle_input.splitlines())
+        )
@@ -1,6 +1,8 @@
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input):
     """
@@ -26,6 +28,18 @@ def solve_part_two(puzzle_input):
     return optimizer.get_total_removable_roll_count()
 
 
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, the accessible rolls being the first ones removed.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    grid = [list(row) for row in puzzle_input.splitlines()]
+    optimizer = ForkliftOptimizer(grid)
+    return optimizer.get_accessible_roll_count(), optimizer.get_total_removable_roll_count()
+
+
 class ForkliftOptimizer:
     def __init__(self, grid):
         self._grid = grid
@@ -74,11 +88,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -105,6 +115,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 43
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (13, 43)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -1,6 +1,8 @@
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input):
     """
@@ -24,6 +26,18 @@ def solve_part_two(puzzle_input):
     return InventorySystem(ranges, ids).count_coverage()
 
 
+def solve_both(puzzle_input):
+    """
+    Solve both parts of the Advent of Code puzzle, parsing and merging the ranges only once.
+
+    :param puzzle_input: The input data as string
+    :return: Tuple of the solutions for part one and part two
+    """
+    ranges, ids = parse_input(puzzle_input)
+    inventory_system = InventorySystem(ranges, ids)
+    return inventory_system.count_fresh(), inventory_system.count_coverage()
+
+
 def parse_input(puzzle_input):
     ranges_lines, ids_lines = puzzle_input.strip().split("\n\n")
 
@@ -80,11 +94,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -112,6 +122,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 14
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (3, 14)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
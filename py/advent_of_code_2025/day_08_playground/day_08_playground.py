@@ -6,6 +6,8 @@ from itertools import combinations
 from operator import itemgetter
 from math import prod
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input, num_pairs_to_connect=1000):
     """
@@ -34,6 +36,24 @@ def solve_part_two(puzzle_input):
     return simulator.get_x_coordinates_product_of_final_connected_points()
 
 
+def solve_both(puzzle_input, num_pairs_to_connect=1000):
+    """
+    Solve both parts of the Advent of Code puzzle, continuing to connect pairs from where part one stopped.
+
+    :param puzzle_input: The input data as string
+    :param num_pairs_to_connect: The number of pairs to try to connect for part one
+    :return: Tuple of the solutions for part one and part two
+    """
+    points = [tuple(map(int, line.split(","))) for line in puzzle_input.strip().splitlines()]
+    simulator = CircuitSimulator(points)
+
+    simulator.connect_closest_pairs(num_pairs_to_connect)
+    part_one_result = simulator.get_product_of_largest_three_components()
+
+    simulator.connect_closest_pairs()
+    return part_one_result, simulator.get_x_coordinates_product_of_final_connected_points()
+
+
 class CircuitSimulator:
     def __init__(self, points):
         self._points = points
@@ -45,15 +65,18 @@ class CircuitSimulator:
 
         self._x_coordinates_product_of_final_connected_points = None
 
+        # Sorted on first use, repeated calls continue with the next closest pair
+        self._edges = None
+        self._num_processed_edges = 0
+
     def connect_closest_pairs(self, max_nodes_to_connect=sys.maxsize):
-        edges = []
-        for i, j in combinations(range(self._n), 2):
-            distance = self._get_distance(self._points[i], self._points[j])
-            edges.append((i, j, distance))
-        edges.sort(key=itemgetter(2))
+        if self._edges is None:
+            self._edges = self._get_sorted_edges()
 
-        for n in range(0, max_nodes_to_connect):
-            i, j, _ = edges[n]
+        end = min(self._num_processed_edges + max_nodes_to_connect, len(self._edges))
+        while self._num_processed_edges < end:
+            i, j, _ = self._edges[self._num_processed_edges]
+            self._num_processed_edges += 1
             self._union(i, j)
 
             # All nodes connected
@@ -74,6 +97,14 @@ class CircuitSimulator:
     def get_x_coordinates_product_of_final_connected_points(self):
         return self._x_coordinates_product_of_final_connected_points
 
+    def _get_sorted_edges(self):
+        edges = []
+        for i, j in combinations(range(self._n), 2):
+            distance = self._get_distance(self._points[i], self._points[j])
+            edges.append((i, j, distance))
+        edges.sort(key=itemgetter(2))
+        return edges
+
     def _find(self, x):
         if self._point_id_to_parent_id[x] != x:
             self._point_id_to_parent_id[x] = self._find(self._point_id_to_parent_id[x])
@@ -97,11 +128,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -138,6 +165,10 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 25272
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_solve_both(self):
+        expected_output = (40, 25272)
+        self.assertEqual(expected_output, solve_both(self.PUZZLE_INPUT, 10))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
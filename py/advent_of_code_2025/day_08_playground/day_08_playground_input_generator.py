@@ -0,0 +1,29 @@
+import random
+import unittest
+
+from common.input_generation import GeneratedInput, get_scaled_count
+
+REAL_INPUT_POINT_COUNT = 1000
+MAX_COORDINATE = 99999
+
+
+def generate_input(scale, seed=0):
+    """
+    Generate distinct junction box positions in 3D space.
+    """
+    rng = random.Random(seed)
+    point_count = get_scaled_count(REAL_INPUT_POINT_COUNT, scale)
+
+    points = set()
+    while len(points) < point_count:
+        points.add(tuple(rng.randint(0, MAX_COORDINATE) for _ in range(3)))
+
+    lines = [",".join(map(str, point)) for point in sorted(points)]
+    rng.shuffle(lines)
+    return GeneratedInput("\n".join(lines))
+
+
+class TestInputGenerator(unittest.TestCase):
+    def test_size(self):
+        lines = generate_input(1).puzzle_input.splitlines()
+        self.assertEqual(REAL_INPUT_POINT_COUNT, len(set(lines)))
@@ -1,7 +1,8 @@
 import textwrap
 import unittest
 from itertools import combinations
-from shapely.geometry import Polygon, box
+
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -36,6 +37,8 @@ def calculate_max_area(points):
 
 
 def calculate_max_area_within_polygon(points):
+    from shapely.geometry import Polygon, box
+
     poly = Polygon(points)
 
     max_area = 0
@@ -52,11 +55,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
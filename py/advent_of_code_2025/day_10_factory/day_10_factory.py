@@ -1,7 +1,10 @@
+import io
 import textwrap
 import unittest
 from itertools import combinations
-from z3 import Int, Optimize, sat
+
+from common.profiling import run_parts
+from common.streaming import iter_records
 
 
 def solve_part_one(puzzle_input):
@@ -11,8 +14,18 @@ def solve_part_one(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part one
     """
+    return solve_part_one_from_lines(puzzle_input)
+
+
+def solve_part_one_from_lines(lines):
+    """
+    Solve part one of the Advent of Code puzzle, reading the machines one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part one
+    """
     total_press_count = 0
-    for line in puzzle_input.splitlines():
+    for line in iter_records(lines):
         diagram, buttons, _ = parse_line(line)
         total_press_count += calculate_fewest_presses_to_achieve_diagram(diagram, buttons)
     return total_press_count
@@ -25,8 +38,18 @@ def solve_part_two(puzzle_input):
     :param puzzle_input: The input data as string
     :return: Solution for part two
     """
+    return solve_part_two_from_lines(puzzle_input)
+
+
+def solve_part_two_from_lines(lines):
+    """
+    Solve part two of the Advent of Code puzzle, reading the machines one by one.
+
+    :param lines: Iterable of input lines, e.g. an open file
+    :return: Solution for part two
+    """
     total_press_count = 0
-    for line in puzzle_input.strip().splitlines():
+    for line in iter_records(lines):
         _, buttons, joltages = parse_line(line)
         total_press_count += calculate_fewest_presses_to_achieve_joltages(buttons, joltages)
     return total_press_count
@@ -81,6 +104,8 @@ def calculate_fewest_presses_to_achieve_joltages(buttons, joltages):
     buttons: list of tuples of indices affected by each button
     joltage: tuple of target values for each counter
     """
+    from z3 import Int, Optimize, sat
+
     optimizer = Optimize()
 
     num_buttons = len(buttons)
@@ -110,11 +135,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
@@ -134,6 +155,9 @@ class TestAdventOfCode(unittest.TestCase):
         expected_output = 33
         self.assertEqual(expected_output, solve_part_two(self.PUZZLE_INPUT))
 
+    def test_from_lines(self):
+        self.assertEqual(7, solve_part_one_from_lines(io.StringIO(self.PUZZLE_INPUT)))
+
 
 if __name__ == "__main__":
     # unittest.main() # Uncomment to run unit tests
@@ -1,6 +1,7 @@
 import textwrap
 import unittest
-import networkx as nx
+
+from common.profiling import run_parts
 
 
 def solve_part_one(puzzle_input):
@@ -11,7 +12,8 @@ def solve_part_one(puzzle_input):
     :return: Solution for part one
     """
     G = build_graph(puzzle_input)
-    return len(list(nx.all_simple_paths(G, "you", "out")))
+    # The graph is acyclic, so every path is a simple path
+    return count_paths_dag(G, "you", "out")
 
 
 def solve_part_two(puzzle_input):
@@ -39,6 +41,8 @@ def solve_part_two(puzzle_input):
 
 
 def build_graph(puzzle_input):
+    import networkx as nx
+
     G = nx.DiGraph()
     for line in puzzle_input.splitlines():
         src, rest = line.split(":")
@@ -67,11 +71,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
-
-    part_two_result = solve_part_two(puzzle_input)
-    print(f"Part Two: {part_two_result}")
+    run_parts(puzzle_input, solve_part_one, solve_part_two)
 
 
 class TestAdventOfCode(unittest.TestCase):
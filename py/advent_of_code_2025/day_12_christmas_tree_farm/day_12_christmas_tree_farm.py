@@ -1,6 +1,8 @@
 import textwrap
 import unittest
 
+from common.profiling import run_parts
+
 
 def solve_part_one(puzzle_input):
     """
@@ -31,8 +33,7 @@ def main():
     with open("./input.txt") as f:
         puzzle_input = f.read().strip()
 
-    part_one_result = solve_part_one(puzzle_input)
-    print(f"Part One: {part_one_result}")
+    run_parts(puzzle_input, solve_part_one)
 
 
 class TestAdventOfCode(unittest.TestCase):
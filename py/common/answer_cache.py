@@ -0,0 +1,233 @@
+"""
+Cache of the answers and timings of the solutions, so that unchanged solutions don't have to be solved again.
+
+Entries are addressed by their content: the key is a hash of the source of the solution module (including the
+modules of the "common" package it depends on) and a hash of its input. Changing either makes the old entry
+unreachable, and it is replaced by the next result for the same day. The number of entries is bounded, and the least
+recently used ones are evicted first.
+
+Usage (from the "py" folder):
+    python -m common.runner               # Uses the cache
+    python -m common.runner --no-cache    # Solves everything again, without reading or updating the cache
+    python -m common.runner --clear-cache # Removes the entries of the selected days before running
+"""
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from common.discovery import SOLUTIONS_ROOT, Solution, get_input_path, get_module_path, get_solution
+
+DEFAULT_CACHE_PATH = SOLUTIONS_ROOT / ".answer_cache.json"
+DEFAULT_MAX_ENTRIES = 200
+
+# Entries written with another version are ignored, which has to be increased whenever the format changes
+CACHE_VERSION = 1
+
+COMMON_PACKAGE = "common"
+COMMON_ROOT = Path(__file__).resolve().parent
+
+
+def get_cache_key(solution):
+    """
+    :return: Hash of the sources the solution runs and hash of its input, joined by a dash
+    """
+    source_digest = hashlib.sha256()
+    for path in [get_module_path(solution), *get_common_dependencies(get_module_path(solution))]:
+        source_digest.update(path.read_bytes())
+
+    input_digest = hashlib.sha256(get_input_path(solution).read_bytes())
+    return f"{source_digest.hexdigest()}-{input_digest.hexdigest()}"
+
+
+def get_common_dependencies(module_path):
+    """
+    Find the modules of the "common" package imported by the module, directly or through other common modules.
+
+    :return: Sorted list of the paths of the common modules
+    """
+    dependencies = set()
+    paths_to_visit = [module_path]
+
+    while paths_to_visit:
+        tree = ast.parse(Path(paths_to_visit.pop()).read_text())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ImportFrom) and node.module:
+                module_names = [node.module]
+            elif isinstance(node, ast.Import):
+                module_names = [alias.name for alias in node.names]
+            else:
+                continue
+
+            for module_name in module_names:
+                package, _, name = module_name.partition(".")
+                path = COMMON_ROOT / f"{name}.py"
+                if package == COMMON_PACKAGE and path.is_file() and path not in dependencies:
+                    dependencies.add(path)
+                    paths_to_visit.append(path)
+
+    return sorted(dependencies)
+
+
+class AnswerCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        :param path: JSON file the cache is stored in, created on the first save
+        :param max_entries: Maximum number of entries, one per day and mode of solving it
+        """
+        self._path = Path(path)
+        self._max_entries = max_entries
+        self._entries = self._load()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, solution, combined):
+        """
+        :param combined: Whether both parts are solved by a single call, as the timings differ
+        :return: The cached results of the solution as a list of dicts, or None if there are none for its current
+            source and input
+        """
+        entry_key = self._get_entry_key(solution, combined)
+        entry = self._entries.get(entry_key) if entry_key is not None else None
+        if entry is None:
+            return None
+
+        entry["last_used"] = time.time()
+        return entry["results"]
+
+    def put(self, solution, combined, results):
+        """
+        Store the results of a solution, replacing its outdated entries and evicting the least recently used entries
+        if the cache is full.
+
+        :param results: List of dicts, one per part
+        """
+        entry_key = self._get_entry_key(solution, combined)
+        if entry_key is None:
+            return
+
+        self._remove_entries(
+            lambda entry: (entry["year"], entry["day"], entry["combined"])
+            == (solution.year, solution.day, combined)
+        )
+        self._entries[entry_key] = {
+            "year": solution.year,
+            "day": solution.day,
+            "combined": combined,
+            "last_used": time.time(),
+            "results": results,
+        }
+
+        if len(self._entries) > self._max_entries:
+            entry_keys_by_last_use = sorted(
+                self._entries, key=lambda entry_key: self._entries[entry_key]["last_used"]
+            )
+            for entry_key in entry_keys_by_last_use[: len(self._entries) - self._max_entries]:
+                del self._entries[entry_key]
+
+    def invalidate(self, solutions=None):
+        """
+        Remove the entries of the given solutions, or all entries if no solutions are given.
+        """
+        if solutions is None:
+            self._entries.clear()
+            return
+
+        days = {(solution.year, solution.day) for solution in solutions}
+        self._remove_entries(lambda entry: (entry["year"], entry["day"]) in days)
+
+    def save(self):
+        # Written to a temporary file first, so that an interrupted run never leaves a corrupted cache behind
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+                "w", dir=self._path.parent, suffix=".tmp", delete=False
+        ) as f:
+            json.dump({"version": CACHE_VERSION, "entries": self._entries}, f)
+        os.replace(f.name, self._path)
+
+    def _load(self):
+        try:
+            with open(self._path) as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if content.get("version") != CACHE_VERSION:
+            return {}
+        return content["entries"]
+
+    def _remove_entries(self, predicate):
+        for entry_key in [key for key, entry in self._entries.items() if predicate(entry)]:
+            del self._entries[entry_key]
+
+    @staticmethod
+    def _get_entry_key(solution, combined):
+        """
+        :return: Key of the entry of the solution, or None if its sources or input can't be read or parsed, so that it
+            isn't cached and solving it reports the error
+        """
+        try:
+            cache_key = get_cache_key(solution)
+        except (OSError, SyntaxError):
+            return None
+
+        mode = "both" if combined else "separate"
+        return f"{cache_key}-{mode}"
+
+
+class TestAnswerCache(unittest.TestCase):
+    RESULTS = [{"part": 1, "answer": "42"}]
+
+    def test_get_and_put(self):
+        solution = get_solution(2024, 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "cache.json"
+            cache = AnswerCache(path)
+            self.assertIsNone(cache.get(solution, False))
+
+            cache.put(solution, False, self.RESULTS)
+            cache.save()
+
+            reloaded_cache = AnswerCache(path)
+            self.assertEqual(self.RESULTS, reloaded_cache.get(solution, False))
+            self.assertIsNone(reloaded_cache.get(solution, True))
+
+            reloaded_cache.invalidate([solution])
+            self.assertIsNone(reloaded_cache.get(solution, False))
+
+    def test_eviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnswerCache(Path(directory) / "cache.json", max_entries=2)
+            for day in (1, 2, 3):
+                cache.put(get_solution(2024, day), False, self.RESULTS)
+                # Replacing an entry of the same day doesn't take up more room
+                cache.put(get_solution(2024, day), False, self.RESULTS)
+
+            self.assertEqual(2, len(cache))
+            self.assertIsNone(cache.get(get_solution(2024, 1), False))
+            self.assertIsNotNone(cache.get(get_solution(2024, 3), False))
+
+    def test_missing_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            day_directory = Path(directory) / "day_01_no_input"
+            day_directory.mkdir()
+            (day_directory / "day_01_no_input.py").write_text("def solve_part_one(puzzle_input):\n    return 0\n")
+            solution = Solution(1999, 1, "day_01_no_input", day_directory)
+
+            cache = AnswerCache(Path(directory) / "cache.json")
+            self.assertIsNone(cache.get(solution, False))
+            cache.put(solution, False, self.RESULTS)
+            self.assertEqual(0, len(cache))
+
+    def test_cache_key(self):
+        solution = get_solution(2024, 6)
+        self.assertEqual(get_cache_key(solution), get_cache_key(solution))
+        self.assertIn(COMMON_ROOT / "grid.py", get_common_dependencies(get_module_path(solution)))
+        # Through common.profiling
+        self.assertIn(COMMON_ROOT / "memory.py", get_common_dependencies(get_module_path(solution)))
@@ -0,0 +1,384 @@
+"""
+Benchmark the solutions on inputs of increasing size and check them against stored baselines.
+
+Inputs larger than the real one (scale 1) come from the "<day>_input_generator.py" module in the folder of the day,
+see common.input_generation.
+
+Usage (from the "py" folder):
+    python -m common.benchmark [--year 2024] [--day 6] [--scale 1 --scale 10] [--save-baseline | --check]
+"""
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import tempfile
+import textwrap
+import time
+import tracemalloc
+import unittest
+from collections import namedtuple
+from pathlib import Path
+
+from common.discovery import (
+    PART_FUNCTION_NAMES,
+    SOLUTIONS_ROOT,
+    Solution,
+    discover_solutions,
+    get_available_parts,
+    load_input_generator,
+    load_solution_module,
+    read_puzzle_input,
+    solution_working_directory,
+)
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEATS = 5
+DEFAULT_SEED = 0
+
+DEFAULT_BASELINE_PATH = SOLUTIONS_ROOT / "benchmark_baseline.json"
+
+# A measurement regresses if it exceeds the baseline multiplied by the budget
+DEFAULT_TIME_BUDGET = 1.5
+DEFAULT_MEMORY_BUDGET = 1.5
+
+# Timings below this are dominated by noise, so they are never reported as regressions
+MIN_TIME_SLACK = 0.005
+
+Measurement = namedtuple(
+    "Measurement",
+    ["year", "day", "part", "scale", "median_time", "p95_time", "peak_memory"],
+)
+
+# A day that couldn't be benchmarked at a scale, with the part that failed (None if the input couldn't be created)
+BenchmarkFailure = namedtuple("BenchmarkFailure", ["year", "day", "part", "scale", "error"])
+
+
+def get_benchmark_input(solution, scale, seed=DEFAULT_SEED):
+    """
+    Get the input of the given scale for the solution.
+
+    :return: The puzzle input as string, or None if there is no way to create an input of this scale
+    """
+    generator = load_input_generator(solution)
+    if generator is not None:
+        return generator.generate_input(scale, seed).puzzle_input.strip()
+
+    # Without a generator, only the real input is available
+    if scale == 1:
+        return read_puzzle_input(solution)
+
+    return None
+
+
+def measure(solution, part, scale, puzzle_input, repeats=DEFAULT_REPEATS):
+    solver = getattr(load_solution_module(solution), PART_FUNCTION_NAMES[part])
+    times = []
+
+    with solution_working_directory(solution):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            solver(puzzle_input)
+            times.append(time.perf_counter() - start)
+
+        # Tracing allocations slows the solution down, so memory is measured in a separate run
+        tracemalloc.start()
+        try:
+            solver(puzzle_input)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Measurement(
+        solution.year,
+        solution.day,
+        part,
+        scale,
+        statistics.median(times),
+        get_percentile(times, 95),
+        peak_memory,
+    )
+
+
+def get_percentile(values, percentile):
+    # Nearest-rank method, which gives sensible results for the small number of repeats used here
+    sorted_values = sorted(values)
+    rank = math.ceil(percentile / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def run_benchmarks(
+        solutions, scales, parts=None, repeats=DEFAULT_REPEATS, seed=DEFAULT_SEED, verbose=True
+):
+    """
+    Measure every selected part of the solutions at every scale. A part that raises is reported as failure, and the
+    other parts and days are still measured.
+
+    :param verbose: Whether to print every measurement to stderr as soon as it is taken
+    :return: Tuple of the measurements, the (year, day, scale) skipped for lack of an input, and the failures
+    """
+    measurements = []
+    skipped = []
+    failures = []
+
+    for solution in solutions:
+        try:
+            available_parts = get_available_parts(load_solution_module(solution))
+        except Exception as e:
+            failures.append(BenchmarkFailure(solution.year, solution.day, None, None, repr(e)))
+            continue
+        selected_parts = [part for part in available_parts if not parts or part in parts]
+
+        for scale in scales:
+            try:
+                puzzle_input = get_benchmark_input(solution, scale, seed)
+            except Exception as e:
+                failures.append(BenchmarkFailure(solution.year, solution.day, None, scale, repr(e)))
+                continue
+            if puzzle_input is None:
+                skipped.append((solution.year, solution.day, scale))
+                continue
+
+            for part in selected_parts:
+                try:
+                    measurement = measure(solution, part, scale, puzzle_input, repeats)
+                except Exception as e:
+                    failures.append(BenchmarkFailure(solution.year, solution.day, part, scale, repr(e)))
+                    continue
+                if verbose:
+                    print(format_measurement(measurement), file=sys.stderr)
+                measurements.append(measurement)
+
+    return measurements, skipped, failures
+
+
+def get_measurement_key(measurement):
+    return f"{measurement.year}/{measurement.day:02}/{measurement.part}/x{measurement.scale}"
+
+
+def save_baseline(measurements, path):
+    """
+    Store the measurements as baseline, keeping the measurements not covered by this run and the per-day budgets.
+    """
+    baseline = load_baseline(path)
+    for measurement in measurements:
+        baseline["measurements"][get_measurement_key(measurement)] = {
+            "median_time": measurement.median_time,
+            "p95_time": measurement.p95_time,
+            "peak_memory": measurement.peak_memory,
+        }
+
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    if not Path(path).is_file():
+        return {"measurements": {}, "budgets": {}}
+
+    with open(path) as f:
+        baseline = json.load(f)
+
+    baseline.setdefault("measurements", {})
+    baseline.setdefault("budgets", {})
+    return baseline
+
+
+def find_regressions(measurements, baseline, time_budget, memory_budget):
+    """
+    Compare the median and p95 times and the peak memory of the measurements against the baseline. The p95 time
+    catches parts that became slow only some of the time, e.g. due to caching or garbage collection.
+
+    Budgets can be overridden per day in the "budgets" section of the baseline, e.g.
+    {"2024/06": {"time": 2.0, "memory": 1.2}}
+
+    :return: List of human-readable regression descriptions
+    """
+    regressions = []
+
+    for measurement in measurements:
+        key = get_measurement_key(measurement)
+        reference = baseline["measurements"].get(key)
+        if reference is None:
+            continue
+
+        day_budgets = baseline["budgets"].get(f"{measurement.year}/{measurement.day:02}", {})
+        allowed_time = (
+            reference["median_time"] * day_budgets.get("time", time_budget)
+            + MIN_TIME_SLACK
+        )
+        allowed_memory = reference["peak_memory"] * day_budgets.get("memory", memory_budget)
+
+        if measurement.median_time > allowed_time:
+            regressions.append(
+                f"{key}: median time {measurement.median_time * 1000:.1f} ms "
+                f"exceeds budget of {allowed_time * 1000:.1f} ms"
+            )
+        # Baselines saved before the p95 time was checked don't have it
+        if "p95_time" in reference:
+            allowed_p95_time = (
+                reference["p95_time"] * day_budgets.get("time", time_budget) + MIN_TIME_SLACK
+            )
+            if measurement.p95_time > allowed_p95_time:
+                regressions.append(
+                    f"{key}: p95 time {measurement.p95_time * 1000:.1f} ms "
+                    f"exceeds budget of {allowed_p95_time * 1000:.1f} ms"
+                )
+        if measurement.peak_memory > allowed_memory:
+            regressions.append(
+                f"{key}: peak memory {measurement.peak_memory / 1024:.0f} KiB "
+                f"exceeds budget of {allowed_memory / 1024:.0f} KiB"
+            )
+
+    return regressions
+
+
+def format_measurement(measurement):
+    return (
+        f"{measurement.year:<6}{measurement.day:>4}{measurement.part:>6}{'x' + str(measurement.scale):>7}  "
+        f"{measurement.median_time * 1000:>12.1f}{measurement.p95_time * 1000:>10.1f}"
+        f"{measurement.peak_memory / 1024:>12.0f}"
+    )
+
+
+def format_failure(failure):
+    if failure.scale is None:
+        location = f"{failure.year} day {failure.day}"
+    elif failure.part is None:
+        location = f"{failure.year} day {failure.day} input at x{failure.scale}"
+    else:
+        location = f"{failure.year} day {failure.day} part {failure.part} at x{failure.scale}"
+    return f"FAILED {location}: {failure.error}"
+
+
+def format_table(measurements):
+    header = f"{'Year':<6}{'Day':>4}{'Part':>6}{'Scale':>7}  {'Median (ms)':>12}{'p95 (ms)':>10}{'Peak (KiB)':>12}"
+    lines = [header, "-" * len(header)]
+    lines.extend(format_measurement(measurement) for measurement in measurements)
+    return "\n".join(lines)
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Benchmark Advent of Code solutions.")
+    parser.add_argument("--year", type=int, action="append", help="Only run this year")
+    parser.add_argument("--day", type=int, action="append", help="Only run this day")
+    parser.add_argument("--part", type=int, action="append", help="Only run this part")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        action="append",
+        help=f"Input size relative to the real input (defaults to {DEFAULT_SCALES})",
+    )
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--baseline-file", type=Path, default=DEFAULT_BASELINE_PATH)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the measurements in the baseline file",
+    )
+    mode.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if a measurement regresses past its budget compared to the baseline file",
+    )
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET)
+    parser.add_argument("--memory-budget", type=float, default=DEFAULT_MEMORY_BUDGET)
+    parser.add_argument(
+        "--json", action="store_true", help="Print the measurements as JSON"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    solutions = discover_solutions(years=args.year, days=args.day)
+    measurements, skipped, failures = run_benchmarks(
+        solutions, args.scale or DEFAULT_SCALES, args.part, args.repeats, args.seed
+    )
+
+    if args.json:
+        print(json.dumps([measurement._asdict() for measurement in measurements], indent=2))
+    else:
+        print(format_table(measurements))
+        for year, day, scale in skipped:
+            print(f"Skipped {year} day {day} at x{scale}: no input generator")
+    for failure in failures:
+        print(format_failure(failure))
+
+    if args.save_baseline:
+        save_baseline(measurements, args.baseline_file)
+    elif args.check:
+        baseline = load_baseline(args.baseline_file)
+        regressions = find_regressions(
+            measurements, baseline, args.time_budget, args.memory_budget
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+    if failures:
+        sys.exit(1)
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_measure(self):
+        solution = discover_solutions(years={2024}, days={1})[0]
+        measurements, _, failures = run_benchmarks([solution], [1], parts=[1], repeats=3, verbose=False)
+
+        self.assertEqual([], failures)
+
+        self.assertEqual(1, len(measurements))
+        self.assertLessEqual(measurements[0].median_time, measurements[0].p95_time)
+        self.assertGreater(measurements[0].peak_memory, 0)
+
+    def test_failing_part(self):
+        with tempfile.TemporaryDirectory() as directory:
+            day_directory = Path(directory) / "day_01_broken"
+            day_directory.mkdir()
+            (day_directory / "input.txt").write_text("1")
+            (day_directory / "day_01_broken.py").write_text(
+                textwrap.dedent(
+                    """
+                    def solve_part_one(puzzle_input):
+                        return int(puzzle_input)
+
+                    def solve_part_two(puzzle_input):
+                        raise ValueError("broken")
+                    """
+                )
+            )
+            solution = Solution(1999, 1, "day_01_broken", day_directory)
+            measurements, _, failures = run_benchmarks([solution], [1], repeats=1, verbose=False)
+
+        self.assertEqual([1], [measurement.part for measurement in measurements])
+        self.assertEqual(
+            [BenchmarkFailure(1999, 1, 2, 1, "ValueError('broken')")], failures
+        )
+        self.assertEqual("FAILED 1999 day 1 part 2 at x1: ValueError('broken')", format_failure(failures[0]))
+
+    def test_get_percentile(self):
+        self.assertEqual(3, get_percentile([5, 1, 3, 2, 4], 50))
+        self.assertEqual(5, get_percentile([5, 1, 3, 2, 4], 95))
+
+    def test_find_regressions(self):
+        baseline = {
+            "measurements": {
+                "2024/06/2/x1": {"median_time": 1.0, "p95_time": 1.0, "peak_memory": 1000},
+            },
+            "budgets": {"2024/06": {"time": 3.0}},
+        }
+        fast = Measurement(2024, 6, 2, 1, 2.0, 2.0, 1000)
+        slow = Measurement(2024, 6, 2, 1, 4.0, 4.0, 2000)
+        sometimes_slow = Measurement(2024, 6, 2, 1, 2.0, 4.0, 1000)
+
+        self.assertEqual([], find_regressions([fast], baseline, 1.5, 1.5))
+        self.assertEqual(3, len(find_regressions([slow], baseline, 1.5, 1.5)))
+        self.assertEqual(1, len(find_regressions([sometimes_slow], baseline, 1.5, 1.5)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import ast
+import importlib.util
+import os
+import re
+import sys
+import unittest
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+
+SOLUTIONS_ROOT = Path(__file__).resolve().parent.parent
+
+YEAR_FOLDER_PATTERN = re.compile(r"^advent_of_code_(\d{4})$")
+DAY_FOLDER_PATTERN = re.compile(r"^day_(\d{2})_\w+$")
+
+PART_FUNCTION_NAMES = {
+    1: "solve_part_one",
+    2: "solve_part_two",
+}
+
+# Optional function solving both parts at once, so that work shared between them is only done once
+BOTH_PARTS_FUNCTION_NAME = "solve_both"
+
+Solution = namedtuple("Solution", ["year", "day", "name", "directory"])
+
+
+def discover_solutions(root=SOLUTIONS_ROOT, years=None, days=None):
+    """
+    Find every day folder that contains a solution module of the same name.
+
+    :param root: Folder containing the "advent_of_code_<year>" folders
+    :param years: Optional collection of years to restrict the search to
+    :param days: Optional collection of days to restrict the search to
+    :return: List of solutions sorted by year and day
+    """
+    solutions = []
+
+    for year_directory in Path(root).iterdir():
+        year_match = YEAR_FOLDER_PATTERN.match(year_directory.name)
+        if not year_directory.is_dir() or not year_match:
+            continue
+        year = int(year_match.group(1))
+        if years and year not in years:
+            continue
+
+        for day_directory in year_directory.iterdir():
+            day_match = DAY_FOLDER_PATTERN.match(day_directory.name)
+            if not day_directory.is_dir() or not day_match:
+                continue
+            day = int(day_match.group(1))
+            if days and day not in days:
+                continue
+
+            solution = Solution(year, day, day_directory.name, str(day_directory))
+            if get_module_path(solution).is_file():
+                solutions.append(solution)
+
+    return sorted(solutions)
+
+
+def get_solution(year, day):
+    solutions = discover_solutions(years={year}, days={day})
+    if not solutions:
+        raise ValueError(f"There is no solution for {year} day {day}")
+    return solutions[0]
+
+
+def get_module_path(solution):
+    return Path(solution.directory) / f"{solution.name}.py"
+
+
+def get_input_path(solution):
+    return Path(solution.directory) / "input.txt"
+
+
+def get_module_name(solution):
+    return f"advent_of_code_{solution.year}.{solution.name}.{solution.name}"
+
+
+def get_input_generator_path(solution):
+    return Path(solution.directory) / f"{solution.name}_input_generator.py"
+
+
+def load_solution_module(solution):
+    """
+    Import the solution module from its file, reusing it if it was already imported.
+    """
+    return _load_module(get_module_name(solution), get_module_path(solution))
+
+
+def load_input_generator(solution):
+    """
+    Import the synthetic input generator of the solution, if it has one.
+
+    :return: The generator module, or None if the solution doesn't have a generator
+    """
+    path = get_input_generator_path(solution)
+    if not path.is_file():
+        return None
+
+    module_name = f"advent_of_code_{solution.year}.{solution.name}.{solution.name}_input_generator"
+    return _load_module(module_name, path)
+
+
+def _load_module(module_name, path):
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
+
+
+def get_available_parts(module):
+    return [
+        part
+        for part, function_name in PART_FUNCTION_NAMES.items()
+        if hasattr(module, function_name)
+    ]
+
+
+def has_solve_both(solution):
+    """
+    Check whether the solution defines a function solving both parts, without importing its module.
+    """
+    tree = ast.parse(get_module_path(solution).read_text())
+    return any(
+        isinstance(node, ast.FunctionDef) and node.name == BOTH_PARTS_FUNCTION_NAME
+        for node in tree.body
+    )
+
+
+@contextmanager
+def solution_working_directory(solution):
+    """
+    Temporarily switch to the folder of the solution, as solutions expect to be run from there, same as main().
+    """
+    original_working_directory = os.getcwd()
+    os.chdir(solution.directory)
+    try:
+        yield
+    finally:
+        os.chdir(original_working_directory)
+
+
+def read_puzzle_input(solution):
+    # Same preprocessing as the main() function of every solution
+    with open(get_input_path(solution)) as f:
+        return f.read().strip()
+
+
+class TestDiscovery(unittest.TestCase):
+    def test_discover_solutions(self):
+        solutions = discover_solutions(years={2024}, days={1, 25})
+        self.assertEqual([(2024, 1), (2024, 25)], [(s.year, s.day) for s in solutions])
+
+    def test_load_solution_module(self):
+        solution = discover_solutions(years={2024}, days={25})[0]
+        module = load_solution_module(solution)
+        self.assertIs(module, load_solution_module(solution))
+        self.assertEqual([1], get_available_parts(module))
+
+    def test_has_solve_both(self):
+        self.assertTrue(has_solve_both(get_solution(2024, 1)))
+        self.assertFalse(has_solve_both(get_solution(2024, 25)))
@@ -0,0 +1,160 @@
+"""
+Compact grid of single-character cells addressed by integer indices, shared by the grid based solutions.
+
+The cells are stored row by row in a flat bytearray, surrounded by a border of sentinel cells. Moving to a
+neighbor is a single addition of a precomputed offset, and the sentinel border makes bounds checks unnecessary
+as long as a step never goes further than the border width.
+
+Usage:
+    grid = Grid(puzzle_input.splitlines())
+    start = grid.find("S")
+    for offset in grid.orthogonal_offsets:
+        if grid.cells[start + offset] != WALL: ...
+"""
+
+import textwrap
+import unittest
+
+# Sentinel of the border, never a character of a puzzle input
+OUTSIDE = "\0"
+
+
+class Grid:
+    def __init__(self, rows, border=1, sentinel=OUTSIDE):
+        """
+        :param rows: Rows of the grid, as strings or lists of characters of the same length
+        :param border: Width of the sentinel border, which must cover the largest single step taken
+        :param sentinel: Character of the cells in the border
+        """
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.border = border
+        self.sentinel = sentinel
+        self.stride = self.width + 2 * border
+
+        sentinel_code = ord(sentinel)
+        self.cells = bytearray([sentinel_code]) * (self.stride * (self.height + 2 * border))
+        for y, row in enumerate(rows):
+            start = self.index(0, y)
+            self.cells[start: start + self.width] = "".join(row).encode("latin-1")
+
+        # Orthogonal offsets in clockwise order, starting upwards
+        self.up = -self.stride
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        self.orthogonal_offsets = (self.up, self.right, self.down, self.left)
+        self.diagonal_offsets = (
+            self.up + self.left,
+            self.up + self.right,
+            self.down + self.right,
+            self.down + self.left,
+        )
+        self.neighbor_offsets = self.orthogonal_offsets + self.diagonal_offsets
+
+    @classmethod
+    def filled(cls, width, height, char=".", border=1, sentinel=OUTSIDE):
+        return cls([char * width] * height, border, sentinel)
+
+    def __getitem__(self, index):
+        return chr(self.cells[index])
+
+    def __setitem__(self, index, char):
+        self.cells[index] = ord(char)
+
+    def index(self, x, y):
+        return (y + self.border) * self.stride + x + self.border
+
+    def position(self, index):
+        y, x = divmod(index, self.stride)
+        return x - self.border, y - self.border
+
+    def offset(self, dx, dy):
+        return dy * self.stride + dx
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_inside(self, index):
+        """
+        Check whether the index is a cell of the grid rather than of the sentinel border.
+        """
+        return self.cells[index] != ord(self.sentinel)
+
+    def indices(self):
+        """
+        Iterate over the indices of all cells inside the border, row by row.
+        """
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, char):
+        """
+        :return: Index of the first cell with the given character, or None if there is none
+        """
+        index = self.cells.find(ord(char))
+        return index if index != -1 else None
+
+    def find_all(self, char):
+        code = ord(char)
+        return [index for index in self.indices() if self.cells[index] == code]
+
+    def get_manhattan_distance(self, first_index, second_index):
+        first_x, first_y = self.position(first_index)
+        second_x, second_y = self.position(second_index)
+        return abs(first_x - second_x) + abs(first_y - second_y)
+
+    def copy(self):
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def to_text(self):
+        return "\n".join(
+            self.cells[self.index(0, y): self.index(self.width, y)].decode("latin-1")
+            for y in range(self.height)
+        )
+
+
+class TestGrid(unittest.TestCase):
+    ROWS = textwrap.dedent(
+        """
+        #S.
+        .#E
+        """
+    ).strip().splitlines()
+
+    def test_positions(self):
+        grid = Grid(self.ROWS)
+        self.assertEqual((3, 2), (grid.width, grid.height))
+        self.assertEqual((2, 1), grid.position(grid.index(2, 1)))
+        self.assertEqual(grid.index(2, 1), grid.find("E"))
+        self.assertEqual(grid.index(1, 0), grid.find("S"))
+        self.assertEqual(2, grid.get_manhattan_distance(grid.find("S"), grid.find("E")))
+
+    def test_border(self):
+        grid = Grid(self.ROWS, border=2)
+        top_left = grid.index(0, 0)
+        self.assertTrue(grid.is_inside(top_left))
+        self.assertFalse(grid.is_inside(top_left + grid.left))
+        self.assertFalse(grid.is_inside(top_left + 2 * grid.up))
+        self.assertEqual(6, len(list(grid.indices())))
+        self.assertIsNone(grid.find("x"))
+
+    def test_neighbors(self):
+        grid = Grid(self.ROWS)
+        center = grid.index(1, 1)
+        row_above = [grid.up + grid.left, grid.up, grid.up + grid.right]
+        self.assertEqual("#S.", "".join(grid[center + offset] for offset in row_above))
+        self.assertEqual(8, len(grid.neighbor_offsets))
+        self.assertEqual(grid.offset(-1, 1), grid.down + grid.left)
+
+    def test_copy(self):
+        grid = Grid(self.ROWS)
+        copied_grid = grid.copy()
+        copied_grid[copied_grid.find("S")] = "."
+        self.assertEqual("\n".join(self.ROWS), grid.to_text())
+        self.assertEqual([grid.index(1, 0)], grid.find_all("S"))
+        self.assertEqual([], copied_grid.find_all("S"))
@@ -0,0 +1,161 @@
+"""
+Report how long loading each solution module takes, and which of its imports are the most expensive.
+
+Every solution is loaded in a fresh interpreter with "-X importtime", so that the measurements don't depend on
+modules imported by other solutions.
+
+Usage (from the "py" folder):
+    python -m common.import_report [--year 2024] [--day 13] [--top 3] [--json]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import textwrap
+import unittest
+from collections import namedtuple
+
+from common.discovery import SOLUTIONS_ROOT, discover_solutions
+
+# Printed by the child process between loading the discovery module and loading the solution
+START_MARKER = "--- solution module ---"
+
+# Format of the lines written by "-X importtime": "import time: <self us> | <cumulative us> | <indented name>"
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+ImportReport = namedtuple("ImportReport", ["year", "day", "load_time", "imports", "error"])
+
+# A module imported directly by the solution, with its cumulative import time in seconds
+ImportCost = namedtuple("ImportCost", ["module", "cumulative_time"])
+
+CHILD_SCRIPT = textwrap.dedent(
+    """
+    import sys, time
+    from common.discovery import get_solution, load_solution_module
+    print({marker!r}, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    load_solution_module(get_solution({year}, {day}))
+    print(time.perf_counter() - start)
+    """
+)
+
+
+def measure_imports(solution):
+    """
+    Load the solution module in a fresh interpreter and measure the cost of its imports.
+    """
+    script = CHILD_SCRIPT.format(marker=START_MARKER, year=solution.year, day=solution.day)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=SOLUTIONS_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1]
+        return ImportReport(solution.year, solution.day, None, [], error)
+
+    load_time = float(completed.stdout.strip().splitlines()[-1])
+    solution_output = completed.stderr.split(START_MARKER, 1)[1]
+    return ImportReport(
+        solution.year, solution.day, load_time, parse_import_times(solution_output), None
+    )
+
+
+def parse_import_times(importtime_output):
+    """
+    Extract the modules imported directly, leaving out the modules they import in turn.
+
+    :param importtime_output: Standard error of a process run with "-X importtime"
+    :return: List of import costs, the most expensive first
+    """
+    imports = []
+
+    for line in importtime_output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if not match:
+            continue
+
+        _, cumulative_us, indentation, module = match.groups()
+        # Nested imports are indented by two spaces per level
+        if not indentation:
+            imports.append(ImportCost(module, int(cumulative_us) / 1e6))
+
+    return sorted(imports, key=lambda cost: cost.cumulative_time, reverse=True)
+
+
+def format_table(reports, top):
+    header = f"{'Year':<6}{'Day':>4}  {'Load (ms)':>10}  Most expensive imports"
+    lines = [header, "-" * len(header)]
+
+    for report in reports:
+        if report.error is not None:
+            lines.append(f"{report.year:<6}{report.day:>4}  {'':>10}  ERROR: {report.error}")
+            continue
+
+        imports = ", ".join(
+            f"{cost.module} ({cost.cumulative_time * 1000:.1f} ms)"
+            for cost in report.imports[:top]
+        )
+        lines.append(
+            f"{report.year:<6}{report.day:>4}  {report.load_time * 1000:>10.1f}  {imports}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        description="Report the import time of Advent of Code solutions."
+    )
+    parser.add_argument("--year", type=int, action="append", help="Only run this year")
+    parser.add_argument("--day", type=int, action="append", help="Only run this day")
+    parser.add_argument(
+        "--top", type=int, default=3, help="Number of imports to show per solution"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the reports as JSON"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    solutions = discover_solutions(years=args.year, days=args.day)
+    reports = [measure_imports(solution) for solution in solutions]
+    reports.sort(key=lambda report: report.load_time or 0, reverse=True)
+
+    if args.json:
+        print(json.dumps([report._asdict() for report in reports], indent=2))
+    else:
+        print(format_table(reports, args.top))
+
+
+class TestImportReport(unittest.TestCase):
+    def test_parse_import_times(self):
+        importtime_output = textwrap.dedent(
+            """
+            import time: self [us] | cumulative | imported package
+            import time:       120 |        120 |     _heapq
+            import time:       300 |        420 |   heapq
+            import time:      1000 |       1500 | textwrap
+            import time:        50 |       2000 | collections
+            """
+        )
+        self.assertEqual(
+            [ImportCost("collections", 0.002), ImportCost("textwrap", 0.0015)],
+            parse_import_times(importtime_output),
+        )
+
+    def test_measure_imports(self):
+        solution = discover_solutions(years={2024}, days={1})[0]
+        report = measure_imports(solution)
+        self.assertIsNone(report.error)
+        self.assertGreater(report.load_time, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Shared helpers for the synthetic input generators found in the day folders as "<day>_input_generator.py".
+
+Every generator provides a generate_input(scale, seed=0) function, which returns a GeneratedInput whose size is
+roughly the given multiple of the real input. The same scale and seed always produce the same input.
+
+Usage (from the "py" folder):
+    python -m common.input_generation --year 2024 --day 6 --scale 100 --output big_input.txt
+"""
+
+import argparse
+import math
+import sys
+from collections import namedtuple
+
+from common.discovery import (
+    PART_FUNCTION_NAMES,
+    get_solution,
+    load_input_generator,
+    load_solution_module,
+)
+
+# Answers are None unless the generator knows them cheaply by construction
+GeneratedInput = namedtuple(
+    "GeneratedInput", ["puzzle_input", "part_one", "part_two"], defaults=[None, None]
+)
+
+
+def get_scaled_count(real_count, scale):
+    """
+    Scale a one-dimensional quantity such as the number of lines.
+    """
+    return max(1, round(real_count * scale))
+
+
+def get_scaled_side(real_side, scale):
+    """
+    Scale the side of a square grid, so that the number of cells is scaled.
+    """
+    return max(1, round(real_side * math.sqrt(scale)))
+
+
+def check_known_answers(test_case, year, day, generated_input, **solver_kwargs):
+    """
+    Assert that the solution produces the answers known by the generator.
+    """
+    module = load_solution_module(get_solution(year, day))
+    known_answers = {1: generated_input.part_one, 2: generated_input.part_two}
+
+    for part, function_name in PART_FUNCTION_NAMES.items():
+        if known_answers[part] is not None:
+            solver = getattr(module, function_name)
+            test_case.assertEqual(
+                known_answers[part],
+                solver(generated_input.puzzle_input, **solver_kwargs),
+            )
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic puzzle input.")
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--day", type=int, required=True)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1,
+        help="Size relative to the real input",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Output file (defaults to standard output)")
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    generator = load_input_generator(get_solution(args.year, args.day))
+    if generator is None:
+        sys.exit(f"There is no input generator for {args.year} day {args.day}")
+
+    generated_input = generator.generate_input(args.scale, args.seed)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(generated_input.puzzle_input)
+    else:
+        print(generated_input.puzzle_input)
+
+    print(f"Part One: {generated_input.part_one}", file=sys.stderr)
+    print(f"Part Two: {generated_input.part_two}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
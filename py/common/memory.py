@@ -0,0 +1,125 @@
+"""
+Measure the peak memory of a function with tracemalloc, along with the allocation sites responsible for it.
+
+tracemalloc only reports the peak as a number, so a background thread takes a snapshot of the live allocations
+every time the traced memory grows noticeably past the previous snapshot. The allocation sites are taken from the
+snapshot closest to the peak.
+"""
+
+import sys
+import textwrap
+import threading
+import tracemalloc
+import unittest
+from collections import namedtuple
+from pathlib import Path
+
+DEFAULT_TOP_SITES = 5
+
+# Interval between two checks of the traced memory, in seconds
+POLL_INTERVAL = 0.005
+
+# A new snapshot is only taken if the traced memory grew by this factor since the last one, which bounds the
+# total cost of the snapshots to a small multiple of the cost of the largest one
+SNAPSHOT_GROWTH_FACTOR = 1.5
+
+MemoryReport = namedtuple("MemoryReport", ["peak", "top_sites"])
+
+# Source line with the total size and number of the blocks allocated by it
+AllocationSite = namedtuple("AllocationSite", ["location", "size", "count"])
+
+
+def measure_memory(function, *args, top=DEFAULT_TOP_SITES):
+    """
+    Call the function while tracing its allocations.
+
+    :return: Tuple of the result of the function and its memory report
+    """
+    watcher = PeakSnapshotWatcher()
+    # Let the watcher run more often than the default 5 ms between switches of the GIL
+    original_switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(POLL_INTERVAL / 5)
+    tracemalloc.start()
+    try:
+        watcher.start()
+        try:
+            result = function(*args)
+        finally:
+            watcher.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        top_sites = get_top_sites(watcher.snapshot, top) if watcher.snapshot else []
+    finally:
+        tracemalloc.stop()
+        sys.setswitchinterval(original_switch_interval)
+
+    return result, MemoryReport(peak, top_sites)
+
+
+class PeakSnapshotWatcher:
+    def __init__(self, poll_interval=POLL_INTERVAL):
+        self._poll_interval = poll_interval
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._snapshot_size = 0
+        self.snapshot = None
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._done.set()
+        self._thread.join()
+        # The last check catches functions too quick for the background thread
+        self._take_snapshot_if_grown()
+
+    def _watch(self):
+        while not self._done.wait(self._poll_interval):
+            self._take_snapshot_if_grown()
+
+    def _take_snapshot_if_grown(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self._snapshot_size * SNAPSHOT_GROWTH_FACTOR:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+
+def get_top_sites(snapshot, top):
+    # Filtering the statistics rather than the snapshot, as Snapshot.filter_traces is slow for large snapshots
+    excluded_files = {tracemalloc.__file__, threading.__file__, __file__}
+    statistics = [
+        statistic
+        for statistic in snapshot.statistics("lineno")
+        if statistic.traceback[0].filename not in excluded_files
+    ]
+    return [
+        AllocationSite(
+            f"{Path(statistic.traceback[0].filename).name}:{statistic.traceback[0].lineno}",
+            statistic.size,
+            statistic.count,
+        )
+        for statistic in statistics[:top]
+    ]
+
+
+def format_size(size):
+    return f"{size / 1024 / 1024:.1f} MiB" if size >= 1024 * 1024 else f"{size / 1024:.1f} KiB"
+
+
+def format_report(report):
+    lines = [f"Peak memory: {format_size(report.peak)}"]
+    lines.extend(
+        f"  {format_size(site.size):>12} in {site.count:>8} blocks  {site.location}"
+        for site in report.top_sites
+    )
+    return "\n".join(lines)
+
+
+class TestMemory(unittest.TestCase):
+    def test_measure_memory(self):
+        result, report = measure_memory(textwrap.wrap, "word " * 10000)
+
+        self.assertEqual(10000 // 14 + 1, len(result))
+        # Every word is at least one allocation of its own while wrapping
+        self.assertGreater(report.peak, 10000 * sys.getsizeof("word"))
+        self.assertTrue(report.top_sites[0].location.startswith("textwrap.py:"))
+        self.assertFalse(tracemalloc.is_tracing())
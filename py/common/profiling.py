@@ -0,0 +1,240 @@
+"""
+Entry point shared by the main() function of every solution, with an optional profiling mode.
+
+Without options, the parts are solved and printed one after another. With --profile, every part runs under a
+profiler, the hot functions are printed and a profile file is written per part:
+    --profile / --profile cprofile  cProfile statistics in "profile_part_<one|two>.prof" (see pstats or snakeviz)
+    --profile sampling              Collapsed stacks in "profile_part_<one|two>.folded" (see flamegraph.pl or speedscope)
+
+With --memory, the allocations of every part are traced instead, and its peak memory is printed with the allocation
+sites responsible for it. --memory-budget additionally fails if the peak memory of a part exceeds the given MiB.
+
+Usage (from the folder of a day):
+    PYTHONPATH=../.. python day_12_garden_groups.py --profile [sampling] [--profile-top 15] [--profile-dir out]
+    PYTHONPATH=../.. python day_12_garden_groups.py --memory [--memory-budget 100]
+"""
+
+import argparse
+import contextlib
+import cProfile
+import io
+import pstats
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from common.memory import format_report, format_size, measure_memory
+
+PART_NAMES = ["one", "two"]
+
+PROFILERS = ["cprofile", "sampling"]
+DEFAULT_PROFILE_TOP = 10
+
+# Interval between two samples of the sampling profiler, in seconds
+SAMPLING_INTERVAL = 0.001
+
+
+def run_parts(puzzle_input, *solvers, args=None):
+    """
+    Solve the parts of the puzzle one after another and print their results.
+
+    :param puzzle_input: The input data as string
+    :param solvers: Functions solving the parts, in order
+    :param args: Command line arguments, defaults to the ones of the process
+    """
+    options = parse_args(args)
+    trace_memory = options.memory or options.memory_budget is not None
+    over_budget = False
+
+    for part_name, solver in zip(PART_NAMES, solvers):
+        if options.profile is not None:
+            result = profile_part(part_name, solver, puzzle_input, options)
+        elif trace_memory:
+            result, memory_report = measure_memory(solver, puzzle_input)
+            print(format_report(memory_report), file=sys.stderr)
+            if (
+                    options.memory_budget is not None
+                    and memory_report.peak > options.memory_budget * 1024 * 1024
+            ):
+                print(
+                    f"Part {part_name} exceeds the memory budget of {options.memory_budget} MiB "
+                    f"with {format_size(memory_report.peak)}",
+                    file=sys.stderr,
+                )
+                over_budget = True
+        else:
+            result = solver(puzzle_input)
+        print(f"Part {part_name.capitalize()}: {result}")
+
+    if over_budget:
+        sys.exit(1)
+
+
+def profile_part(part_name, solver, puzzle_input, options):
+    output_directory = Path(options.profile_dir)
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    if options.profile == "sampling":
+        profiler = SamplingProfiler()
+        result = profiler.run(solver, puzzle_input)
+        output_path = output_directory / f"profile_part_{part_name}.folded"
+        profiler.write_collapsed_stacks(output_path)
+        print(profiler.format_top_functions(options.profile_top), file=sys.stderr)
+    else:
+        profiler = cProfile.Profile()
+        result = profiler.runcall(solver, puzzle_input)
+        output_path = output_directory / f"profile_part_{part_name}.prof"
+        profiler.dump_stats(output_path)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(options.profile_top)
+
+    print(f"Profile of part {part_name} written to {output_path}", file=sys.stderr)
+    return result
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of the profiled thread from a background thread at a fixed interval.
+
+    Unlike cProfile, the overhead doesn't depend on the number of function calls, and whole stacks are recorded,
+    which is what flame graphs need.
+    """
+
+    def __init__(self, interval=SAMPLING_INTERVAL):
+        self._interval = interval
+        self._stack_counts = Counter()
+
+    def run(self, function, *args):
+        target_thread_id = threading.get_ident()
+        # Frames from this one outwards belong to the caller of the profiler, so they are left out
+        run_frame = sys._getframe()
+        done = threading.Event()
+        sampler = threading.Thread(
+            target=self._sample, args=(target_thread_id, run_frame, done), daemon=True
+        )
+        # The sampler can only run when the profiled thread releases the GIL, which by default happens every 5 ms
+        original_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(self._interval)
+        sampler.start()
+        try:
+            return function(*args)
+        finally:
+            done.set()
+            sampler.join()
+            sys.setswitchinterval(original_switch_interval)
+
+    def write_collapsed_stacks(self, path):
+        # One line per distinct stack, outermost frame first: "frame;frame;frame count"
+        with open(path, "w") as f:
+            for stack, count in self._stack_counts.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+    def get_top_functions(self, top):
+        """
+        :return: List of (frame, samples on top of the stack, samples anywhere on the stack), most samples first
+        """
+        self_counts = Counter()
+        total_counts = Counter()
+        for stack, count in self._stack_counts.items():
+            self_counts[stack[-1]] += count
+            for frame in set(stack):
+                total_counts[frame] += count
+
+        return [
+            (frame, self_count, total_counts[frame])
+            for frame, self_count in self_counts.most_common(top)
+        ]
+
+    def format_top_functions(self, top):
+        num_samples = sum(self._stack_counts.values()) or 1
+        lines = [f"{'Self %':>7}{'Total %':>9}  Function"]
+        for frame, self_count, total_count in self.get_top_functions(top):
+            lines.append(
+                f"{self_count / num_samples:>7.1%}{total_count / num_samples:>9.1%}  {frame}"
+            )
+        return "\n".join(lines)
+
+    def _sample(self, target_thread_id, run_frame, done):
+        while not done.wait(self._interval):
+            frame = sys._current_frames().get(target_thread_id)
+            stack = []
+            while frame is not None and frame is not run_frame:
+                stack.append(self._get_frame_name(frame))
+                frame = frame.f_back
+
+            if stack:
+                self._stack_counts[tuple(reversed(stack))] += 1
+
+    @staticmethod
+    def _get_frame_name(frame):
+        code = frame.f_code
+        return f"{Path(code.co_filename).name}:{code.co_qualname}"
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="Solve the Advent of Code puzzle.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILERS,
+        help="Profile every part and write a profile file per part",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_PROFILE_TOP,
+        help="Number of hot functions to print per part",
+    )
+    parser.add_argument(
+        "--profile-dir", default=".", help="Folder to write the profile files to"
+    )
+    mode.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace the allocations of every part to report its peak memory",
+    )
+    mode.add_argument(
+        "--memory-budget",
+        type=float,
+        help="Fail if the peak memory of a part exceeds this many MiB (implies --memory)",
+    )
+    return parser.parse_args(args)
+
+
+def busy_wait(duration):
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        pass
+    return "done"
+
+
+class TestProfiling(unittest.TestCase):
+    def test_sampling_profiler(self):
+        profiler = SamplingProfiler()
+        self.assertEqual("done", profiler.run(busy_wait, 0.05))
+
+        top_functions = profiler.get_top_functions(1)
+        self.assertEqual("profiling.py:busy_wait", top_functions[0][0])
+
+    def test_run_parts(self):
+        with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(
+                io.StringIO()
+        ) as stdout, contextlib.redirect_stderr(io.StringIO()):
+            run_parts("abc", len, str.upper, args=["--profile", "--profile-dir", directory])
+            self.assertTrue((Path(directory) / "profile_part_two.prof").is_file())
+
+        self.assertEqual("Part One: 3\nPart Two: ABC\n", stdout.getvalue())
+
+    def test_run_parts_over_memory_budget(self):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(
+                io.StringIO()
+        ) as stderr, self.assertRaises(SystemExit):
+            run_parts("abc" * 100000, str.upper, args=["--memory-budget", "0.1"])
+
+        self.assertIn("exceeds the memory budget", stderr.getvalue())
@@ -0,0 +1,420 @@
+"""
+Run the discovered solutions in parallel and report their answers and timings.
+
+Usage (from the "py" folder):
+    python -m common.runner [--year 2024] [--day 6] [--workers 8] [--separate-parts] [--memory] [--json]
+                            [--no-cache | --clear-cache]
+
+Solutions defining solve_both(puzzle_input) have both parts solved by a single call, unless --separate-parts is
+given. The timings of such a call are reported for both parts and marked as combined.
+
+With --memory, the allocations of every part are traced to report its peak memory and the allocation sites
+responsible for it. Tracing slows the solutions down, so the timings are not comparable to untraced runs.
+
+Results are cached by the source of the solution and its input (see common.answer_cache), so only solutions that
+changed since the last run are solved again. Cached results are reported with the timings of the run that produced
+them. The cache is neither read nor updated when tracing memory.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import unittest
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from common.answer_cache import AnswerCache
+from common.discovery import (
+    BOTH_PARTS_FUNCTION_NAME,
+    PART_FUNCTION_NAMES,
+    Solution,
+    discover_solutions,
+    get_available_parts,
+    has_solve_both,
+    load_solution_module,
+    read_puzzle_input,
+    solution_working_directory,
+)
+from common.memory import MemoryReport, format_report, format_size, measure_memory
+
+PartResult = namedtuple(
+    "PartResult",
+    [
+        "year",
+        "day",
+        "part",
+        "answer",
+        "wall_time",
+        "cpu_time",
+        "error",
+        "combined",
+        "peak_memory",
+        "top_sites",
+        "cached",
+    ],
+    defaults=[False, None, None, False],
+)
+
+
+def run_part(solution, part, trace_memory=False):
+    """
+    Solve a single part of a solution, measuring its wall and CPU time, and optionally its memory.
+
+    Meant to be executed in a worker process, so everything returned is picklable.
+    Returns None if the solution does not have the given part.
+    """
+    try:
+        module = load_solution_module(solution)
+        if part not in get_available_parts(module):
+            return None
+        solver = getattr(module, PART_FUNCTION_NAMES[part])
+        puzzle_input = read_puzzle_input(solution)
+    except Exception as e:
+        return PartResult(solution.year, solution.day, part, None, 0.0, 0.0, repr(e))
+
+    answer, error, wall_time, cpu_time, memory_report = call_solver(
+        solution, solver, puzzle_input, trace_memory
+    )
+    return PartResult(
+        solution.year,
+        solution.day,
+        part,
+        str(answer) if error is None else None,
+        wall_time,
+        cpu_time,
+        error,
+        False,
+        *memory_report,
+    )
+
+
+def run_both_parts(solution, trace_memory=False):
+    """
+    Solve both parts of a solution with a single call of its solve_both function.
+
+    Meant to be executed in a worker process, same as run_part.
+    Returns a list with one result per part, both carrying the time of the whole call.
+    """
+    parts = list(PART_FUNCTION_NAMES)
+    try:
+        solver = getattr(load_solution_module(solution), BOTH_PARTS_FUNCTION_NAME)
+        puzzle_input = read_puzzle_input(solution)
+    except Exception as e:
+        return [
+            PartResult(solution.year, solution.day, part, None, 0.0, 0.0, repr(e), True)
+            for part in parts
+        ]
+
+    answers, error, wall_time, cpu_time, memory_report = call_solver(
+        solution, solver, puzzle_input, trace_memory
+    )
+    answers = [None] * len(parts) if error is not None else [str(answer) for answer in answers]
+
+    return [
+        PartResult(
+            solution.year,
+            solution.day,
+            part,
+            answer,
+            wall_time,
+            cpu_time,
+            error,
+            True,
+            *memory_report,
+        )
+        for part, answer in zip(parts, answers)
+    ]
+
+
+def call_solver(solution, solver, puzzle_input, trace_memory):
+    """
+    :return: Tuple of the answer, the error, the wall and CPU time, and the peak memory with its top allocation sites
+    """
+    answer = error = None
+    memory_report = (None, None)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        with solution_working_directory(solution):
+            if trace_memory:
+                answer, memory_report = measure_memory(solver, puzzle_input)
+            else:
+                answer = solver(puzzle_input)
+    except Exception as e:
+        error = repr(e)
+    wall_time = time.perf_counter() - wall_start
+    cpu_time = time.process_time() - cpu_start
+
+    return answer, error, wall_time, cpu_time, memory_report
+
+
+def run_all(
+        solutions, max_workers=None, separate_parts=False, trace_memory=False, cache=None
+):
+    """
+    :param cache: Optional answer cache, whose results are reused and which is updated with the new results
+    """
+    results = []
+
+    # Solution modules are only imported by the workers, so the parent process
+    # doesn't have to pay for their dependencies. No worker is started if every result is cached.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending_solutions = []
+        for solution in solutions:
+            try:
+                combined = not separate_parts and has_solve_both(solution)
+            except (OSError, SyntaxError):
+                # Solved part by part, so that the workers report the error of each part like for any other broken day
+                combined = False
+
+            cached_results = cache.get(solution, combined) if cache is not None else None
+            if cached_results is not None:
+                results.extend(
+                    PartResult(**{**result, "cached": True}) for result in cached_results
+                )
+                continue
+
+            if combined:
+                futures = [executor.submit(run_both_parts, solution, trace_memory)]
+            else:
+                futures = [
+                    executor.submit(run_part, solution, part, trace_memory)
+                    for part in PART_FUNCTION_NAMES
+                ]
+            pending_solutions.append((solution, combined, futures))
+
+        for solution, combined, futures in pending_solutions:
+            solution_results = []
+            for future in futures:
+                result = future.result()
+                if isinstance(result, list):
+                    solution_results.extend(result)
+                elif result is not None:
+                    solution_results.append(result)
+
+            results.extend(solution_results)
+            # Errors may be caused by the environment rather than the solution, so they are retried next time
+            if cache is not None and all(result.error is None for result in solution_results):
+                cache.put(solution, combined, [result._asdict() for result in solution_results])
+
+    if cache is not None:
+        cache.save()
+
+    return sorted(results, key=lambda result: (result.year, result.day, result.part))
+
+
+def format_table(results):
+    with_memory = any(result.peak_memory is not None for result in results)
+    memory_header = f"{'Peak':>12}" if with_memory else ""
+    header = f"{'Year':<6}{'Day':>4}{'Part':>6}  {'Wall (ms)':>11}{'CPU (ms)':>11}{memory_header}  Answer"
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        answer = result.answer if result.error is None else f"ERROR: {result.error}"
+        marker = "*" if result.combined else " "
+        memory = ""
+        if with_memory:
+            memory = f"{format_size(result.peak_memory) if result.peak_memory is not None else '':>12}"
+        cached = " (cached)" if result.cached else ""
+        lines.append(
+            f"{result.year:<6}{result.day:>4}{result.part:>6}  "
+            f"{result.wall_time * 1000:>11.1f}{result.cpu_time * 1000:>11.1f}{memory}{marker} {answer}{cached}"
+        )
+
+    if any(result.combined for result in results):
+        lines.append("\n* Both parts solved together, the time and memory are for both parts")
+    if any(result.cached for result in results):
+        lines.append("(cached) Not solved again, the time is from the run that cached the answer")
+
+    return "\n".join(lines)
+
+
+def format_memory_reports(results):
+    lines = []
+    for result in results:
+        if result.peak_memory is not None:
+            lines.append(f"\n{result.year} day {result.day} part {result.part}")
+            lines.append(format_report(MemoryReport(result.peak_memory, result.top_sites)))
+    return "\n".join(lines)
+
+
+def find_memory_budget_violations(results, memory_budget):
+    """
+    :param memory_budget: Maximum peak memory of a part in MiB
+    :return: List of human-readable violation descriptions
+    """
+    return [
+        f"{result.year} day {result.day} part {result.part}: peak memory "
+        f"{format_size(result.peak_memory)} exceeds budget of {memory_budget} MiB"
+        for result in results
+        if result.peak_memory is not None and result.peak_memory > memory_budget * 1024 * 1024
+    ]
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        description="Run Advent of Code solutions in parallel."
+    )
+    parser.add_argument("--year", type=int, action="append", help="Only run this year")
+    parser.add_argument("--day", type=int, action="append", help="Only run this day")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the number of cores)",
+    )
+    parser.add_argument(
+        "--separate-parts",
+        action="store_true",
+        help="Solve every part on its own, even if the solution can solve both parts at once",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace the allocations of every part to report its peak memory",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        help="Fail if the peak memory of a part exceeds this many MiB (implies --memory)",
+    )
+    cache_mode = parser.add_mutually_exclusive_group()
+    cache_mode.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Solve every selected part again, without reading or updating the answer cache",
+    )
+    cache_mode.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Remove the cached answers of the selected days before running",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the results as JSON"
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    solutions = discover_solutions(years=args.year, days=args.day)
+
+    trace_memory = args.memory or args.memory_budget is not None
+
+    # Memory isn't cached, so it has to be measured by solving the parts again
+    cache = None
+    if not args.no_cache and not trace_memory:
+        cache = AnswerCache()
+        if args.clear_cache:
+            cache.invalidate(solutions)
+
+    wall_start = time.perf_counter()
+    results = run_all(solutions, args.workers, args.separate_parts, trace_memory, cache)
+    total_wall_time = time.perf_counter() - wall_start
+
+    if args.json:
+        print(json.dumps([result._asdict() for result in results], indent=2))
+    else:
+        print(format_table(results))
+        print(f"\nTotal wall time: {total_wall_time:.2f} s")
+        if trace_memory:
+            print(format_memory_reports(results))
+
+    violations = []
+    if args.memory_budget is not None:
+        violations = find_memory_budget_violations(results, args.memory_budget)
+        for violation in violations:
+            print(f"OVER BUDGET {violation}")
+
+    if violations or any(result.error is not None for result in results):
+        sys.exit(1)
+
+
+class TestRunner(unittest.TestCase):
+    def test_run_part(self):
+        solution = discover_solutions(years={2024}, days={1})[0]
+        result = run_part(solution, 1)
+        self.assertIsNone(result.error)
+        self.assertEqual((2024, 1, 1), (result.year, result.day, result.part))
+        self.assertTrue(result.answer.isdigit())
+
+    def test_run_part_with_memory(self):
+        solution = discover_solutions(years={2024}, days={1})[0]
+        result = run_part(solution, 1, trace_memory=True)
+        self.assertIsNone(result.error)
+        self.assertGreater(result.peak_memory, 0)
+        self.assertTrue(result.top_sites)
+
+        self.assertEqual(1, len(find_memory_budget_violations([result], 0.001)))
+        self.assertEqual([], find_memory_budget_violations([result], 1024))
+
+    def test_run_missing_part(self):
+        solution = discover_solutions(years={2024}, days={25})[0]
+        self.assertIsNone(run_part(solution, 2))
+
+    def test_run_both_parts(self):
+        solution = discover_solutions(years={2024}, days={1})[0]
+        both_results = run_both_parts(solution)
+        self.assertEqual(
+            [run_part(solution, 1).answer, run_part(solution, 2).answer],
+            [result.answer for result in both_results],
+        )
+        self.assertTrue(all(result.combined for result in both_results))
+
+    def test_run_all(self):
+        solutions = discover_solutions(years={2024}, days={1, 25})
+        for separate_parts in (False, True):
+            results = run_all(solutions, max_workers=2, separate_parts=separate_parts)
+            self.assertEqual(
+                [(2024, 1, 1), (2024, 1, 2), (2024, 25, 1)],
+                [(r.year, r.day, r.part) for r in results],
+            )
+            self.assertEqual(not separate_parts, results[0].combined)
+
+    def test_run_all_with_cache(self):
+        solutions = discover_solutions(years={2024}, days={1, 25})
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnswerCache(Path(directory) / "cache.json")
+            results = run_all(solutions, max_workers=2, cache=cache)
+            cached_results = run_all(solutions, max_workers=2, cache=cache)
+
+        self.assertFalse(any(result.cached for result in results))
+        self.assertTrue(all(result.cached for result in cached_results))
+        self.assertEqual(
+            [result._replace(cached=True) for result in results], cached_results
+        )
+
+    def test_run_all_with_missing_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            day_directory = Path(directory) / "day_01_no_input"
+            day_directory.mkdir()
+            (day_directory / "day_01_no_input.py").write_text("def solve_part_one(puzzle_input):\n    return 0\n")
+            solution = Solution(1999, 1, "day_01_no_input", day_directory)
+            cache = AnswerCache(Path(directory) / "cache.json")
+            results = run_all([solution], max_workers=1, cache=cache)
+
+        self.assertEqual([(1999, 1, 1)], [(r.year, r.day, r.part) for r in results])
+        self.assertIn("FileNotFoundError", results[0].error)
+        self.assertFalse(results[0].cached)
+
+    def test_run_all_with_syntax_error(self):
+        with tempfile.TemporaryDirectory() as directory:
+            day_directory = Path(directory) / "day_01_unparsable"
+            day_directory.mkdir()
+            (day_directory / "input.txt").write_text("1")
+            (day_directory / "day_01_unparsable.py").write_text("def solve_both(puzzle_input)\n")
+            solution = Solution(1999, 1, "day_01_unparsable", day_directory)
+            cache = AnswerCache(Path(directory) / "cache.json")
+            results = run_all([solution, *discover_solutions(years={2024}, days={1})], max_workers=2, cache=cache)
+
+        self.assertEqual([1999, 1999, 2024, 2024], [result.year for result in results])
+        self.assertTrue(all("SyntaxError" in result.error for result in results[:2]))
+        self.assertTrue(all(result.error is None for result in results[2:]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Helpers for the line-oriented entry points of solutions whose records are independent of each other.
+
+Those solutions provide "solve_part_<one|two>_from_lines(lines)", which accepts any iterable of lines, e.g. an open
+file, and processes the records one by one. Memory then only depends on what the solution keeps, not on the size of
+the input. The string based "solve_part_<one|two>(puzzle_input)" functions are thin wrappers around them.
+
+Usage:
+    with open("input.txt") as f:
+        print(solve_part_one_from_lines(f))
+"""
+
+import io
+import unittest
+
+# Number of characters read at a time from file objects by iter_fields, so that a single huge line isn't read at once
+CHUNK_SIZE = 64 * 1024
+
+
+def iter_lines(source):
+    """
+    Iterate over the lines of a string, a file object or an iterable of lines, without their line endings.
+
+    Strings are read lazily as well, so that the string API doesn't build a list of all lines.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+
+    for line in source:
+        yield line.rstrip("\r\n")
+
+
+def iter_records(source):
+    """
+    Iterate over the non-empty lines, which is what line-per-record inputs consist of.
+    """
+    return (line for line in iter_lines(source) if line.strip())
+
+
+def iter_blocks(source):
+    """
+    Iterate over the blocks of lines separated by empty lines, each as a list of lines.
+    """
+    block = []
+    for line in iter_lines(source):
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+
+    if block:
+        yield block
+
+
+def iter_fields(source, separator=","):
+    """
+    Iterate over the non-empty fields separated by the separator or by line breaks, e.g. a comma separated list on a
+    single line.
+
+    File objects are read in chunks rather than by line, as such inputs often consist of one very long line. Every
+    element of other iterables is a line, so it ends a field even without a line ending.
+    """
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    if hasattr(source, "read"):
+        chunks = iter(lambda: source.read(CHUNK_SIZE), "")
+    else:
+        chunks = (line.rstrip("\r\n") + "\n" for line in source)
+
+    # The last field of a chunk might continue in the next one
+    remainder = ""
+    for chunk in chunks:
+        fields = (remainder + chunk).replace("\n", separator).split(separator)
+        remainder = fields.pop()
+        yield from (field.strip() for field in fields if field.strip())
+
+    if remainder.strip():
+        yield remainder.strip()
+
+
+class TestStreaming(unittest.TestCase):
+    def test_iter_lines(self):
+        self.assertEqual(["a", "", "b"], list(iter_lines("a\n\nb")))
+        self.assertEqual(["a", "b"], list(iter_lines(io.StringIO("a\r\nb\n"))))
+        self.assertEqual(["a", "b"], list(iter_lines(["a\n", "b"])))
+
+    def test_iter_records(self):
+        self.assertEqual(["a", "b"], list(iter_records("a\n\nb\n\n")))
+
+    def test_iter_fields(self):
+        self.assertEqual(["1-2", "3-4", "5"], list(iter_fields("1-2,3-4,\n5\n")))
+        self.assertEqual(["1", "2", "3", "4"], list(iter_fields(["1", "2,3", "4"])))
+        self.assertEqual(["1", "2", "3"], list(iter_fields(["1,\n", "2,3\n"])))
+
+    def test_iter_blocks(self):
+        self.assertEqual(
+            [["a", "b"], ["c"]], list(iter_blocks(io.StringIO("\na\nb\n\n\nc\n")))
+        )